@@ -1,3 +1,7 @@
+# the version of Ghengo; it must be increased whenever the generated code changes because it is part of cache keys
+GHENGO_VERSION = '0.2.0'
+
+
 class Languages:
     """
     Strings that represent all languages that this application supports.
@@ -13,6 +13,8 @@ class MeasureKeys:
     TILER_BEST_CONVERTER = '------- FIND_BEST_CONVERTER'
     TILER_STATEMENTS = '------- GET_STATEMENTS_'
     LEXER_PARSER = '--- LEXER + PARSER'
+    LEXER = '---- LEXER'
+    PARSER = '---- PARSER'
     EXTRACTOR = '----------- Extractor'
     CONVERTER_REFERENCES = '--------- CONVERTER__FIND_REFERENCES_'
     EVERYTHING = '------------------ EVERYTHING'
@@ -2,6 +2,8 @@
 import argparse
 import os
 import re
+from contextlib import contextmanager
+from contextvars import ContextVar
 
 from dotenv import load_dotenv
 
@@ -11,12 +13,47 @@ PYTHON_INDENT_SPACES = 4
 GHERKIN_INDENT_SPACES = 2
 
 
+_UNSET = object()
+
+
+class RuntimeValue(object):
+    """
+    A setting that changes during a compilation. Inside of `SettingsBase.runtime_context` the value is local to the
+    current context (a thread or an asyncio task). Outside of it, the value is shared by the whole process like any
+    other setting.
+    """
+    def __set_name__(self, owner, name):
+        self.name = name
+        self.context_var = ContextVar('settings_{}'.format(name), default=_UNSET)
+
+    def __get__(self, instance, owner):
+        if instance is None:
+            return self
+
+        value = self.context_var.get()
+        if value is _UNSET:
+            return instance.__dict__.get(self.name)
+        return value
+
+    def __set__(self, instance, value):
+        if self.context_var.get() is _UNSET:
+            instance.__dict__[self.name] = value
+        else:
+            self.context_var.set(value)
+
+
 class SettingsBase:
     """
     Settings that can/ will be changed during runtime and generation of code.
     """
     validate = True
 
+    # these are values that may change during generation, see `runtime_context`
+    RUNTIME_VALUES = ['language', 'django_project_wrapper', 'GENERATE_TEST_TYPE']
+    language = RuntimeValue()
+    django_project_wrapper = RuntimeValue()
+    GENERATE_TEST_TYPE = RuntimeValue()
+
     class Defaults:
         MEASURE_PERFORMANCE = False
         GENERATE_TEST_TYPE = GenerationType.PY_TEST
@@ -24,6 +61,13 @@ class SettingsBase:
         DJANGO_APPS_FOLDER = None
         TEST_EXPORT_DIRECTORY = 'generated_tests/'
         TEST_IMPORT_FILE = None
+        TEST_IMPORT_DIRECTORY = None
+        TEST_IMPORT_PATTERN = '**/*.feature'
+        PROCESSES = 1
+        FILE_THREADS = 1
+        SCENARIO_THREADS = 1
+        CACHE_TEST_CASES = False
+        WATCH = False
 
     def __init__(self):
         # these are values that may change curing generation
@@ -35,6 +79,13 @@ class SettingsBase:
         self.DJANGO_SETTINGS_PATH = None
         self.TEST_EXPORT_DIRECTORY = None
         self.TEST_IMPORT_FILE = None
+        self.TEST_IMPORT_DIRECTORY = None
+        self.TEST_IMPORT_PATTERN = None
+        self.PROCESSES = 1
+        self.FILE_THREADS = 1
+        self.SCENARIO_THREADS = 1
+        self.CACHE_TEST_CASES = False
+        self.WATCH = False
         self.MEASURE_PERFORMANCE = False
         self.DEEPL_API_KEY = None
         self.DEEPL_USE_FREE_API = True
@@ -66,6 +117,13 @@ class SettingsBase:
         self.TEST_EXPORT_DIRECTORY = self.Defaults.TEST_EXPORT_DIRECTORY
         self.DJANGO_APPS_FOLDER = self.Defaults.DJANGO_APPS_FOLDER
         self.TEST_IMPORT_FILE = self.Defaults.TEST_IMPORT_FILE
+        self.TEST_IMPORT_DIRECTORY = self.Defaults.TEST_IMPORT_DIRECTORY
+        self.TEST_IMPORT_PATTERN = self.Defaults.TEST_IMPORT_PATTERN
+        self.PROCESSES = self.Defaults.PROCESSES
+        self.FILE_THREADS = self.Defaults.FILE_THREADS
+        self.SCENARIO_THREADS = self.Defaults.SCENARIO_THREADS
+        self.CACHE_TEST_CASES = self.Defaults.CACHE_TEST_CASES
+        self.WATCH = self.Defaults.WATCH
         self.MEASURE_PERFORMANCE = self.Defaults.MEASURE_PERFORMANCE
 
     def _validate(self):
@@ -79,6 +137,29 @@ class SettingsBase:
     def reset(self):
         self._set_defaults()
 
+    @contextmanager
+    def runtime_context(self, **values):
+        """
+        While this context manager is active, the runtime values (see `RUNTIME_VALUES`) are local to the current
+        context. Changes to them are not visible to other threads and are discarded at the end. The values start
+        with the current ones unless they are passed as keyword arguments. This allows multiple compilations to run
+        at the same time in one process.
+
+        Other threads start with an empty context, so code that should use the values of the current context has
+        to be run via `contextvars.copy_context().run`.
+        """
+        tokens = []
+        for name in self.RUNTIME_VALUES:
+            runtime_value = getattr(self.__class__, name)
+            value = values[name] if name in values else getattr(self, name)
+            tokens.append((runtime_value, runtime_value.context_var.set(value)))
+
+        try:
+            yield self
+        finally:
+            for runtime_value, token in reversed(tokens):
+                runtime_value.context_var.reset(token)
+
     @staticmethod
     def _is_folder_path(string, absolute=False):
         """Check if a string is a valid path to a folder. Set absolute to check if the string should be absolute."""
@@ -127,12 +208,58 @@ class SettingsBase:
             type=str,
             help='The feature file that Ghengo will use as an import to generate tests. Like: features/foo.feature'
         )
+        parser.add_argument(
+            '--features-dir',
+            type=str,
+            help='A directory with feature files that Ghengo will all compile in one run. Like: features/'
+        )
+        parser.add_argument(
+            '--features-glob',
+            type=str,
+            help='The glob pattern that is used to find the feature files in --features-dir. Like: `**/*.feature`'
+        )
+        parser.add_argument(
+            '--processes',
+            type=int,
+            help='The number of processes that are used to compile the files in --features-dir. Like: 16'
+        )
+        parser.add_argument(
+            '--threads',
+            type=int,
+            help='The number of threads that compile the files in --features-dir if only one process is used. Like: 4'
+        )
+        parser.add_argument(
+            '--scenario-threads',
+            type=int,
+            help='The number of threads that generate the test cases of the scenarios in one feature file. Like: 4'
+        )
+        parser.add_argument(
+            '--cache-test-cases',
+            action='store_true',
+            help='Reuse the code of scenarios that did not change since the last run.'
+        )
+        parser.add_argument(
+            '--watch',
+            action='store_true',
+            help='Keep running and generate the tests again whenever a feature file or the Django project changes.'
+        )
         args, _ = parser.parse_known_args()
 
         django_app_folder = args.apps
         django_settings_path = args.settings
         export_directory = args.export_dir
         feature_file_path = args.feature
+        features_directory = args.features_dir
+        features_pattern = args.features_glob
+        processes = args.processes
+        file_threads = args.threads
+        scenario_threads = args.scenario_threads
+
+        if args.cache_test_cases:
+            self.CACHE_TEST_CASES = True
+
+        if args.watch:
+            self.WATCH = True
 
         if django_app_folder:
             if not self._is_folder_path(django_app_folder, absolute=True):
@@ -168,4 +295,33 @@ class SettingsBase:
 
             self.TEST_IMPORT_FILE = feature_file_path
 
+        if features_directory:
+            if not os.path.isdir(features_directory):
+                raise ValueError(
+                    'You must pass the path to an existing directory with feature files (you provided `{}`)'.format(
+                        features_directory)
+                )
+
+            self.TEST_IMPORT_DIRECTORY = features_directory
+
+        if features_pattern:
+            self.TEST_IMPORT_PATTERN = features_pattern
+
+        if processes is not None:
+            if processes < 1:
+                raise ValueError('You must use at least one process (you provided `{}`)'.format(processes))
+
+            self.PROCESSES = processes
+
+        if file_threads is not None:
+            if file_threads < 1:
+                raise ValueError('You must use at least one thread (you provided `{}`)'.format(file_threads))
+
+            self.FILE_THREADS = file_threads
+
+        if scenario_threads is not None:
+            if scenario_threads < 1:
+                raise ValueError(
+                    'You must use at least one thread per feature (you provided `{}`)'.format(scenario_threads))
 
+            self.SCENARIO_THREADS = scenario_threads
@@ -0,0 +1,42 @@
+import threading
+
+from core.constants import Languages
+from settings import Settings
+
+
+def test_settings_runtime_context():
+    """Check that runtime values are local to a runtime context and shared by the process outside of it."""
+    Settings.language = Languages.EN
+
+    with Settings.runtime_context():
+        assert Settings.language == Languages.EN
+        Settings.language = Languages.DE
+        assert Settings.language == Languages.DE
+
+        with Settings.runtime_context(language='fr'):
+            assert Settings.language == 'fr'
+
+        assert Settings.language == Languages.DE
+
+    assert Settings.language == Languages.EN
+
+
+def test_settings_runtime_context_in_threads():
+    """Check that threads with their own runtime context do not see the values of each other."""
+    barrier = threading.Barrier(2)
+    languages = {}
+
+    def compile_in_language(language):
+        with Settings.runtime_context():
+            Settings.language = language
+            barrier.wait()
+            languages[language] = Settings.language
+
+    threads = [threading.Thread(target=compile_in_language, args=[l]) for l in [Languages.DE, 'fr']]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert languages == {Languages.DE: Languages.DE, 'fr': 'fr'}
+    assert Settings.language == Languages.EN
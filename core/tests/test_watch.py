@@ -0,0 +1,29 @@
+import os
+
+from core.watch import FileWatcher
+
+
+def test_file_watcher_poll(tmp_path):
+    """Check that the watcher detects added, changed and removed files."""
+    path_1 = tmp_path / 'a.feature'
+    path_2 = tmp_path / 'b.feature'
+    path_1.write_text('a')
+    watcher = FileWatcher(lambda: [str(p) for p in tmp_path.iterdir()])
+    assert watcher.poll() == set()
+
+    path_2.write_text('b')
+    assert watcher.poll() == {str(path_2)}
+
+    modified_at = os.stat(str(path_1)).st_mtime_ns + 10 ** 9
+    os.utime(str(path_1), ns=(modified_at, modified_at))
+    os.remove(str(path_2))
+    assert watcher.poll() == {str(path_1), str(path_2)}
+    assert watcher.poll() == set()
+
+
+def test_file_watcher_wait_for_changes(tmp_path):
+    """Check that the watcher returns all changes after the debounce time."""
+    path = tmp_path / 'a.feature'
+    watcher = FileWatcher(lambda: [str(p) for p in tmp_path.iterdir()], interval=0.01, debounce=0.02)
+    path.write_text('a')
+    assert watcher.wait_for_changes() == {str(path)}
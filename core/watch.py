@@ -0,0 +1,60 @@
+import os
+import time
+
+
+class FileWatcher(object):
+    """
+    Watches files for changes by polling their modification time. The paths are collected again on every poll, so
+    new files are found as well.
+
+    Arguments:
+        get_paths (callable): returns all paths that should be watched
+        interval (float): seconds between two polls
+        debounce (float): seconds without any change that must pass before changes are returned; this way a burst
+            of saves results in only one change
+    """
+    def __init__(self, get_paths, interval=0.25, debounce=0.3):
+        self.get_paths = get_paths
+        self.interval = interval
+        self.debounce = debounce
+        self._modified_times = self._get_modified_times()
+
+    def _get_modified_times(self):
+        modified_times = {}
+
+        for path in self.get_paths():
+            try:
+                modified_times[path] = os.stat(path).st_mtime_ns
+            except FileNotFoundError:
+                continue
+
+        return modified_times
+
+    def poll(self):
+        """Returns all paths that were added, changed or removed since the last poll."""
+        modified_times = self._get_modified_times()
+        changed_paths = {
+            path for path in set(modified_times) | set(self._modified_times)
+            if modified_times.get(path) != self._modified_times.get(path)
+        }
+        self._modified_times = modified_times
+        return changed_paths
+
+    def wait_for_changes(self):
+        """
+        Blocks until there are changes. After the first change is detected, it waits until no file changed for the
+        time of `debounce`. Returns the paths of all changed files.
+        """
+        changed_paths = set()
+        last_change = None
+
+        while True:
+            new_changes = self.poll()
+
+            if new_changes:
+                changed_paths |= new_changes
+                last_change = time.time()
+            elif changed_paths and time.time() - last_change >= self.debounce:
+                return changed_paths
+
+            time.sleep(self.interval)
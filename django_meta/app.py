@@ -1,4 +1,5 @@
 from django_meta.model import ExistingModelWrapper
+from django_meta.source import get_python_files
 
 
 class AppWrapper(object):
@@ -17,6 +18,11 @@ class AppWrapper(object):
 
         return [wrapper.model for wrapper in self._models]
 
+    @property
+    def source_files(self):
+        """Returns the paths to all Python files of the app. Migrations are ignored."""
+        return get_python_files(self.app.path)
+
     @property
     def defined_by_project(self):
         return self.project.settings.BASE_DIR in self.app.path
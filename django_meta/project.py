@@ -1,10 +1,15 @@
+import hashlib
 import importlib
+import os
+import sys
+import warnings
 
 from django.apps import apps
-from django.urls import URLPattern, URLResolver, get_resolver
+from django.urls import URLPattern, URLResolver, get_resolver, clear_url_caches
 
 from django_meta.app import AppWrapper
 from django_meta.setup import setup_django
+from django_meta.source import SourceFile
 
 
 class DjangoProject(object):
@@ -13,6 +18,8 @@ class DjangoProject(object):
         DJANGO = 'django'
         FROM_APP = 'from_app'
 
+    _instances = {}
+
     def __init__(self, settings_path):
         # django needs to know where the settings are, so set it in the env and setup django afterwards
         success = setup_django(settings_path)
@@ -31,6 +38,26 @@ class DjangoProject(object):
             self.RegisterKeys.FROM_APP: [],
         }
 
+        # the source files of each project app (by label) and of the url confs; used to detect changes
+        self._app_source_files = {}
+        self._url_source_files = {}
+
+    @classmethod
+    def get_instance(cls, settings_path):
+        """
+        Returns a project for the given settings path. The project is only introspected once per process. Every
+        following call only re-introspects the apps whose source files have changed in the meantime.
+        """
+        project = cls._instances.get(settings_path)
+
+        if project is None:
+            project = cls(settings_path)
+            cls._instances[settings_path] = project
+        else:
+            project.refresh()
+
+        return project
+
     def get_reverse_keys(self):
         """Returns all keys that are used in the project that can be used via reverse"""
         return get_resolver().reverse_dict.keys()
@@ -66,9 +93,120 @@ class DjangoProject(object):
             # add project apps if wanted
             if app_wrapper.defined_by_project:
                 self._cache_app(app_wrapper)
+                self._track_app_source_files(app_wrapper)
 
         self._apps_cached = True
 
+    def _track_app_source_files(self, app_wrapper):
+        """Remember the current state of all source files of an app."""
+        self._app_source_files[app_wrapper.app.label] = {
+            path: SourceFile(path) for path in app_wrapper.source_files
+        }
+
+    def _app_has_changed(self, app_wrapper):
+        """Checks if any source file of the app was changed, added or removed since it was introspected."""
+        source_files = self._app_source_files.get(app_wrapper.app.label, {})
+
+        if set(source_files.keys()) != set(app_wrapper.source_files):
+            return True
+
+        return any(source_file.has_changed() for source_file in source_files.values())
+
+    def _reload_app_modules(self, app_wrapper):
+        """
+        Reloads all modules of an app that are already imported. Models are registered in Django's app registry and
+        cannot be reloaded safely, so a warning is shown if they have changed.
+        """
+        app_path = os.path.join(app_wrapper.app.path, '')
+        source_files = self._app_source_files.get(app_wrapper.app.label, {})
+        models_module = getattr(app_wrapper.app.models_module, '__name__', None)
+
+        app_modules = [
+            module for module in list(sys.modules.values())
+            if getattr(module, '__file__', None) and module.__file__.startswith(app_path)
+        ]
+
+        # modules that were imported later depend on the earlier ones, reload them in reversed order
+        for module in reversed(app_modules):
+            if models_module and module.__name__.startswith(models_module):
+                source_file = source_files.get(module.__file__)
+
+                if source_file is not None and source_file.has_changed():
+                    warnings.warn(
+                        'The models of {} have changed. Please restart Ghengo to use the new models.'.format(
+                            app_wrapper.app.label)
+                    )
+                continue
+
+            try:
+                importlib.reload(module)
+            except Exception as e:
+                warnings.warn('{} could not be reloaded: {}'.format(module.__name__, e))
+
+    def refresh(self):
+        """
+        Re-introspects every app of the project whose source files have changed since the last introspection. The
+        urls are collected again if any app or url conf has changed. Returns the labels of the changed apps.
+        """
+        if self.settings is None or self._apps_cached is False:
+            return []
+
+        changed_apps = []
+        project_apps = self._app_dict[self.RegisterKeys.FROM_APP]
+
+        for index, app_wrapper in enumerate(project_apps):
+            if not self._app_has_changed(app_wrapper):
+                continue
+
+            self._reload_app_modules(app_wrapper)
+
+            new_app_wrapper = AppWrapper(app_wrapper.app, self)
+            project_apps[index] = new_app_wrapper
+            self._track_app_source_files(new_app_wrapper)
+            changed_apps.append(app_wrapper.app.label)
+
+        urls_changed = any(source_file.has_changed() for source_file in self._url_source_files.values())
+        if changed_apps or urls_changed:
+            self._reload_url_confs()
+
+        return changed_apps
+
+    def get_source_paths(self):
+        """
+        Returns the paths of all source files of the project that are introspected (apps and url confs). The files of
+        the apps are searched again, so files that were added since the last introspection are returned too.
+        """
+        self.get_apps()
+        self.urls
+
+        paths = set(self._url_source_files.keys())
+        for app_source_files in self._app_source_files.values():
+            paths.update(app_source_files.keys())
+
+        for app_wrapper in self._app_dict[self.RegisterKeys.FROM_APP]:
+            paths.update(app_wrapper.source_files)
+
+        return sorted(paths)
+
+    def get_snapshot_hash(self):
+        """
+        Returns a hash that represents the current state of the introspected source files of the project. It changes
+        whenever an app or an url conf of the project changes.
+        """
+        # make sure that everything is introspected
+        self.get_apps()
+        self.urls
+
+        source_hash = hashlib.sha1()
+        source_files = dict(self._url_source_files)
+        for app_source_files in self._app_source_files.values():
+            source_files.update(app_source_files)
+
+        for path in sorted(source_files.keys()):
+            source_hash.update('{}:{};'.format(path, source_files[path].content_hash).encode())
+
+        return source_hash.hexdigest()
+
     @property
     def urls(self):
         if self._urls is None:
@@ -76,8 +214,47 @@ class DjangoProject(object):
                 self._urls = []
             else:
                 self._urls = self._list_urls(as_pattern=True)
+                self._track_url_source_files()
         return self._urls
 
+    def _get_url_conf_modules(self, url_patterns=None, modules=None):
+        """Returns the root url conf module and all modules that are included by it."""
+        if modules is None:
+            root_module = importlib.import_module(self.settings.ROOT_URLCONF)
+            modules = [root_module]
+            url_patterns = getattr(root_module, 'urlpatterns', [])
+
+        for url_entry in url_patterns or []:
+            if not isinstance(url_entry, URLResolver):
+                continue
+
+            module = url_entry.urlconf_module
+            if hasattr(module, '__file__') and module not in modules:
+                modules.append(module)
+
+            self._get_url_conf_modules(url_entry.url_patterns, modules)
+
+        return modules
+
+    def _track_url_source_files(self):
+        """Remember the current state of the url confs."""
+        self._url_source_files = {
+            module.__file__: SourceFile(module.__file__)
+            for module in self._get_url_conf_modules() if getattr(module, '__file__', None)
+        }
+
+    def _reload_url_confs(self):
+        """Reloads the url confs so that the urls are collected again on the next access."""
+        # included url confs are reloaded first since the root url conf depends on them
+        for module in reversed(self._get_url_conf_modules()):
+            try:
+                importlib.reload(module)
+            except Exception as e:
+                warnings.warn('{} could not be reloaded: {}'.format(module.__name__, e))
+
+        clear_url_caches()
+        self._urls = None
+
     def _list_urls(self, url_pattern=None, url_list=None, as_pattern=False):
         """
         Returns all urls that are available in the project.
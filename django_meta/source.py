@@ -0,0 +1,75 @@
+import hashlib
+import os
+
+
+class SourceFile(object):
+    """
+    Represents a Python file of a Django project. It remembers the state of the file when it was introspected
+    so that it can be checked later on if the file has changed since then.
+    """
+    def __init__(self, path):
+        self.path = path
+        self.modified_at = None
+        self.size = None
+        self.content_hash = None
+        self.update()
+
+    @classmethod
+    def hash_content(cls, path):
+        """Returns a hash of the content of the file at the given path. If the file does not exist, None is returned."""
+        try:
+            with open(path, 'rb') as file:
+                return hashlib.sha1(file.read()).hexdigest()
+        except FileNotFoundError:
+            return None
+
+    def update(self):
+        """Saves the current state of the file."""
+        try:
+            stat = os.stat(self.path)
+        except FileNotFoundError:
+            self.modified_at = None
+            self.size = None
+            self.content_hash = None
+            return
+
+        self.modified_at = stat.st_mtime_ns
+        self.size = stat.st_size
+        self.content_hash = self.hash_content(self.path)
+
+    def has_changed(self):
+        """
+        Checks if the file has changed since the last update. The modification time and the size are checked first
+        because they are cheap. Only if one of them differs, the content is hashed.
+        """
+        try:
+            stat = os.stat(self.path)
+        except FileNotFoundError:
+            return self.content_hash is not None
+
+        if stat.st_mtime_ns == self.modified_at and stat.st_size == self.size:
+            return False
+
+        content_hash = self.hash_content(self.path)
+
+        # the file was touched but the content is the same, so remember the new stats to avoid hashing again
+        if content_hash == self.content_hash:
+            self.modified_at = stat.st_mtime_ns
+            self.size = stat.st_size
+            return False
+
+        return True
+
+
+def get_python_files(directory, exclude_dirs=('migrations', '__pycache__')):
+    """Returns the paths of all Python files in the given directory and its sub directories."""
+    paths = []
+
+    for root, dirs, files in os.walk(directory):
+        dirs[:] = sorted(d for d in dirs if d not in exclude_dirs)
+
+        for file_name in sorted(files):
+            if file_name.endswith('.py'):
+                paths.append(os.path.join(root, file_name))
+
+    return paths
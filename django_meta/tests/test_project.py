@@ -0,0 +1,97 @@
+import os
+
+from pytest_mock import MockerFixture
+
+from django_meta.project import DjangoProject
+from django_meta.source import SourceFile, get_python_files
+
+SETTINGS_PATH = 'django_sample_project.apps.config.settings'
+
+
+def test_source_file_has_changed(tmp_path):
+    """Check if a source file detects changes of its content."""
+    path = tmp_path / 'models.py'
+    path.write_text('a = 1')
+    source_file = SourceFile(str(path))
+    assert source_file.has_changed() is False
+
+    path.write_text('a = 2')
+    assert source_file.has_changed() is True
+
+    source_file.update()
+    assert source_file.has_changed() is False
+
+
+def test_source_file_touched(tmp_path):
+    """Check that only touching a file does not count as a change."""
+    path = tmp_path / 'models.py'
+    path.write_text('a = 1')
+    source_file = SourceFile(str(path))
+    os.utime(str(path), ns=(source_file.modified_at + 10 ** 9, source_file.modified_at + 10 ** 9))
+    assert source_file.has_changed() is False
+
+
+def test_source_file_removed(tmp_path):
+    """Check that a removed file is detected as a change."""
+    path = tmp_path / 'models.py'
+    path.write_text('a = 1')
+    source_file = SourceFile(str(path))
+    os.remove(str(path))
+    assert source_file.has_changed() is True
+
+
+def test_get_python_files(tmp_path):
+    """Check that only python files outside of migrations are returned."""
+    (tmp_path / 'migrations').mkdir()
+    (tmp_path / 'migrations' / '0001_initial.py').write_text('')
+    (tmp_path / 'models.py').write_text('')
+    (tmp_path / 'README.md').write_text('')
+    assert get_python_files(str(tmp_path)) == [str(tmp_path / 'models.py')]
+
+
+def test_project_get_instance():
+    """Check that the project is only created once per settings path."""
+    assert DjangoProject.get_instance(SETTINGS_PATH) is DjangoProject.get_instance(SETTINGS_PATH)
+
+
+def test_project_refresh_without_changes():
+    """Check that nothing is re-introspected if no file has changed."""
+    project = DjangoProject(SETTINGS_PATH)
+    app_wrappers = project.get_apps(as_wrapper=True)
+    snapshot_hash = project.get_snapshot_hash()
+
+    assert project.refresh() == []
+    assert project.get_apps(as_wrapper=True) == app_wrappers
+    assert project.get_snapshot_hash() == snapshot_hash
+
+
+def test_project_refresh_changed_app(mocker: MockerFixture):
+    """Check that only the changed app is re-introspected and that its models are wrapped again."""
+    project = DjangoProject(SETTINGS_PATH)
+    order_app = project.get_apps(as_wrapper=True)[0]
+    old_order_models = order_app.get_models(as_wrapper=True)
+    mocker.patch.object(project, '_reload_app_modules')
+    mocker.patch.object(project, '_reload_url_confs')
+
+    source_file = list(project._app_source_files['order'].values())[0]
+    mocker.patch.object(source_file, 'has_changed', return_value=True)
+
+    assert project.refresh() == ['order']
+    assert project.get_apps(as_wrapper=True)[0] != order_app
+    project._reload_app_modules.assert_called_once_with(order_app)
+    project._reload_url_confs.assert_called_once()
+
+    new_order_models = project.get_apps(as_wrapper=True)[0].get_models(as_wrapper=True)
+    assert [model.name for model in new_order_models] == [model.name for model in old_order_models]
+    assert all(model.app == project.get_apps(as_wrapper=True)[0] for model in new_order_models)
+
+
+def test_project_get_source_paths_new_file(mocker: MockerFixture):
+    """Check that files that are added to an app after the introspection are returned as source paths."""
+    project = DjangoProject(SETTINGS_PATH)
+    order_app = project.get_apps(as_wrapper=True)[0]
+    new_path = os.path.join(order_app.app.path, 'new_module.py')
+    mocker.patch('django_meta.app.get_python_files', return_value=order_app.source_files + [new_path])
+
+    assert new_path in project.get_source_paths()
+    assert new_path not in project._app_source_files['order']
@@ -276,6 +276,10 @@ class DataTable(StepArgument):
 
         return output
 
+    def get_column_values(self, index):
+        """Returns all the values of the column at the given index (without the header)."""
+        return [row.get_value_at(index) for row in self.rows]
+
     def get_values(self):
         """Returns all the values in the format: {<column_name_1>: [str], ...}"""
         output = {}
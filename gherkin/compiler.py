@@ -1,17 +1,27 @@
+import json
+from concurrent.futures import ThreadPoolExecutor
+from contextvars import copy_context
+
 from core.constants import Languages
 from core.performance import AveragePerformanceMeasurement, \
     MeasureKeys, StepLevelPerformanceMeasurement, measure, \
     before_step_measure, after_scenario_done
 from django_meta.project import DjangoProject
 from gherkin.grammar import GherkinGrammar
+from nlp.generate.cache import TestCaseCache
+from nlp.generate.context import GenerationContext
 from nlp.generate.pytest.decorator import PyTestMarkDecorator, PyTestParametrizeDecorator
 from nlp.generate.pytest.suite import PyTestTestSuite
+from nlp.generate.snapshot import StatementSnapshot
+from nlp.generate.suite import CachedTestCase
+from nlp.setup import Nlp
 from nlp.translator import CacheTranslator
 from core.constants import GenerationType
+from nlp.extractor.output import get_column_output
 from nlp.generate.utils import to_function_name
 from gherkin.compiler_base.compiler import Lexer, Compiler, Parser, CodeGenerator
 
-from gherkin.ast import Comment as ASTComment, ScenarioOutline, Then, When, Given
+from gherkin.ast import Comment as ASTComment, ScenarioOutline, Then, When, Given, DocString
 from gherkin.compiler_base.exception import NonTerminalInvalid, NonTerminalNotUsed
 from gherkin.compiler_base.line import Line
 from gherkin.exception import GherkinInvalid
@@ -51,6 +61,21 @@ class GherkinLexer(Lexer):
         # in case this tokenizing is done multiple times, reset the value before starting again
         Settings.language = Languages.EN
 
+    def on_start_retokenize(self, line_index):
+        # the language is defined in the first line, so it must be tokenized with the whole document
+        if line_index == 0 or not super().on_start_retokenize(line_index):
+            return False
+
+        for token in self.tokens_by_line[0]:
+            if isinstance(token, LanguageToken):
+                Settings.language = token.locale
+
+        return True
+
+    def get_token_matcher_key(self):
+        # the keywords of the tokens depend on the language
+        return Settings.language
+
     def on_token_added(self, token):
         # the first line may contain the language, so if it is found, set it
         if isinstance(token, LanguageToken):
@@ -125,12 +150,12 @@ class GherkinToPyTestCodeGenerator(CodeGenerator):
 
         self._suite = None
 
-    def get_test_case_name(self, scenario):
-        """Returns the name for the test case of the scenario."""
+    def get_test_case_name(self, scenario, index, context):
+        """Returns the name for the test case of the scenario. Scenarios without a name use their index instead."""
         if not scenario.name:
-            return str(len(self._suite.test_cases))
+            return str(index)
 
-        translator = CacheTranslator(src_language=Settings.language, target_language=Languages.EN)
+        translator = CacheTranslator(src_language=context.language, target_language=Languages.EN)
         return translator.translate(scenario.name.lstrip())
 
     @measure(
@@ -140,7 +165,7 @@ class GherkinToPyTestCodeGenerator(CodeGenerator):
         export_to=AveragePerformanceMeasurement,
         before_measure=before_step_measure,
     )
-    def step_to_statements(self, project, test_case, step):
+    def step_to_statements(self, context, test_case, step):
         """Transforms each step into statements."""
         # the parent step will always be given, when or then; if and or but are used, the parent is returned
         parent_step = step.get_parent_step()
@@ -148,20 +173,19 @@ class GherkinToPyTestCodeGenerator(CodeGenerator):
         tiler_cls = self.STEP_TO_TILER[parent_step.__class__]
         tiler_instance = tiler_cls(
             ast_object=step,
-            django_project=project,
-            language=Settings.language,
+            django_project=context.django_project,
+            language=context.language,
             test_case=test_case,
         )
         tiler_instance.add_statements_to_test_case()
 
     @measure(by=AveragePerformanceMeasurement, key=MeasureKeys.SCENARIO, after_measure=after_scenario_done)
-    def scenario_to_test_case(self, scenario, project):
+    def scenario_to_test_case(self, scenario, index, suite, context):
         """
-        Does everything to transform a scenario object into a test case object.
+        Does everything to transform a scenario object into a test case object. The test case is added to the
+        given suite.
         """
-        suite = self._suite
-
-        test_case_name = self.get_test_case_name(scenario)
+        test_case_name = self.get_test_case_name(scenario, index, context)
         test_case = suite.create_and_add_test_case(test_case_name)
 
         # handle tags
@@ -176,18 +200,145 @@ class GherkinToPyTestCodeGenerator(CodeGenerator):
             for example in scenario.examples:
                 decorator = PyTestParametrizeDecorator(
                     example.datatable.header.get_values(),
-                    example.datatable.get_values_as_list(),
+                    self.get_example_values(example),
                 )
                 try:
                     test_case.add_decorator(decorator)
                 except test_case.DecoratorAlreadyPresent:
                     pass
 
-        for step in scenario.steps:
-            self.step_to_statements(project=project, step=step, test_case=test_case)
+        # the steps of backgrounds come first, they are the same for every scenario of a feature or rule
+        background_steps = self.get_background_steps(scenario)
+        self.background_steps_to_statements(context=context, steps=background_steps, test_case=test_case)
+
+        for step in scenario.steps[len(background_steps):]:
+            self.step_to_statements(context=context, step=step, test_case=test_case)
 
         return test_case
 
+    @classmethod
+    def get_background_steps(cls, scenario):
+        """Returns the steps of a scenario that come from a background (see `ScenarioDefinition.steps`)."""
+        return getattr(scenario.parent, 'steps', None) or []
+
+    def background_steps_to_statements(self, context, steps, test_case):
+        """
+        Transforms the steps of a background into statements. The steps are only run through the tilers for the
+        first scenario of a background. For all other scenarios, copies of the resulting statements are added.
+        """
+        if not steps:
+            return
+
+        parameter_names = [parameter.name for parameter in test_case.parameters]
+        key = (tuple(id(step) for step in steps), tuple(parameter_names))
+
+        # other scenarios with the same background wait until the snapshot is created
+        with context.get_background_lock(key):
+            snapshot = context.get_background_snapshot(key)
+
+            if snapshot is None:
+                recording = test_case.test_suite.start_recording()
+                for step in steps:
+                    self.step_to_statements(context=context, step=step, test_case=test_case)
+                test_case.test_suite.stop_recording(recording)
+
+                context.set_background_snapshot(key, StatementSnapshot(
+                    test_case=test_case,
+                    parameter_names=parameter_names,
+                    warnings=recording['warnings'],
+                ))
+                return
+
+        snapshot.add_to_test_case(test_case)
+
+    def get_example_values(self, example):
+        """
+        Returns the values of the data table of an example as a list of tuples (one per row). Each column is
+        converted to integers, decimals or booleans if all of its values fit the type.
+        """
+        datatable = example.datatable
+        columns = [
+            get_column_output(datatable.get_column_values(index))
+            for index in range(len(datatable.get_column_names()))
+        ]
+        return list(zip(*columns))
+
+    def get_scenario_text(self, scenario, index, context):
+        """
+        Returns a normalized text of a scenario that contains everything that has an influence on the generated
+        test case: the name of the test case, tags, steps (including the ones from backgrounds) and examples.
+        """
+        lines = [
+            scenario.__class__.__name__,
+            self.get_test_case_name(scenario, index, context),
+            ' '.join(tag.name for tag in scenario.tags),
+        ]
+
+        for step in scenario.steps:
+            lines.append('{} {}{}'.format(step.get_parent_step().__class__.__name__, step.keyword, step.text))
+
+            if step.has_datatable:
+                lines.append(json.dumps([step.argument.header.get_values()] + step.argument.get_values_as_list()))
+            elif isinstance(step.argument, DocString):
+                lines.append(json.dumps(step.argument.text))
+
+        for example in getattr(scenario, 'examples', []):
+            lines.append(json.dumps([example.datatable.header.get_values()] + example.datatable.get_values_as_list()))
+
+        return '\n'.join(lines)
+
+    def generate_scenario(self, scenario, index, context):
+        """
+        Generates the test case for a scenario without touching the suite of this generator. The test case is
+        created in a separate suite that records everything the test case adds to it (imports and warnings).
+
+        Returns a tuple with the test case, the recording and the key in the test case cache. If the code of the
+        scenario is cached, the cached test case is returned and the recording and the key are None.
+        """
+        key = None
+        test_case_cache = context.test_case_cache
+
+        # the code of unchanged scenarios can be reused from a previous run
+        if test_case_cache is not None:
+            key = test_case_cache.get_key(
+                self.get_scenario_text(scenario, index, context),
+                context.language,
+                context.project_hash,
+                context.test_type,
+            )
+            cached_test_case = test_case_cache.get(key)
+
+            if cached_test_case is not None:
+                return cached_test_case, None, None
+
+        suite = PyTestTestSuite(self._suite.name)
+        recording = suite.start_recording()
+        test_case = self.scenario_to_test_case(scenario, index, suite, context)
+        return test_case, suite.stop_recording(recording), key
+
+    def generate_scenarios(self, scenarios, context):
+        """
+        Generates the test cases for all scenarios and returns the results of `generate_scenario` in the order of
+        the scenarios. The scenarios are independent of each other, so they are generated by multiple threads if
+        `Settings.SCENARIO_THREADS` allows it. The performance is measured per scenario, so the scenarios are
+        generated one after another while measuring.
+        """
+        indexed_scenarios = list(enumerate(scenarios))
+
+        if Settings.SCENARIO_THREADS <= 1 or len(indexed_scenarios) <= 1 or Settings.MEASURE_PERFORMANCE:
+            return [self.generate_scenario(scenario, index, context) for index, scenario in indexed_scenarios]
+
+        # the threads use a copy of the current context to see the same runtime values of the settings
+        contexts = [copy_context() for _ in indexed_scenarios]
+
+        with ThreadPoolExecutor(max_workers=Settings.SCENARIO_THREADS) as executor:
+            return list(executor.map(
+                lambda indexed_scenario, run_context: run_context.run(
+                    self.generate_scenario, indexed_scenario[1], indexed_scenario[0], context),
+                indexed_scenarios,
+                contexts,
+            ))
+
     def get_file_name(self, ast):
         suite_name = ast.feature.name if ast.feature else ''
 
@@ -197,24 +348,55 @@ class GherkinToPyTestCodeGenerator(CodeGenerator):
         translator = CacheTranslator(Settings.language, 'en')
         return 'test_{}'.format(to_function_name(translator.translate(suite_name).lstrip().replace(' ', '_')))
 
+    def get_warnings(self):
+        if self._suite is None:
+            return []
+
+        return [warning.code for warning in self._suite.warning_collection.warnings]
+
     def generate(self, ast):
+        self._suite = None
+
         if not ast.feature:
             return ''
 
         # first set the test type and get the django project
         Settings.GENERATE_TEST_TYPE = GenerationType.PY_TEST
-        project = DjangoProject(Settings.DJANGO_SETTINGS_PATH)
+        project = DjangoProject.get_instance(Settings.DJANGO_SETTINGS_PATH)
         Settings.django_project_wrapper = project
 
         # create a suite
         self._suite = PyTestTestSuite(ast.feature.name if ast.feature else '')
 
-        # go through each scenario child and generate test cases
-        for child in ast.feature.get_scenario_children():
-            self.scenario_to_test_case(child, project)
+        # everything that is needed to generate the scenarios is passed to them explicitly
+        test_case_cache = TestCaseCache() if Settings.CACHE_TEST_CASES else None
+        context = GenerationContext(
+            language=Settings.language,
+            django_project=project,
+            test_type=Settings.GENERATE_TEST_TYPE,
+            test_case_cache=test_case_cache,
+            project_hash=project.get_snapshot_hash() if test_case_cache else None,
+        )
+        generated_test_cases = []
+
+        # go through each scenario child and generate test cases, they are added to the suite in their original order
+        # so that imports and warnings are the same as if they were generated one after another
+        for test_case, recording, key in self.generate_scenarios(ast.feature.get_scenario_children(), context):
+            if recording is None:
+                self._suite.add_cached_test_case(test_case)
+                continue
+
+            self._suite.add_recorded_test_case(test_case, recording)
+            if key is not None:
+                generated_test_cases.append((key, test_case, recording))
 
         # clean up the test suite
         self._suite.clean_up()
+
+        # save the final code of all test cases that were not cached yet
+        for key, test_case, recording in generated_test_cases:
+            test_case_cache.set(key, CachedTestCase.from_test_case(test_case, recording))
+
         Settings.GENERATE_TEST_TYPE = Settings.Defaults.GENERATE_TEST_TYPE
         Settings.django_project_wrapper = None
 
@@ -228,6 +410,14 @@ class GherkinToPyTestCompiler(Compiler):
     parser_class = GherkinParser
     code_generator_class = GherkinToPyTestCodeGenerator
 
+    def warm_up(self):
+        """Load the models of NLP and introspect the Django project before the processes are forked."""
+        Nlp.setup_languages(Languages.get_supported_languages())
+
+        project = DjangoProject.get_instance(Settings.DJANGO_SETTINGS_PATH)
+        project.get_models(include_django=True, include_third_party=True, as_wrapper=True)
+        project.urls
+
     def use_parser(self, tokens):
         try:
             return super().use_parser(tokens)
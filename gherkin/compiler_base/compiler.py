@@ -1,10 +1,18 @@
+import glob
 import inspect
+import multiprocessing
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 
 from core.performance import AveragePerformanceMeasurement, measure, MeasureKeys
 from gherkin.compiler_base.grammar import Grammar
 from gherkin.compiler_base.line import Line
+from gherkin.compiler_base.matcher import get_token_matcher
+from gherkin.compiler_base.state import ParserState
 from gherkin.compiler_base.token import Token
 from gherkin.compiler_base.wrapper import TokenWrapper
+from settings import Settings
 
 
 class Lexer(object):
@@ -14,11 +22,17 @@ class Lexer(object):
     def __init__(self, compiler):
         self.compiler = compiler
         self._tokens: [Token] = []
+        self._tokens_by_line: [[Token]] = []
 
     @property
     def tokens(self):
         return self._tokens
 
+    @property
+    def tokens_by_line(self):
+        """Returns a list with the tokens of each line of the last tokenized text."""
+        return self._tokens_by_line
+
     def token_fits_string(self, token_cls, string):
         """A wrapper function to define how a token defines if given string fits it."""
         return token_cls.string_contains_matching_pattern(string)
@@ -37,8 +51,19 @@ class Lexer(object):
         """
         return token_cls.reduce_to_lexeme(text)
 
+    def get_token_matcher_key(self):
+        """
+        The compiled matcher of the token classes is cached for the value that this returns. It must change
+        whenever the patterns of the token classes change.
+        """
+        return None
+
     def get_fitting_token_cls(self, string: str):
         """Returns the first class in token_classes where token_fits_string returns true"""
+        # lexers that check the tokens in their own way cannot use the compiled matcher
+        if self.__class__.token_fits_string is Lexer.token_fits_string:
+            return get_token_matcher(self.token_classes, self.get_token_matcher_key()).get_fitting_token_cls(string)
+
         for _token in self.token_classes:
             if self.token_fits_string(_token, string):
                 return _token
@@ -57,43 +82,86 @@ class Lexer(object):
 
         return token
 
+    def tokenize_line(self, line):
+        """Tokenizes a single line and returns the tokens that were added for it."""
+        first_token_index = len(self._tokens)
+
+        remaining_text = line.trimmed_text
+        # loop must run at least once
+        while True:
+            # search for a token that fits
+            token_cls = self.get_fitting_token_cls(remaining_text)
+            if token_cls is None:
+                raise NotImplementedError(
+                    '`{}` in line {} did not result in a Token object. You should define a token for '
+                    'every case.'.format(remaining_text, line.line_index + 1))
+
+            # get the text that the token represents and create a token with it
+            lexeme = self.get_lexeme_for_token(token_cls, remaining_text)
+            token = self.init_and_add_token(token_cls, lexeme, line)
+
+            self.on_token_added(token)
+
+            # strip the text that was found and continue with the remaining one
+            remaining_text = remaining_text[len(lexeme):]
+
+            # if nothing remains of the line, stop the loop
+            if not bool(remaining_text):
+                break
+
+        self.on_end_of_line(line)
+
+        return self._tokens[first_token_index:]
+
     def tokenize(self, text):
         """
         Takes the text of the compiler and returns a list of tokens that represent entities in a Gherkin document.
         :return: list of Tokens
         """
         self._tokens = []
+        tokens_by_line = []
 
         self.on_start_tokenize()
 
         for index, line_text in enumerate(text.splitlines()):
-            line = Line(line_text, index)
+            tokens_by_line.append(self.tokenize_line(Line(line_text, index)))
+
+        self._tokens_by_line = tokens_by_line
+        self.on_end_of_document()
+
+        return self._tokens
 
-            remaining_text = line.trimmed_text
-            # loop must run at least once
-            while True:
-                # search for a token that fits
-                token_cls = self.get_fitting_token_cls(remaining_text)
-                if token_cls is None:
-                    raise NotImplementedError(
-                        '`{}` in line {} did not result in a Token object. You should define a token for '
-                        'every case.'.format(remaining_text, line.line_index + 1))
+    def retokenize(self, text, first_line_index, last_line_index):
+        """
+        Tokenizes a text that was changed since the last call of `tokenize` or `retokenize`. Only the lines from
+        `first_line_index` up to (excluding) `last_line_index` of the new text are tokenized again. All lines
+        before them must be unchanged and all lines after them must be the unchanged lines at the end of the old
+        text. The tokens of the unchanged lines are reused, only the indexes of their lines are moved.
 
-                # get the text that the token represents and create a token with it
-                lexeme = self.get_lexeme_for_token(token_cls, remaining_text)
-                token = self.init_and_add_token(token_cls, lexeme, line)
+        If the lines cannot be tokenized on their own (see `on_start_retokenize`), the whole text is tokenized.
+        :return: list of Tokens
+        """
+        lines = text.splitlines()
+        line_shift = len(lines) - len(self._tokens_by_line)
+        old_last_line_index = last_line_index - line_shift
 
-                self.on_token_added(token)
+        if not 0 <= first_line_index <= min(last_line_index, old_last_line_index) \
+                or last_line_index > len(lines) or not self.on_start_retokenize(first_line_index):
+            return self.tokenize(text)
 
-                # strip the text that was found and continue with the remaining one
-                remaining_text = remaining_text[len(lexeme):]
+        self._tokens = []
+        changed_lines = []
+        for index in range(first_line_index, last_line_index):
+            changed_lines.append(self.tokenize_line(Line(lines[index], index)))
 
-                # if nothing remains of the line, stop the loop
-                if not bool(remaining_text):
-                    break
+        self._tokens_by_line[first_line_index:old_last_line_index] = changed_lines
 
-            self.on_end_of_line(line)
+        if line_shift != 0:
+            for index in range(last_line_index, len(self._tokens_by_line)):
+                for token in self._tokens_by_line[index]:
+                    token.line.line_index = index
 
+        self._tokens = [token for tokens_in_line in self._tokens_by_line for token in tokens_in_line]
         self.on_end_of_document()
 
         return self._tokens
@@ -102,6 +170,15 @@ class Lexer(object):
         """Is called before starting to tokenize the text input."""
         pass
 
+    def on_start_retokenize(self, line_index):
+        """
+        Is called before `retokenize` tokenizes the changed lines, starting with the line at the given index. It
+        must restore anything that the lexer remembers from the lines before it (see `on_token_added`). If this is
+        not possible, it returns False and the whole text is tokenized again.
+        """
+        self.on_start_tokenize()
+        return True
+
     def on_token_added(self, token):
         """Called after a token was added to the list of tokens that will be returned by `tokenize`."""
         pass
@@ -122,6 +199,11 @@ class Parser(object):
     grammar = None
     token_wrapper_cls = TokenWrapper
 
+    # the tokens of the last call of `get_state` with the state after each of them, for each parser class
+    _cached_states = {}
+    # the token classes of the last call of `state_accepts_tokens` and the results for the states that were reached
+    _cached_acceptances = {}
+
     def __init__(self, compiler):
         self.compiler = compiler
         self._tokens = []
@@ -143,9 +225,94 @@ class Parser(object):
         """Can be used by children to modify the tokens before validating them."""
         return tokens
 
+    def parse_area(self, tokens: [Token], non_terminal):
+        """
+        Parses the tokens of a part of a document with a non terminal of the grammar (see
+        `Grammar.get_non_terminal`) and returns its object. This can be used to parse a part of a document again
+        after it changed. May raise the errors of the validation.
+        """
+        self._validate_parser()
+
+        wrapped_tokens = [self.token_wrapper_cls(token=t) for t in self.prepare_tokens(tokens)]
+        return non_terminal.convert(wrapped_tokens)
+
+    def get_state(self, tokens: [Token]) -> ParserState:
+        """
+        Returns the state of the grammar after the given tokens (see ParserState). The tokens must already be
+        prepared (see `prepare_tokens`), but they do not have to be a whole document. This can be used to find the
+        tokens that can come next.
+
+        The states after the tokens are saved, so only the tokens that are not at the same place as in the last
+        call are validated.
+        """
+        cached_states = Parser._cached_states.get(self.__class__, [])
+
+        index = 0
+        while index < len(tokens) and index < len(cached_states) and cached_states[index][0] is tokens[index]:
+            index += 1
+
+        state = cached_states[index - 1][1] if index > 0 else ParserState.for_validator(self.get_grammar())
+
+        if index < len(tokens):
+            new_states = cached_states[:index]
+            for token in tokens[index:]:
+                state = state.advance(self.token_wrapper_cls(token=token))
+                new_states.append((token, state))
+
+            Parser._cached_states[self.__class__] = new_states
+
+        return state
+
+    def state_accepts_tokens(self, state: ParserState, tokens: [Token]) -> bool:
+        """
+        Checks if the grammar can continue with the given tokens at the given state (see `get_state`) and end after
+        them. The tokens must already be prepared (see `prepare_tokens`). This can be used to check if other tokens
+        may replace a part of a document without validating the rest of it again.
+
+        A state only depends on the classes of the tokens. So the result for each state that is reached before one
+        of the tokens is saved, as long as the classes of the tokens after it stay the same as in the last call.
+        """
+        token_classes = [token.__class__ for token in tokens]
+        cached_classes, results = Parser._cached_acceptances.get(self.__class__, ([], {}))
+
+        same_classes = 0
+        max_same_classes = min(len(token_classes), len(cached_classes))
+        while same_classes < max_same_classes and token_classes[-same_classes - 1] is cached_classes[-same_classes - 1]:
+            same_classes += 1
+
+        # the results are saved by the number of tokens that follow the state
+        if same_classes < len(cached_classes):
+            results = {key: accepted for key, accepted in results.items() if key[0] <= same_classes}
+        Parser._cached_acceptances[self.__class__] = (token_classes, results)
+
+        new_keys = []
+        index = 0
+        while True:
+            if not state.is_valid():
+                accepted = False
+                break
+
+            key = (len(tokens) - index, state.get_key())
+            if key in results:
+                accepted = results[key]
+                break
+
+            new_keys.append(key)
+            if index == len(tokens):
+                accepted = state.is_done()
+                break
+
+            state = state.advance(self.token_wrapper_cls(token=tokens[index]))
+            index += 1
+
+        for key in new_keys:
+            results[key] = accepted
+
+        return accepted
+
     def get_grammar(self):
-        """Returns an instance of the grammar for the parser."""
-        return self.grammar()
+        """Returns the compiled instance of the grammar for the parser."""
+        return self.grammar.get_compiled()
 
     def _validate_parser(self):
         """Makes sure that the parser is set up correctly."""
@@ -162,7 +329,7 @@ class Parser(object):
             raise ValueError('You must use a subclass of Grammar in a parser.')
 
     def validate_and_create_ast(self):
-        """Validate the tokens and create a AST with them."""
+        """Validate the tokens and create a AST with them. The AST is created while the tokens are validated."""
         # validate everything
         self._validate_parser()
 
@@ -208,6 +375,37 @@ class CodeGenerator(object):
         """Returns the full path to the file."""
         return '{}{}.{}'.format(output_directory, self.get_file_name(ast), self.get_file_extension())
 
+    def get_warnings(self):
+        """Returns the warnings that were created during the last generation. Can be implemented by children."""
+        return []
+
+
+class CompiledFile(object):
+    """Holds information about a file that was compiled as part of a batch."""
+    def __init__(self, path, output_path=None, duration=0, warnings=None, error=None, code=None):
+        self.path = path
+        self.output_path = output_path
+        self.duration = duration
+        self.warnings = warnings or []
+        self.error = error
+        self.code = code
+
+    @property
+    def successful(self):
+        return self.error is None
+
+    def __str__(self):
+        if not self.successful:
+            return '{} failed after {}s: {}'.format(self.path, round(self.duration, 2), self.error)
+
+        return '{} -> {} ({}s, {} warnings{})'.format(
+            self.path,
+            self.output_path,
+            round(self.duration, 2),
+            len(self.warnings),
+            ': {}'.format(', '.join(self.warnings)) if self.warnings else '',
+        )
+
 
 class Compiler(object):
     """Base class to create a compiler that will call a lexer, a parser and a code_generator."""
@@ -228,10 +426,12 @@ class Compiler(object):
             file_text = file.read()
         return file_text
 
+    @measure(by=AveragePerformanceMeasurement, key=MeasureKeys.LEXER)
     def use_lexer(self, text):
         """A wrapper around the tokenization of a text. It can be used by children to do something."""
         return self.lexer.tokenize(text)
 
+    @measure(by=AveragePerformanceMeasurement, key=MeasureKeys.PARSER)
     def use_parser(self, tokens):
         """A wrapper around the validation and creation of the AST. It can be used by children to do something."""
         return self.parser.parse(tokens)
@@ -280,3 +480,131 @@ class Compiler(object):
         file.close()
 
         return file
+
+    @classmethod
+    def find_files(cls, directory_path, pattern):
+        """Returns the sorted paths of all files in a directory that match the given glob pattern."""
+        paths = glob.glob(os.path.join(directory_path, pattern), recursive=True)
+        return sorted(path for path in paths if os.path.isfile(path))
+
+    def compile_and_generate_file(self, path, directory_path):
+        """
+        Compiles the file at the given path and generates the code for it without writing it. Errors do not stop the
+        compilation of other files, so they are saved in the returned CompiledFile instead. The runtime values of
+        the settings (like the language) are local to this compilation.
+        """
+        start = time.time()
+
+        try:
+            with Settings.runtime_context():
+                ast = self.compile_file(path)
+                code = self.export_as_text(ast)
+                output_path = self.code_generator.get_full_file_name(ast, directory_path)
+        except Exception as e:
+            return CompiledFile(path, duration=time.time() - start, error='{}: {}'.format(e.__class__.__name__, e))
+
+        return CompiledFile(
+            path,
+            output_path=output_path,
+            duration=time.time() - start,
+            warnings=self.code_generator.get_warnings(),
+            code=code,
+        )
+
+    @classmethod
+    def write_compiled_file(cls, compiled_file):
+        """Writes the code of a compiled file to its output path."""
+        if not compiled_file.successful:
+            return
+
+        with open(compiled_file.output_path, 'w') as file:
+            file.write(compiled_file.code)
+
+    def warm_up(self):
+        """
+        Is called before the files are distributed to multiple processes. Children can load everything that is
+        expensive here so that the processes share it instead of loading it on their own.
+        """
+        pass
+
+    def _generate_files_in_processes(self, paths, directory_path, processes):
+        """Generates the code for the files in a pool of processes. The results keep the order of the paths."""
+        self.warm_up()
+
+        # fork the processes after the warm up to share the loaded models and caches with the parent process
+        if 'fork' in multiprocessing.get_all_start_methods():
+            context = multiprocessing.get_context('fork')
+        else:
+            context = None
+
+        with ProcessPoolExecutor(
+            max_workers=processes,
+            mp_context=context,
+            initializer=_init_process_compiler,
+            initargs=(self.__class__, ),
+        ) as executor:
+            return list(executor.map(_generate_file_in_process, paths, [directory_path] * len(paths)))
+
+    def _generate_files_in_threads(self, paths, directory_path, threads):
+        """
+        Generates the code for the files in a pool of threads. Each file is compiled by its own compiler, since the
+        lexer, the parser and the code generator keep the state of the file. The results keep the order of the paths.
+        """
+        with ThreadPoolExecutor(max_workers=threads) as executor:
+            return list(executor.map(
+                lambda path: self.__class__().compile_and_generate_file(path, directory_path),
+                paths,
+            ))
+
+    def compile_files(self, paths, directory_path, processes=1, threads=1):
+        """
+        Compiles multiple files and exports them to the given directory. All files that are handled by the same
+        process share all caches. If more than one process is used, the files are distributed across a pool of
+        processes. Otherwise, the files can be compiled by a pool of threads in this process. The files are always
+        written in the order of the paths, so the result is the same for any number of processes or threads.
+        Returns a list of CompiledFile.
+        """
+        if processes > 1 and len(paths) > 1:
+            compiled_files = self._generate_files_in_processes(paths, directory_path, processes)
+        elif threads > 1 and len(paths) > 1 and not Settings.MEASURE_PERFORMANCE:
+            compiled_files = self._generate_files_in_threads(paths, directory_path, threads)
+        else:
+            compiled_files = [self.compile_and_generate_file(path, directory_path) for path in paths]
+
+        for compiled_file in compiled_files:
+            self.write_compiled_file(compiled_file)
+
+        return compiled_files
+
+    def compile_directory(self, features_directory, directory_path, pattern, processes=1, threads=1):
+        """Compiles all files in a directory that match the glob pattern. See `compile_files`."""
+        return self.compile_files(self.find_files(features_directory, pattern), directory_path, processes, threads)
+
+    @classmethod
+    def print_summary(cls, compiled_files):
+        """Prints the timing and the warnings for each compiled file."""
+        for compiled_file in compiled_files:
+            print(compiled_file)
+
+        failed = [compiled_file for compiled_file in compiled_files if not compiled_file.successful]
+        print('Compiled {} files in {}s ({} failed, {} warnings)'.format(
+            len(compiled_files),
+            round(sum(compiled_file.duration for compiled_file in compiled_files), 2),
+            len(failed),
+            sum(len(compiled_file.warnings) for compiled_file in compiled_files),
+        ))
+
+
+# the compiler of a process in the pool of `Compiler.compile_files`
+_process_compiler = None
+
+
+def _init_process_compiler(compiler_cls):
+    """Creates the compiler once for each process of the pool."""
+    global _process_compiler
+    _process_compiler = compiler_cls()
+
+
+def _generate_file_in_process(path, directory_path):
+    """Generates the code for a file in a process of the pool."""
+    return _process_compiler.compile_and_generate_file(path, directory_path)
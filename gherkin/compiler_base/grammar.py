@@ -1,3 +1,5 @@
+import threading
+
 from gherkin.compiler_base.symbol.non_terminal import NonTerminal
 from gherkin.compiler_base.recursive import RecursiveValidationContainer
 
@@ -5,6 +7,10 @@ from gherkin.compiler_base.recursive import RecursiveValidationContainer
 class Grammar(RecursiveValidationContainer):
     start_non_terminal: NonTerminal = None
 
+    # compiled instances of each grammar class, see `get_compiled`
+    _compiled_grammars = {}
+    _compile_lock = threading.Lock()
+
     def __init__(self):
         assert self.start_non_terminal is not None, 'You must provide a starting NonTerminal object'
         assert isinstance(self.start_non_terminal, NonTerminal), 'The start of a grammar must be a NonTerminal.'
@@ -12,6 +18,46 @@ class Grammar(RecursiveValidationContainer):
     def get_child_validator(self):
         return self.start_non_terminal
 
+    @classmethod
+    def get_compiled(cls):
+        """
+        Returns a compiled instance of this grammar. The rules do not depend on the sequence or the language of a
+        document, so the grammar is only compiled once and the instance is shared by every parser.
+        """
+        with Grammar._compile_lock:
+            if cls not in Grammar._compiled_grammars:
+                grammar = cls()
+                grammar.compile()
+                Grammar._compiled_grammars[cls] = grammar
+
+            return Grammar._compiled_grammars[cls]
+
+    def get_non_terminal(self, non_terminal_classes):
+        """
+        Returns the non terminal of this grammar that is reached by going through non terminals of the given classes
+        (in this order) from the start. It is only searched below non terminals of these classes. Returns None if
+        there is no such non terminal.
+
+        Example:
+            [FeatureNonTerminal, ScenarioNonTerminal] returns the ScenarioNonTerminal that is used in the feature.
+        """
+        to_search = [(child, 0) for child in self.start_non_terminal.get_children()]
+
+        while to_search:
+            validator, depth = to_search.pop(0)
+
+            if isinstance(validator, NonTerminal):
+                if not isinstance(validator, non_terminal_classes[depth]):
+                    continue
+
+                depth += 1
+                if depth == len(non_terminal_classes):
+                    return validator
+
+            to_search += [(child, depth) for child in validator.get_children()]
+
+        return None
+
     def to_ebnf(self, ebnf_entries=None):
         """
         Returns the EBNF for this grammar. It will create a list and starts the process in its starting non terminal.
@@ -0,0 +1,88 @@
+import re
+
+from gherkin.compiler_base.token import Token
+
+
+def token_cls_matches_prefix(token_cls) -> bool:
+    """
+    Checks if a token class fits a string only if the string starts with one of its patterns (like the default of
+    Token). Only these classes can be combined into one regular expression.
+    """
+    return all(
+        getattr(token_cls, name).__func__ is getattr(Token, name).__func__
+        for name in ['string_contains_matching_pattern', 'get_matching_pattern', 'string_matches_pattern']
+    )
+
+
+class TokenMatcher(object):
+    """
+    Finds the first token class in a list that fits a string. Consecutive token classes that fit a string if it
+    starts with one of their patterns are combined into one regular expression, so that they are checked in one
+    scan. The order of the alternatives is the order of the classes and their patterns, so the same class is found.
+    All other token classes are checked one after the other.
+    """
+    def __init__(self, token_classes):
+        self._steps = []
+        prefix_classes = []
+
+        for token_cls in token_classes:
+            if token_cls_matches_prefix(token_cls):
+                prefix_classes.append(token_cls)
+                continue
+
+            self._add_prefix_step(prefix_classes)
+            prefix_classes = []
+            self._steps.append((None, [token_cls]))
+
+        self._add_prefix_step(prefix_classes)
+
+    def _add_prefix_step(self, token_classes):
+        alternatives = []
+        classes_of_groups = []
+
+        for token_cls in token_classes:
+            patterns = list(token_cls.get_patterns())
+
+            # an empty pattern is found, but does not count as a match - so the patterns after it are never used
+            if '' in patterns:
+                patterns = patterns[:patterns.index('')]
+
+            if not patterns:
+                continue
+
+            alternatives.append('({})'.format('|'.join(re.escape(pattern) for pattern in patterns)))
+            classes_of_groups.append(token_cls)
+
+        if alternatives:
+            self._steps.append((re.compile('|'.join(alternatives)), classes_of_groups))
+
+    def get_fitting_token_cls(self, string: str):
+        """Returns the first token class that fits the string or None if there is none."""
+        for regex, token_classes in self._steps:
+            if regex is None:
+                if token_classes[0].string_contains_matching_pattern(string):
+                    return token_classes[0]
+                continue
+
+            match = regex.match(string)
+            if match:
+                return token_classes[match.lastindex - 1]
+
+        return None
+
+
+# the matchers of the lists of token classes, see `get_token_matcher`
+_token_matchers = {}
+
+
+def get_token_matcher(token_classes, key=None) -> TokenMatcher:
+    """
+    Returns the matcher for a list of token classes. It is only created once for each key, so the key must change
+    whenever the patterns of the token classes change (like the language of a document).
+    """
+    cache_key = (tuple(token_classes), key)
+
+    if cache_key not in _token_matchers:
+        _token_matchers[cache_key] = TokenMatcher(token_classes)
+
+    return _token_matchers[cache_key]
@@ -2,15 +2,31 @@ class IndentMixin(object):
     """
     This is a mixin that is used to keep track of parents and the definition on indentation.
     """
+    _suggested_indent_level = None
+
     def __init__(self):
         super().__init__()
 
         self.parent = None
 
+    def __getstate__(self):
+        # copies may get another parent, so they must determine their level again
+        state = self.__dict__.copy()
+        state.pop('_suggested_indent_level', None)
+        return state
+
     def set_parent(self, parent):
         self.parent = parent
+        self._suggested_indent_level = None
 
     def get_suggested_indent_level(self):
+        """Returns the suggested indent level. The parents of a grammar do not change, so it is only determined once."""
+        if self._suggested_indent_level is None:
+            self._suggested_indent_level = self._get_suggested_indent_level()
+
+        return self._suggested_indent_level
+
+    def _get_suggested_indent_level(self):
         if self.parent is None:
             return 0
 
@@ -1,12 +1,151 @@
 from abc import ABC
+from contextlib import contextmanager
+from contextvars import ContextVar
 
-from gherkin.compiler_base.exception import SequenceEnded, RuleNotFulfilled, SequenceNotFinished
+from gherkin.compiler_base.exception import SequenceEnded, RuleNotFulfilled, SequenceNotFinished, NonTerminalNotUsed, \
+    NonTerminalInvalid
+
+
+class SequenceMemo(object):
+    """
+    Saves the result of validating an object of the grammar at an index of a sequence: either the index where the
+    object ends or the error that it raised (packrat parsing). Every object of the grammar is only validated once per
+    index, so validating and converting a sequence is linear to its length.
+
+    If `build_objects` is true, the object that represents the sequence (see `sequence_to_object`) is created as soon
+    as an object of the grammar is valid. Parents use the objects of their children instead of converting them again.
+
+    If `predictive` is true, the predictive parser is tried before an object is validated recursively (see
+    `predict`). The errors of objects that it decides not to use do not hold any information, so the errors that
+    are raised while using such a memo should not be shown to anyone.
+    """
+    memoized_errors = (RuleNotFulfilled, NonTerminalNotUsed, SequenceEnded)
+
+    def __init__(self, sequence, build_objects=False, predictive=False):
+        self.sequence = sequence
+        self.build_objects = build_objects
+        self.predictive = predictive
+        self._results = {}
+        self._objects = {}
+        self._not_predictable = set()
+
+    @contextmanager
+    def activate(self):
+        """Makes this memo the active one while the context manager is active."""
+        token = _active_sequence_memo.set(self)
+        try:
+            yield self
+        finally:
+            _active_sequence_memo.reset(token)
+
+    def _add_result(self, key, validator, index, result_index, error):
+        self._results[key] = (result_index, error)
+
+        if error is None and self.build_objects:
+            self._objects[key] = validator.sequence_to_object(self.sequence, index)
+
+    def validate(self, validator, index):
+        """Returns the result of `validator._validate_sequence` at the index and raises the same errors."""
+        key = (id(validator), index)
+
+        if key not in self._results and (not self.predictive or self.predict(validator, index) is None):
+            try:
+                # noinspection PyProtectedMember
+                result_index, error = validator._validate_sequence(self.sequence, index), None
+            except self.memoized_errors as e:
+                result_index, error = None, e
+            self._add_result(key, validator, index, result_index, error)
+
+        result_index, error = self._results[key]
+        if error is not None:
+            raise error.with_traceback(None)
+
+        return result_index
+
+    def predict(self, validator, index):
+        """
+        Returns the result of `validator._predict_sequence` at the index and saves it like the result of a validation.
+        It does not raise any errors: None is returned if the validator is not valid or cannot be predicted.
+        """
+        key = (id(validator), index)
+
+        if key in self._results:
+            return self._results[key][0]
+
+        if key in self._not_predictable:
+            return None
+
+        # noinspection PyProtectedMember
+        result_index = validator._predict_sequence(self.sequence, index)
+
+        if result_index is None:
+            self._not_predictable.add(key)
+        else:
+            self._add_result(key, validator, index, result_index, None)
+
+        return result_index
+
+    def add_predicted_error(self, validator, index):
+        """
+        Saves that the validator is not valid at the index because the token there is not in its FIRST set. Since
+        nothing is used, the error happens at the index.
+        """
+        self._results[(id(validator), index)] = (None, RuleNotFulfilled(
+            'The token is not in the FIRST set.',
+            terminal_symbol=None,
+            sequence_index=index,
+            comes_from=validator,
+            suggested_tokens=[],
+        ))
+
+    def get_object(self, validator, index):
+        """Returns the result of `validator.sequence_to_object` at the index. The object is only created once."""
+        key = (id(validator), index)
+        self.validate(validator, index)
+
+        if key not in self._objects:
+            self._objects[key] = validator.sequence_to_object(self.sequence, index)
+
+        return self._objects[key]
+
+
+# the memo of the sequence that is validated right now, see `sequence_memo`
+_active_sequence_memo = ContextVar('active_sequence_memo', default=None)
+
+
+def get_sequence_memo(sequence):
+    """Returns the active memo for the sequence or None if there is none."""
+    memo = _active_sequence_memo.get()
+
+    if memo is None or memo.sequence is not sequence:
+        return None
+
+    return memo
+
+
+@contextmanager
+def sequence_memo(sequence, build_objects=False):
+    """
+    While this context manager is active, the results of validating objects of the grammar in the sequence are
+    memoized. If there is an active memo for the sequence already, it is used.
+    """
+    memo = get_sequence_memo(sequence)
+    if memo is not None:
+        memo.build_objects = memo.build_objects or build_objects
+        yield memo
+        return
+
+    with SequenceMemo(sequence, build_objects).activate() as memo:
+        yield memo
 
 
 class RecursiveValidationBase(object):
     """
     This is the base class that is used throughout the recursive parser to validate data and pass data around.
     """
+    # if true, `convert` tries the predictive parser before validating the sequence recursively
+    predictive = True
+
     def to_ebnf(self, ebnf_entries=None):
         """
         This function can be used to get the definition as EBNF. ebnf_entries can be used to create additional
@@ -36,12 +175,68 @@ class RecursiveValidationBase(object):
         """
         raise NotImplementedError()
 
+    def get_first_token_classes(self) -> frozenset:
+        """
+        Returns the classes of all tokens that a valid sequence of this object can start with (FIRST set).
+        """
+        raise NotImplementedError()
+
+    def accepts_empty_sequence(self) -> bool:
+        """
+        Returns if this object is valid without using any token of a sequence.
+        """
+        raise NotImplementedError()
+
+    def can_start_with(self, token_cls) -> bool:
+        """
+        Checks if a valid sequence of this object can start with a token of the given class.
+        """
+        return token_cls is not None and any(issubclass(token_cls, cls) for cls in self.get_first_token_classes())
+
+    def get_children(self) -> list:
+        """
+        Returns the objects that this object validates directly (like the children of an operator).
+        """
+        return []
+
+    def expand_continuation(self, rest) -> list:
+        """
+        Is used by the `ParserState` to find the terminal symbols that can come next. A continuation is a tuple of
+        the objects that must still be validated, the last one is validated first. This object was the last one
+        of a continuation and `rest` holds the others. Returns all the continuations that can replace it, the
+        ones that the recursive validation would try first come first.
+
+        By default, the children are validated one after another.
+        """
+        return [rest + tuple(reversed(self.get_children()))]
+
+    def compile(self):
+        """
+        Prepares everything that does not depend on a sequence, so that it is not done again while validating one.
+        """
+        pass
+
     def convert(self, sequence):
         """
-        Can be called to convert a given sequence to an object. The returned object depends on the Rule.
+        Can be called to convert a given sequence to an object. The returned object depends on the Rule. The
+        objects are created while the sequence is validated, so the sequence is only traversed once.
+
+        If `predictive` is true, the predictive parser is tried for every object first (see `_predict_sequence`) and
+        only the objects that it cannot handle are validated recursively. If the sequence is invalid, it is validated
+        again without it, so that the errors hold all the information.
         """
-        self.validate_sequence(sequence)
-        return self.sequence_to_object(sequence)
+        if self.predictive and get_sequence_memo(sequence) is None:
+            try:
+                with SequenceMemo(sequence, build_objects=True, predictive=True).activate():
+                    self.validate_sequence(sequence)
+                    return self.sequence_to_object(sequence)
+            except (RuleNotFulfilled, NonTerminalNotUsed, NonTerminalInvalid, SequenceNotFinished):
+                # validate again to get the errors with all the information
+                pass
+
+        with sequence_memo(sequence, build_objects=True):
+            self.validate_sequence(sequence)
+            return self.sequence_to_object(sequence)
 
     def _validate_sequence(self, sequence, index) -> int:
         """
@@ -53,6 +248,17 @@ class RecursiveValidationBase(object):
         """
         raise NotImplementedError()
 
+    def _predict_sequence(self, sequence, index):
+        """
+        Can be implemented by each child to support the predictive parser. It works like `_validate_sequence`, but
+        decides which path to take only by looking at the token at the index (LL(1) with the FIRST sets) and it
+        never raises an error. The results of the children are saved in the memo of the sequence.
+
+        Returns the index after this object or None if the sequence is invalid or cannot be predicted. In that case
+        the object is validated recursively, which reuses the results of its children.
+        """
+        return None
+
     def validate_sequence(self, sequence, index=0):
         """
         Public function to validate a given sequence. May raise a RuleNotFulfilled or a SequenceNotFinished.
@@ -62,7 +268,8 @@ class RecursiveValidationBase(object):
                                                                        'class "TokenWrapper"'
 
         try:
-            result_index = self._validate_sequence(sequence, index)
+            with sequence_memo(sequence):
+                result_index = self._validate_sequence(sequence, index)
         except SequenceEnded as e:
             raise RuleNotFulfilled(
                 str(e),
@@ -90,6 +297,25 @@ class RecursiveValidationContainer(RecursiveValidationBase, ABC):
     def get_next_pointer_index(self, child, sequence, current_index) -> int:
         return self.get_child_validator().get_next_pointer_index(child, sequence, current_index)
 
+    def get_first_token_classes(self) -> frozenset:
+        return self.get_child_validator().get_first_token_classes()
+
+    def accepts_empty_sequence(self) -> bool:
+        return self.get_child_validator().accepts_empty_sequence()
+
+    def can_start_with(self, token_cls) -> bool:
+        return self.get_child_validator().can_start_with(token_cls)
+
+    def _predict_sequence(self, sequence, index):
+        # noinspection PyProtectedMember
+        return self.get_child_validator()._predict_sequence(sequence, index)
+
+    def get_children(self) -> list:
+        return [self.get_child_validator()]
+
+    def compile(self):
+        self.get_child_validator().compile()
+
     def sequence_to_object(self, sequence, index=0):
         return self.get_child_validator().sequence_to_object(sequence, index)
 
@@ -2,7 +2,7 @@ from abc import ABC
 
 from gherkin.compiler_base.exception import SequenceEnded, RuleNotFulfilled, NonTerminalNotUsed
 from gherkin.compiler_base.mixin import IndentMixin
-from gherkin.compiler_base.recursive import RecursiveValidationBase
+from gherkin.compiler_base.recursive import RecursiveValidationBase, get_sequence_memo
 
 
 class RuleOperator(IndentMixin, RecursiveValidationBase, ABC):
@@ -40,11 +40,48 @@ class RuleOperator(IndentMixin, RecursiveValidationBase, ABC):
 
     def get_next_pointer_index(self, child, sequence, current_index) -> int:
         """
-        An operator always lets the child handle which pointer index comes next.
+        An operator always lets the child handle which pointer index comes next. If the sequence is memoized, the
+        child is only validated once at each index.
         """
+        memo = get_sequence_memo(sequence)
+        if memo is not None:
+            return memo.validate(child, current_index)
+
         # noinspection PyProtectedMember
         return child._validate_sequence(sequence, current_index)
 
+    def get_child_object(self, child, sequence, index):
+        """
+        Returns the object of a child at an index of the sequence. If the sequence is memoized, the object that was
+        created while validating the child is used.
+        """
+        memo = get_sequence_memo(sequence)
+        if memo is not None:
+            return memo.get_object(child, index)
+
+        return child.sequence_to_object(sequence, index)
+
+    def child_is_predicted(self, child, sequence, index):
+        """
+        Checks if the predictive parser uses the child at the index of the sequence by looking at the token there.
+        If it does not, the child is saved as invalid in the memo of the sequence without validating it.
+        """
+        token_cls = sequence[index].token.__class__ if index < len(sequence) else None
+
+        if child.accepts_empty_sequence() or child.can_start_with(token_cls):
+            return True
+
+        get_sequence_memo(sequence).add_predicted_error(child, index)
+        return False
+
+    def get_children(self) -> list:
+        return self.children if self.supports_list_as_children else [self.child]
+
+    def compile(self):
+        """Compiles all children of this operator."""
+        for child in self.get_children():
+            child.compile()
+
     def __str__(self):
         return 'Rule {} - {}'.format(self.__class__.__name__, self.child)
 
@@ -80,6 +117,12 @@ class Optional(RuleOperator):
         if isinstance(child, Repeatable):
             raise ValueError('Do not use Repeatable as a child of Optional. Use Repeatable(minimum=0) instead.')
 
+    def get_first_token_classes(self) -> frozenset:
+        return self.child.get_first_token_classes()
+
+    def accepts_empty_sequence(self) -> bool:
+        return True
+
     def _validate_sequence(self, sequence, index) -> int:
         # try to get the next index. If that fails, just ignore, since it is optional
         try:
@@ -88,6 +131,15 @@ class Optional(RuleOperator):
             # if not valid, continue at current index
             return index
 
+    def expand_continuation(self, rest) -> list:
+        return [rest + (self.child, ), rest]
+
+    def _predict_sequence(self, sequence, index):
+        if not self.child_is_predicted(self.child, sequence, index):
+            return index
+
+        return get_sequence_memo(sequence).predict(self.child, index)
+
     def sequence_to_object(self, sequence, index=0):
         """
         Transforms an entry of a sequence at an index into an object. This will either return:
@@ -95,15 +147,13 @@ class Optional(RuleOperator):
             -> a Token if the child is a `TerminalSymbol`
             -> Whatever the child has defined if the child is a NonTerminal or RuleOperator
         """
-        self._validate_sequence(sequence, index)
-
         # check if the child exists - if not return None
         try:
             self.get_next_pointer_index(self.child, sequence, index)
         except (RuleNotFulfilled, NonTerminalNotUsed, SequenceEnded):
             return None
 
-        return self.child.sequence_to_object(sequence, index)
+        return self.get_child_object(self.child, sequence, index)
 
 
 class OneOf(RuleOperator):
@@ -156,7 +206,7 @@ class OneOf(RuleOperator):
             except (RuleNotFulfilled, SequenceEnded, NonTerminalNotUsed):
                 continue
 
-            return child.sequence_to_object(sequence, index)
+            return self.get_child_object(child, sequence, index)
 
         assert False, 'This should not happen because it was validated beforehand - there should be one valid entry.'
 
@@ -169,6 +219,12 @@ class OneOf(RuleOperator):
         if isinstance(child, Repeatable) and child.minimum == 0:
             raise ValueError('You should not use minimum=0 on Repeatable while using OneOf as a parent.')
 
+    def get_first_token_classes(self) -> frozenset:
+        return frozenset().union(*[child.get_first_token_classes() for child in self.children])
+
+    def accepts_empty_sequence(self) -> bool:
+        return any(child.accepts_empty_sequence() for child in self.children)
+
     def _validate_sequence(self, sequence, index):
         errors = []
 
@@ -190,6 +246,18 @@ class OneOf(RuleOperator):
             suggested_tokens=[item for sublist in suggested_tokens for item in sublist],
         )
 
+    def expand_continuation(self, rest) -> list:
+        return [rest + (child, ) for child in self.children]
+
+    def _predict_sequence(self, sequence, index):
+        predicted_children = [child for child in self.children if self.child_is_predicted(child, sequence, index)]
+
+        # if more than one child can be used (or none), the recursive validation decides
+        if len(predicted_children) != 1:
+            return None
+
+        return get_sequence_memo(sequence).predict(predicted_children[0], index)
+
 
 class Repeatable(RuleOperator):
     """Allows any amount of repetition of the passed child. If it is optional, minimum=0 can be passed."""
@@ -198,6 +266,7 @@ class Repeatable(RuleOperator):
         super().__init__(child)
         self.minimum = minimum
         self.show_in_autocomplete = show_in_autocomplete
+        self._repetition = None
 
         self.child.set_parent(self)
 
@@ -235,6 +304,12 @@ class Repeatable(RuleOperator):
         if isinstance(child, Optional):
             raise ValueError('You must not use Optional as a child of Repeatable. Use minimum=0 instead.')
 
+    def get_first_token_classes(self) -> frozenset:
+        return self.child.get_first_token_classes()
+
+    def accepts_empty_sequence(self) -> bool:
+        return self.minimum == 0 or self.child.accepts_empty_sequence()
+
     def _validate_sequence(self, sequence, index):
         rounds_done = 0
 
@@ -263,6 +338,34 @@ class Repeatable(RuleOperator):
 
         return index
 
+    def expand_continuation(self, rest) -> list:
+        if self._repetition is None:
+            self._repetition = _Repetition(self.child)
+
+        if self.minimum == 0:
+            return self._repetition.expand_continuation(rest)
+
+        return [rest + (self._repetition, ) + (self.child, ) * self.minimum]
+
+    def _predict_sequence(self, sequence, index):
+        memo = get_sequence_memo(sequence)
+        rounds_done = 0
+
+        while self.child_is_predicted(self.child, sequence, index):
+            next_index = memo.predict(self.child, index)
+
+            # a child that does not use any token would be repeated forever
+            if next_index is None or next_index == index:
+                return None
+
+            index = next_index
+            rounds_done += 1
+
+        if rounds_done < self.minimum:
+            return None
+
+        return index
+
     def sequence_to_object(self, sequence, index=0):
         """
         Returns a list of entries for a given sequence at a special index. This will return a list of whatever
@@ -274,13 +377,26 @@ class Repeatable(RuleOperator):
         while True:
             try:
                 next_round_index = self.get_next_pointer_index(self.child, sequence, index)
-                output.append(self.child.sequence_to_object(sequence, index))
+                output.append(self.get_child_object(self.child, sequence, index))
                 index = next_round_index
             except (RuleNotFulfilled, NonTerminalNotUsed, SequenceEnded):
                 break
         return output
 
 
+class _Repetition(object):
+    """Is used in the continuations of a Repeatable after its minimum: the child can be repeated any number of times."""
+    def __init__(self, child):
+        self.child = child
+
+    def expand_continuation(self, rest) -> list:
+        # a child that does not use any token would be repeated forever, so it is only used once more
+        if self.child.accepts_empty_sequence():
+            return [rest + (self.child, ), rest]
+
+        return [rest + (self, self.child), rest]
+
+
 class Chain(RuleOperator):
     """
     Allows a specific order of tokens to be checked. If the exact order is not correct, an error is thrown.
@@ -321,6 +437,21 @@ class Chain(RuleOperator):
 
         return output
 
+    def get_first_token_classes(self) -> frozenset:
+        """A chain can start with the tokens of its children until a child needs at least one token."""
+        first_token_classes = frozenset()
+
+        for child in self.children:
+            first_token_classes |= child.get_first_token_classes()
+
+            if not child.accepts_empty_sequence():
+                break
+
+        return first_token_classes
+
+    def accepts_empty_sequence(self) -> bool:
+        return all(child.accepts_empty_sequence() for child in self.children)
+
     def sequence_to_object(self, sequence, index=0):
         """
         Returns a list of objects that represent an area at a starting index of a given sequence. The list will
@@ -336,7 +467,7 @@ class Chain(RuleOperator):
             except (NonTerminalNotUsed, RuleNotFulfilled):
                 continue
 
-            output.append(child.sequence_to_object(sequence, index))
+            output.append(self.get_child_object(child, sequence, index))
             index = next_round_index
 
         return output
@@ -357,3 +488,14 @@ class Chain(RuleOperator):
 
         return index
 
+    def _predict_sequence(self, sequence, index):
+        memo = get_sequence_memo(sequence)
+
+        for child in self.children:
+            index = memo.predict(child, index)
+
+            if index is None:
+                return None
+
+        return index
+
@@ -22,10 +22,10 @@ class IndentBlock(IndentMixin, RecursiveValidationContainer):
         """Simply pass all validation to the child."""
         return self.child
 
-    def get_suggested_indent_level(self):
+    def _get_suggested_indent_level(self):
         """
         Everything below this element has a higher level of ident.
         """
-        level = super().get_suggested_indent_level()
+        level = super()._get_suggested_indent_level()
 
         return level + 1
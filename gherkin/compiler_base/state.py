@@ -0,0 +1,100 @@
+from gherkin.compiler_base.symbol.terminal import TerminalSymbol
+
+
+class ParserState(object):
+    """
+    Represents the state of a grammar after some tokens of a sequence were validated. It holds every continuation
+    (see `RecursiveValidationBase.expand_continuation`) that is still possible, so that the tokens that can come
+    next are known without validating the whole sequence again. Each continuation ends with a terminal symbol or
+    is empty if the grammar is done.
+
+    The state follows every path of the grammar, while the parser is greedy (an Optional or a Repeatable always
+    takes a valid child and a OneOf takes the first valid child). It also ignores any validation that NonTerminals
+    do in addition to their rules. So the state may accept sequences that the parser rejects, but never the other
+    way around.
+    """
+    def __init__(self, continuations):
+        self.continuations = continuations
+        self._keys = None
+
+    @classmethod
+    def for_validator(cls, validator):
+        """Returns the state before any token was validated by the given validator (like a grammar)."""
+        return cls(cls.expand_continuations([(validator, )]))
+
+    @classmethod
+    def expand_continuations(cls, continuations):
+        """
+        Expands the continuations until each one ends with a terminal symbol or is empty. The order is kept and
+        duplicates are removed.
+        """
+        output = []
+        added_continuations = set()
+        to_expand = list(reversed(continuations))
+
+        while to_expand:
+            continuation = to_expand.pop()
+
+            if continuation and not isinstance(continuation[-1], TerminalSymbol):
+                to_expand += reversed(continuation[-1].expand_continuation(continuation[:-1]))
+                continue
+
+            key = cls.get_continuation_key(continuation)
+            if key not in added_continuations:
+                added_continuations.add(key)
+                output.append(continuation)
+
+        return output
+
+    @classmethod
+    def get_continuation_key(cls, continuation):
+        # terminal symbols cannot be hashed, so use the ids
+        return tuple(id(entry) for entry in continuation)
+
+    def get_key(self):
+        """Returns a key that is the same for all states that continue in the same way."""
+        if self._keys is None:
+            self._keys = frozenset(self.get_continuation_key(c) for c in self.continuations)
+
+        return self._keys
+
+    def has_same_continuations(self, other):
+        """
+        Checks if this state and the other one continue in the same way. In that case, every sequence that follows
+        is valid for both of them or for none of them.
+        """
+        return self.get_key() == other.get_key()
+
+    def is_valid(self):
+        """Checks if there is any way to continue from this state."""
+        return len(self.continuations) > 0
+
+    def is_done(self):
+        """Checks if the grammar can end at this state."""
+        return any(not continuation for continuation in self.continuations)
+
+    def get_terminal_symbol(self, token_wrapper):
+        """Returns the terminal symbol that the recursive validation would most likely use for the token."""
+        for continuation in self.continuations:
+            if continuation and continuation[-1].token_wrapper_is_valid(token_wrapper):
+                return continuation[-1]
+
+        return None
+
+    def get_next_token_classes(self):
+        """Returns the classes of all tokens that can come next."""
+        token_classes = []
+
+        for continuation in self.continuations:
+            if continuation and continuation[-1].token_cls not in token_classes:
+                token_classes.append(continuation[-1].token_cls)
+
+        return token_classes
+
+    def advance(self, token_wrapper):
+        """Returns the state after the given token."""
+        return ParserState(self.expand_continuations([
+            continuation[:-1]
+            for continuation in self.continuations
+            if continuation and continuation[-1].token_wrapper_is_valid(token_wrapper)
+        ]))
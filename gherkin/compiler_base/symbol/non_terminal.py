@@ -1,3 +1,5 @@
+from copy import deepcopy
+
 from gherkin.compiler_base.exception import RuleNotFulfilled, SequenceEnded, NonTerminalNotUsed, NonTerminalInvalid
 from gherkin.compiler_base.mixin import IndentMixin
 from gherkin.compiler_base.recursive import RecursiveValidationBase
@@ -17,10 +19,11 @@ class NonTerminal(IndentMixin, RecursiveValidationBase):
     def __init__(self):
         super().__init__()
 
-        if self.get_clean_rule() is None:
+        rule = self._get_rule()
+        if rule is None:
             raise ValueError('You must provide a rule')
 
-        if not isinstance(self.get_clean_rule(), (TerminalSymbol, RuleOperator)):
+        if not isinstance(rule, (TerminalSymbol, RuleOperator)):
             raise ValueError('You must only use a TerminalSymbol or a RuleOperator on NonTerminal objects as its rule.')
 
         criterion_terminal_symbol = self.criterion_terminal_symbol
@@ -28,6 +31,10 @@ class NonTerminal(IndentMixin, RecursiveValidationBase):
             raise ValueError('You must either use None or a TerminalSymbol instance for criterion_terminal_symbol.')
 
         self.validated_sequence = None
+        self._clean_rule = None
+        self._first_token_classes = None
+        self._accepts_empty_sequence = None
+        self._can_start_with = {}
 
     def to_ebnf(self, ebnf_entries=None):
         """
@@ -64,13 +71,46 @@ class NonTerminal(IndentMixin, RecursiveValidationBase):
         return self.rule
 
     def get_clean_rule(self) -> RuleOperator:
-        """Returns the rule of this non terminal with all preparations."""
-        rule = self._get_rule()
+        """
+        Returns the rule of this non terminal with all preparations. The rule is often shared by all instances of a
+        class, so each instance creates its own copy once. That way every place of the non terminal in a grammar
+        has its own parents and the parents do not change while a sequence is validated.
+        """
+        if self._clean_rule is None:
+            rule = self._get_rule()
 
-        if rule:
+            # the parent of the shared rule must not be copied, it is replaced by this non terminal
+            rule = deepcopy(rule, {id(rule.parent): self} if rule.parent is not None else {})
             rule.set_parent(self)
+            self._clean_rule = rule
+
+        return self._clean_rule
+
+    def get_first_token_classes(self) -> frozenset:
+        if self._first_token_classes is None:
+            self._first_token_classes = self.get_clean_rule().get_first_token_classes()
+
+        return self._first_token_classes
+
+    def accepts_empty_sequence(self) -> bool:
+        if self._accepts_empty_sequence is None:
+            self._accepts_empty_sequence = self.get_clean_rule().accepts_empty_sequence()
+
+        return self._accepts_empty_sequence
+
+    def can_start_with(self, token_cls) -> bool:
+        if token_cls not in self._can_start_with:
+            self._can_start_with[token_cls] = super().can_start_with(token_cls)
 
-        return rule
+        return self._can_start_with[token_cls]
+
+    def get_children(self) -> list:
+        return [self.get_clean_rule()]
+
+    def compile(self):
+        """Creates the rule of this non terminal with the ones of all non terminals below it and the FIRST set."""
+        self.get_clean_rule().compile()
+        self.get_first_token_classes()
 
     def get_name(self):
         """
@@ -112,7 +152,7 @@ class NonTerminal(IndentMixin, RecursiveValidationBase):
         """
         try:
             # noinspection PyProtectedMember
-            return self.get_clean_rule()._validate_sequence(sequence, index)
+            new_index = self.get_clean_rule()._validate_sequence(sequence, index)
         except (RuleNotFulfilled, SequenceEnded) as e:
             next_valid_tokens = e.suggested_tokens
             valid_keywords = []
@@ -138,6 +178,33 @@ class NonTerminal(IndentMixin, RecursiveValidationBase):
 
             raise NonTerminalInvalid(message, non_terminal=self, suggested_tokens=e.suggested_tokens)
 
+        self.validate_sequence_area(sequence, index, new_index)
+        return new_index
+
+    def validate_sequence_area(self, sequence, start_index, end_index):
+        """
+        Can be used to validate more than the rule in the area of the sequence that this non terminal uses. Raise
+        NonTerminalInvalid if the area is not valid.
+        """
+        pass
+
+    def _predict_sequence(self, sequence, index):
+        # non terminals that validate in another way cannot be predicted
+        if self.__class__._validate_sequence is not NonTerminal._validate_sequence:
+            return None
+
+        # noinspection PyProtectedMember
+        new_index = self.get_clean_rule()._predict_sequence(sequence, index)
+        if new_index is None:
+            return None
+
+        try:
+            self.validate_sequence_area(sequence, index, new_index)
+        except NonTerminalInvalid:
+            return None
+
+        return new_index
+
     def validate_sequence(self, sequence, index=0):
         result_index = super().validate_sequence(sequence, 0)
         self.validated_sequence = sequence
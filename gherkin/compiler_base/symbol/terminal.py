@@ -26,6 +26,8 @@ class TerminalSymbol(IndentMixin, RecursiveValidationBase):
         # everything is validated before this is called, so this should always be the same!
         assert sequence[index].token.__class__ == self.token_cls
 
+        # the validation of other paths may have changed the values after this symbol was validated
+        self.on_token_wrapper_valid(sequence[index])
         return sequence[index]
 
     def token_wrapper_is_valid(self, token_wrapper) -> bool:
@@ -38,6 +40,12 @@ class TerminalSymbol(IndentMixin, RecursiveValidationBase):
     def get_next_pointer_index(self, child, sequence, current_index) -> int:
         return current_index + 1
 
+    def get_first_token_classes(self) -> frozenset:
+        return frozenset([self.token_cls])
+
+    def accepts_empty_sequence(self) -> bool:
+        return False
+
     def get_patterns(self) -> [str]:
         """
         Return a list of keywords. Used by rules to see what keywords are expected. So: what is expected to be found
@@ -95,6 +103,17 @@ class TerminalSymbol(IndentMixin, RecursiveValidationBase):
 
         return self.get_next_pointer_index(child=None, sequence=sequence, current_index=index)
 
+    def _predict_sequence(self, sequence, index):
+        # symbols that validate in another way cannot be predicted
+        if self.__class__._validate_sequence is not TerminalSymbol._validate_sequence:
+            return None
+
+        if index >= len(sequence) or not self.token_wrapper_is_valid(sequence[index]):
+            return None
+
+        self.on_token_wrapper_valid(sequence[index])
+        return index + 1
+
     def on_token_wrapper_valid(self, token_wrapper):
         token_wrapper.token.set_non_terminal_meta_value('suggested_indent_level', self.get_suggested_indent_level())
 
@@ -1,8 +1,11 @@
-from gherkin.compiler_base.compiler import Lexer, Parser
+import os
+
+from gherkin.compiler_base.compiler import Lexer, Parser, Compiler, CodeGenerator
 from gherkin.compiler_base.grammar import Grammar
 from gherkin.compiler_base.symbol.non_terminal import NonTerminal
 from gherkin.compiler_base.rule.operator import Chain
 from gherkin.compiler_base.token import Token
+from settings import Settings
 from test_utils import assert_callable_raises
 
 
@@ -131,6 +134,20 @@ def test_parser_parse_valid():
     assert parser.prepare_called is True
 
 
+def test_parser_grammar_compiled_once():
+    """Check that every parser uses the same compiled grammar."""
+    class CustomGrammar(Grammar):
+        start_non_terminal = CustomNonTerminal()
+
+    class CustomParser(Parser):
+        grammar = CustomGrammar
+
+    grammar = CustomParser(None).get_grammar()
+    assert isinstance(grammar, CustomGrammar)
+    assert CustomParser(None).get_grammar() is grammar
+    assert grammar.start_non_terminal.get_clean_rule().parent == grammar.start_non_terminal
+
+
 def test_parser_invalid():
     """Check that invalid configurations for a parser are handled."""
     class GrammarMissingParser(Parser):
@@ -148,3 +165,104 @@ def test_parser_invalid():
         grammar = 'asdasd'
 
     assert_callable_raises(InvalidGrammarParser(None).parse, ValueError, args=[[]])
+
+
+class FileNameParser(Parser):
+    def parse(self, tokens):
+        if not tokens:
+            raise ValueError('There are no tokens.')
+        return tokens[0].lexeme.strip()
+
+
+class FileNameCodeGenerator(CodeGenerator):
+    file_extension = 'txt'
+
+    def generate(self, ast):
+        return ast
+
+    def get_file_name(self, ast):
+        return ast
+
+    def get_warnings(self):
+        return ['001']
+
+
+class FileNameCompiler(Compiler):
+    lexer_class = type('FileNameLexer', (Lexer, ), {'token_classes': [CustomToken]})
+    parser_class = FileNameParser
+    code_generator_class = FileNameCodeGenerator
+
+
+def test_compiler_compile_directory(tmp_path):
+    """Check that all matching files of a directory are compiled and that errors do not stop the batch."""
+    features_dir = tmp_path / 'features'
+    (features_dir / 'sub').mkdir(parents=True)
+    (features_dir / 'b.feature').write_text('ABCDE')
+    (features_dir / 'sub' / 'a.feature').write_text('')
+    (features_dir / 'c.txt').write_text('ABCDE')
+    export_dir = '{}/'.format(tmp_path)
+
+    compiled_files = FileNameCompiler().compile_directory(str(features_dir), export_dir, '**/*.feature')
+    assert [compiled_file.path for compiled_file in compiled_files] == [
+        str(features_dir / 'b.feature'),
+        str(features_dir / 'sub' / 'a.feature'),
+    ]
+
+    assert compiled_files[0].successful is True
+    assert compiled_files[0].warnings == ['001']
+    assert compiled_files[0].output_path == '{}ABCDE.txt'.format(export_dir)
+    assert (tmp_path / 'ABCDE.txt').read_text() == 'ABCDE'
+
+    assert compiled_files[1].successful is False
+    assert compiled_files[1].error == 'ValueError: There are no tokens.'
+
+
+def test_compiler_compile_files_in_processes(tmp_path):
+    """Check that compiling in multiple processes returns the same results in the same order."""
+    paths = []
+    for index, text in enumerate(['ABCDE', '', 'ABCDE', 'ABCDE']):
+        path = tmp_path / '{}.feature'.format(index)
+        path.write_text(text)
+        paths.append(str(path))
+
+    export_dir = '{}/'.format(tmp_path)
+    serial_files = FileNameCompiler().compile_files(paths, export_dir)
+    parallel_files = FileNameCompiler().compile_files(paths, export_dir, processes=2)
+
+    assert [f.path for f in parallel_files] == [f.path for f in serial_files] == paths
+    assert [f.error for f in parallel_files] == [f.error for f in serial_files]
+    assert [f.code for f in parallel_files] == [f.code for f in serial_files]
+    assert (tmp_path / 'ABCDE.txt').read_text() == 'ABCDE'
+
+
+class LanguageCodeGenerator(FileNameCodeGenerator):
+    def generate(self, ast):
+        return '{} {}'.format(ast, Settings.language)
+
+
+class LanguageCompiler(FileNameCompiler):
+    code_generator_class = LanguageCodeGenerator
+
+    def compile_file(self, path):
+        Settings.language = os.path.basename(path)
+        return super().compile_file(path)
+
+
+def test_compiler_compile_files_in_threads(tmp_path):
+    """Check that files that are compiled by threads use their own runtime values of the settings."""
+    paths = []
+    for index, text in enumerate(['ABCDE', 'ABCDE', '', 'ABCDE']):
+        path = tmp_path / '{}.feature'.format(index)
+        path.write_text(text)
+        paths.append(str(path))
+
+    export_dir = '{}/'.format(tmp_path)
+    serial_files = LanguageCompiler().compile_files(paths, export_dir)
+    threaded_files = LanguageCompiler().compile_files(paths, export_dir, threads=3)
+
+    assert [f.path for f in threaded_files] == [f.path for f in serial_files] == paths
+    assert [f.error for f in threaded_files] == [f.error for f in serial_files]
+    assert [f.code for f in threaded_files] == [f.code for f in serial_files] == [
+        'ABCDE 0.feature', 'ABCDE 1.feature', None, 'ABCDE 3.feature',
+    ]
+    assert Settings.language == 'en'
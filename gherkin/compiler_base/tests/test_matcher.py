@@ -0,0 +1,52 @@
+from gherkin.compiler_base.matcher import TokenMatcher, get_token_matcher, token_cls_matches_prefix
+from gherkin.compiler_base.token import Token
+
+
+class PrefixToken(Token):
+    @classmethod
+    def get_patterns(cls):
+        return ['A.', 'ABC']
+
+
+class OtherPrefixToken(Token):
+    @classmethod
+    def get_patterns(cls):
+        return ['AB', '', 'X']
+
+
+class WholeLineToken(Token):
+    @classmethod
+    def string_contains_matching_pattern(cls, string: str):
+        return string.endswith('!')
+
+
+class FallbackToken(Token):
+    @classmethod
+    def string_contains_matching_pattern(cls, string: str):
+        return True
+
+
+def test_token_cls_matches_prefix():
+    """Check that only token classes with the default matching of patterns are combined."""
+    assert token_cls_matches_prefix(PrefixToken) is True
+    assert token_cls_matches_prefix(OtherPrefixToken) is True
+    assert token_cls_matches_prefix(WholeLineToken) is False
+
+
+def test_token_matcher_keeps_order():
+    """Check that the matcher finds the same token class as checking every class in order."""
+    token_classes = [WholeLineToken, PrefixToken, OtherPrefixToken, FallbackToken]
+    matcher = TokenMatcher(token_classes)
+
+    for string in ['A.', 'A.!', 'ABC', 'ABD', 'AB', 'X', '', 'A*C']:
+        expected = [cls for cls in token_classes if cls.string_contains_matching_pattern(string)][0]
+        assert matcher.get_fitting_token_cls(string) == expected
+
+    assert TokenMatcher([PrefixToken]).get_fitting_token_cls('B') is None
+
+
+def test_get_token_matcher_cached():
+    """Check that matchers are only created once for each list of classes and key."""
+    matcher = get_token_matcher([PrefixToken, FallbackToken], 'en')
+    assert get_token_matcher([PrefixToken, FallbackToken], 'en') is matcher
+    assert get_token_matcher([PrefixToken, FallbackToken], 'de') is not matcher
@@ -119,3 +119,41 @@ def test_non_terminal_nested():
         args=[token_sequence([FeatureToken('', None), EOFToken(None)])],
     )
     assert error.non_terminal == non_terminal
+
+
+def test_non_terminal_rule_per_instance():
+    """Check that every instance has its own rule with itself as the parent and that the rule is only created once."""
+    class MyNonTerminal(NonTerminal):
+        criterion_terminal_symbol = TerminalSymbol(EOFToken)
+        rule = Chain([criterion_terminal_symbol, TerminalSymbol(EndOfLineToken)])
+
+    non_terminal_1 = MyNonTerminal()
+    non_terminal_2 = MyNonTerminal()
+    outer_rule = OneOf([non_terminal_1, non_terminal_2])
+
+    assert non_terminal_1.get_clean_rule() is non_terminal_1.get_clean_rule()
+    assert non_terminal_1.get_clean_rule() is not non_terminal_2.get_clean_rule()
+    assert non_terminal_1.get_clean_rule().parent == non_terminal_1
+    assert non_terminal_2.get_clean_rule().children[1].parent == non_terminal_2.get_clean_rule()
+    assert non_terminal_1.parent == outer_rule
+    assert MyNonTerminal.rule.parent is None
+
+
+def test_non_terminal_first_token_classes():
+    """Check that the FIRST set of a non terminal contains every token that it can start with."""
+    class MyNonTerminal(NonTerminal):
+        rule = Chain([
+            Optional(TerminalSymbol(DescriptionToken)),
+            Repeatable(TerminalSymbol(FeatureToken), minimum=0),
+            OneOf([TerminalSymbol(EOFToken), TerminalSymbol(EndOfLineToken)]),
+            TerminalSymbol(DescriptionToken),
+        ])
+
+    class OptionalNonTerminal(NonTerminal):
+        rule = Optional(TerminalSymbol(DescriptionToken))
+
+    non_terminal = MyNonTerminal()
+    assert non_terminal.get_first_token_classes() == {DescriptionToken, FeatureToken, EOFToken, EndOfLineToken}
+    assert non_terminal.accepts_empty_sequence() is False
+    assert OptionalNonTerminal().get_first_token_classes() == {DescriptionToken}
+    assert OptionalNonTerminal().accepts_empty_sequence() is True
@@ -0,0 +1,134 @@
+from gherkin.compiler_base.exception import RuleNotFulfilled, NonTerminalInvalid
+from gherkin.compiler_base.recursive import sequence_memo, get_sequence_memo
+from gherkin.compiler_base.rule.operator import Chain, OneOf, Repeatable, Optional
+from gherkin.compiler_base.symbol.non_terminal import NonTerminal
+from gherkin.compiler_base.symbol.terminal import TerminalSymbol
+from gherkin.compiler_base.wrapper import TokenWrapper
+from gherkin.token import EndOfLineToken, EOFToken, FeatureToken, DescriptionToken
+from test_utils import assert_callable_raises
+
+
+class CustomTokenWrapper(TokenWrapper):
+    def get_place_to_search(self) -> str:
+        return ''
+
+
+class CountingTerminalSymbol(TerminalSymbol):
+    def __init__(self, token_cls):
+        super().__init__(token_cls)
+        self.validated_indexes = []
+
+    def _validate_sequence(self, sequence, index):
+        self.validated_indexes.append(index)
+        return super()._validate_sequence(sequence, index)
+
+
+def test_sequence_memo_validates_once_per_index():
+    """Check that validating and converting a sequence only validates each object once at each index."""
+    eof = CountingTerminalSymbol(EOFToken)
+    rule = Repeatable(OneOf([
+        Chain([eof, TerminalSymbol(FeatureToken)]),
+        Chain([eof, TerminalSymbol(EndOfLineToken)]),
+    ]))
+    sequence = [CustomTokenWrapper(t) for t in [EOFToken(None), EndOfLineToken(None)] * 3]
+
+    # only validate recursively, the predictive parser does not try every child
+    rule.predictive = False
+    output = rule.convert(sequence)
+    assert output == [sequence[0:2], sequence[2:4], sequence[4:6]]
+    assert eof.validated_indexes == [0, 2, 4, 6]
+
+    # the memo is only active while the sequence is handled
+    assert get_sequence_memo(sequence) is None
+
+
+def test_sequence_memo_errors():
+    """Check that memoized errors are raised again and that a memo is only used for its own sequence."""
+    symbol = CountingTerminalSymbol(EOFToken)
+    sequence = [CustomTokenWrapper(EndOfLineToken(None))]
+
+    with sequence_memo(sequence) as memo:
+        assert get_sequence_memo([]) is None
+        assert_callable_raises(memo.validate, RuleNotFulfilled, args=[symbol, 0])
+        assert_callable_raises(memo.validate, RuleNotFulfilled, args=[symbol, 0])
+
+        with sequence_memo(sequence) as inner_memo:
+            assert inner_memo is memo
+
+    assert symbol.validated_indexes == [0]
+
+
+class CountingNonTerminal(NonTerminal):
+    rule = Chain([TerminalSymbol(EOFToken), TerminalSymbol(EndOfLineToken)])
+    convert_cls = list
+
+    def __init__(self):
+        super().__init__()
+        self.converted_indexes = []
+
+    def sequence_to_object(self, sequence, index=0):
+        self.converted_indexes.append(index)
+        return super().sequence_to_object(sequence, index)
+
+
+def test_sequence_memo_builds_objects_while_validating():
+    """Check that converting creates the objects while validating and that parents reuse them."""
+    non_terminal = CountingNonTerminal()
+    rule = Repeatable(OneOf([
+        Chain([non_terminal, TerminalSymbol(FeatureToken)]),
+        Chain([non_terminal, TerminalSymbol(EOFToken)]),
+    ]))
+    sequence = [CustomTokenWrapper(t) for t in [EOFToken(None), EndOfLineToken(None), EOFToken(None)] * 2]
+
+    with sequence_memo(sequence, build_objects=True) as memo:
+        output = rule.convert(sequence)
+        assert output[0][0] is memo.get_object(non_terminal, 0)
+        assert output[1][0] is memo.get_object(non_terminal, 3)
+
+    assert output[0][1] == sequence[2]
+    assert non_terminal.converted_indexes == [0, 3]
+
+
+class PredictedNonTerminal(NonTerminal):
+    criterion_terminal_symbol = TerminalSymbol(FeatureToken)
+    rule = Chain([
+        criterion_terminal_symbol,
+        Optional(TerminalSymbol(DescriptionToken)),
+        TerminalSymbol(EndOfLineToken),
+    ])
+    convert_cls = list
+
+
+def test_predictive_convert(mocker):
+    """Check that the predictive parser creates the same output without validating the objects recursively."""
+    rule = Chain([
+        Repeatable(PredictedNonTerminal(), minimum=0),
+        OneOf([TerminalSymbol(EOFToken), Chain([TerminalSymbol(DescriptionToken), TerminalSymbol(EOFToken)])]),
+    ])
+    tokens = [FeatureToken('', None), DescriptionToken('', None), EndOfLineToken(None), FeatureToken('', None)]
+    sequence = [CustomTokenWrapper(t) for t in tokens + [EndOfLineToken(None), EOFToken(None)]]
+    validate_spy = mocker.spy(TerminalSymbol, '_validate_sequence')
+
+    output = rule.convert(sequence)
+    assert validate_spy.call_count == 0
+
+    rule.predictive = False
+    assert rule.convert(sequence) == output
+    assert validate_spy.call_count > 0
+
+
+def test_predictive_convert_errors():
+    """Check that the errors of an invalid sequence are the same with and without the predictive parser."""
+    rule = Chain([Repeatable(PredictedNonTerminal()), TerminalSymbol(EOFToken)])
+    tokens = [FeatureToken('', None), DescriptionToken('', None), DescriptionToken('', None), EOFToken(None)]
+    errors = []
+
+    for predictive in [True, False]:
+        rule.predictive = predictive
+        try:
+            rule.convert([CustomTokenWrapper(t) for t in tokens])
+        except NonTerminalInvalid as e:
+            errors.append(str(e))
+
+    assert len(errors) == 2
+    assert errors[0] == errors[1]
@@ -0,0 +1,45 @@
+from gherkin.compiler_base.rule.operator import Chain, OneOf, Repeatable, Optional
+from gherkin.compiler_base.state import ParserState
+from gherkin.compiler_base.symbol.terminal import TerminalSymbol
+from gherkin.compiler_base.wrapper import TokenWrapper
+from gherkin.token import EndOfLineToken, EOFToken, FeatureToken, DescriptionToken
+
+
+def wrap(token_cls):
+    return TokenWrapper(token_cls('', None))
+
+
+def test_parser_state_next_token_classes():
+    """Check that the state knows which tokens can come next after each token."""
+    feature = TerminalSymbol(FeatureToken)
+    rule = Chain([
+        Optional(feature),
+        Repeatable(OneOf([TerminalSymbol(DescriptionToken), TerminalSymbol(EndOfLineToken)]), minimum=2),
+        TerminalSymbol(EOFToken),
+    ])
+
+    state = ParserState.for_validator(rule)
+    assert state.get_next_token_classes() == [FeatureToken, DescriptionToken, EndOfLineToken]
+    assert state.get_terminal_symbol(wrap(FeatureToken)) is feature
+
+    state = state.advance(wrap(FeatureToken)).advance(wrap(DescriptionToken))
+    assert state.get_next_token_classes() == [DescriptionToken, EndOfLineToken]
+
+    state = state.advance(wrap(EndOfLineToken))
+    assert state.get_next_token_classes() == [DescriptionToken, EndOfLineToken, EOFToken]
+
+    end_state = state.advance(wrap(EOFToken))
+    assert end_state.is_valid()
+    assert end_state.get_next_token_classes() == []
+    assert end_state.continuations == [()]
+
+    assert not state.advance(wrap(FeatureToken)).is_valid()
+
+
+def test_parser_state_empty_repetition():
+    """Check that a repeated child that does not need any token does not result in an endless loop."""
+    rule = Chain([Repeatable(Chain([Optional(TerminalSymbol(FeatureToken))]), minimum=0), TerminalSymbol(EOFToken)])
+
+    state = ParserState.for_validator(rule)
+    assert state.get_next_token_classes() == [FeatureToken, EOFToken]
+    assert state.advance(wrap(EOFToken)).is_valid()
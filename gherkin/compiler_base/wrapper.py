@@ -6,9 +6,20 @@ class TokenWrapper(object):
     This is a wrapper around any custom token object. It is used to allow rules to get the line_number and the
     text of a token. For this project, the class could be removed, but it is a nice wrapper for future usage.
     """
+    # one terminal symbol for each token class, see `get_terminal_symbol`
+    _terminal_symbols = {}
+
     def __init__(self, token):
         self.token = token
-        self.terminal_symbol = TerminalSymbol(token.__class__)
+        self.terminal_symbol = self.get_terminal_symbol(token.__class__)
+
+    @classmethod
+    def get_terminal_symbol(cls, token_cls) -> TerminalSymbol:
+        """Returns the terminal symbol that represents a token class. It is only created once per class."""
+        if token_cls not in cls._terminal_symbols:
+            cls._terminal_symbols[token_cls] = TerminalSymbol(token_cls)
+
+        return cls._terminal_symbols[token_cls]
 
     def get_place_to_search(self) -> str:
         """Is used by rules to add information where a token can be found."""
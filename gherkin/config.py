@@ -1,12 +1,135 @@
 import json
+import marshal
 import os
+import struct
+import threading
+from collections.abc import Mapping
 
 LANGUAGES_FILE_NAME = 'languages.json'
+LANGUAGES_CACHE_FILE_NAME = 'languages.marshal'
 
 this_file_path = os.path.abspath(__file__).split('/')
 
 folder_path = this_file_path[:len(this_file_path) - 1]
-folder_path.append(LANGUAGES_FILE_NAME)
 
-with open('/'.join(folder_path)) as gherkin_languages:
-    GHERKIN_CONFIG = json.load(gherkin_languages)
+# the size of the index at the start of the cache file
+_INDEX_SIZE_FORMAT = '<I'
+
+
+class GherkinConfig(Mapping):
+    """
+    Holds the keywords of every language in `languages.json`. Languages are only loaded when they are used.
+
+    On first use, the JSON file is converted into a cache file next to it. It starts with an index of all languages
+    and the place of their entries (each marshalled on its own), so only the index and the used languages are read.
+    The cache is created again whenever the JSON file changes. If it cannot be written, the JSON file is used.
+    """
+    def __init__(self, path, cache_path):
+        self.path = path
+        self.cache_path = cache_path
+
+        self._index = None
+        self._languages = {}
+        self._lock = threading.Lock()
+
+    def _get_source_version(self):
+        stat = os.stat(self.path)
+        return [stat.st_mtime_ns, stat.st_size]
+
+    def _load_index(self):
+        """Returns the index of the cache file. It is created if it does not exist or if the JSON file changed."""
+        try:
+            with open(self.cache_path, 'rb') as file:
+                index_size = struct.unpack(_INDEX_SIZE_FORMAT, file.read(struct.calcsize(_INDEX_SIZE_FORMAT)))[0]
+                index = marshal.loads(file.read(index_size))
+
+            if index['source_version'] == self._get_source_version():
+                return index
+        except (OSError, EOFError, ValueError, TypeError, KeyError, struct.error):
+            pass
+
+        return self._create_cache()
+
+    def _create_cache(self):
+        """Converts the JSON file into the cache file and returns its index."""
+        with open(self.path) as file:
+            languages = json.load(file)
+
+        entries = []
+        positions = {}
+        offset = 0
+        for language, config in languages.items():
+            entry = marshal.dumps(config)
+            positions[language] = (offset, len(entry))
+            entries.append(entry)
+            offset += len(entry)
+
+        index = {'source_version': self._get_source_version(), 'languages': positions}
+        index_content = marshal.dumps(index)
+
+        try:
+            # the file is replaced at once so that other processes never read a half written cache
+            temp_path = '{}.{}.{}.tmp'.format(self.cache_path, os.getpid(), threading.get_ident())
+            with open(temp_path, 'wb') as file:
+                file.write(struct.pack(_INDEX_SIZE_FORMAT, len(index_content)))
+                file.write(index_content)
+                file.write(b''.join(entries))
+            os.replace(temp_path, self.cache_path)
+        except OSError:
+            # the cache cannot be written (like in a read only installation), so keep everything in memory
+            self._languages.update(languages)
+            index['languages'] = None
+
+        return index
+
+    @property
+    def index(self):
+        if self._index is None:
+            with self._lock:
+                if self._index is None:
+                    self._index = self._load_index()
+
+        return self._index
+
+    def _get_positions(self):
+        positions = self.index['languages']
+        return positions if positions is not None else self._languages
+
+    def _read_language(self, language):
+        """
+        Reads the entry of a language from the cache file. The index is read again from the same file, in case the
+        file was replaced in the meantime.
+        """
+        header_size = struct.calcsize(_INDEX_SIZE_FORMAT)
+
+        with open(self.cache_path, 'rb') as file:
+            index_size = struct.unpack(_INDEX_SIZE_FORMAT, file.read(header_size))[0]
+            offset, size = marshal.loads(file.read(index_size))['languages'][language]
+            file.seek(header_size + index_size + offset)
+            return marshal.loads(file.read(size))
+
+    def __getitem__(self, language) -> dict:
+        if language not in self._languages:
+            if language not in self:
+                raise KeyError(language)
+
+            with self._lock:
+                if language not in self._languages:
+                    self._languages[language] = self._read_language(language)
+
+        return self._languages[language]
+
+    def __contains__(self, language):
+        return language in self._get_positions()
+
+    def __iter__(self):
+        return iter(self._get_positions())
+
+    def __len__(self):
+        return len(self._get_positions())
+
+
+GHERKIN_CONFIG = GherkinConfig(
+    '/'.join(folder_path + [LANGUAGES_FILE_NAME]),
+    '/'.join(folder_path + [LANGUAGES_CACHE_FILE_NAME]),
+)
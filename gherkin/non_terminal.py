@@ -136,14 +136,12 @@ class DataTableNonTerminal(NonTerminal):
     def get_minimal_sequence(cls):
         return [DataTableToken, EndOfLineToken, DataTableToken, EndOfLineToken]
 
-    def _validate_sequence(self, sequence, index):
+    def validate_sequence_area(self, sequence, start_index, end_index):
         """Make sure that every row has the same amount of columns."""
-        old_index = index
-        new_index = super()._validate_sequence(sequence, index)
         nmb_columns = None
 
         # for through each token that belongs to the data table
-        for token_wrapper in sequence[old_index:new_index]:
+        for token_wrapper in sequence[start_index:end_index]:
             # get the token
             data_table_token = token_wrapper.token
 
@@ -168,8 +166,6 @@ class DataTableNonTerminal(NonTerminal):
                     suggested_tokens=[],
                 )
 
-        return new_index
-
     @classmethod
     def get_datatable_values(cls, string):
         """Returns all the values inside of a given string."""
@@ -371,7 +367,7 @@ class StepsNonTerminal(NonTerminal):
 class ScenarioDefinitionNonTerminal(NonTerminal):
     description_index = 2
 
-    def _validate_sequence(self, sequence, index):
+    def validate_sequence_area(self, sequence, start_index, end_index):
         """
         In scenarios it is not valid to use the same text more than once.
 
@@ -380,13 +376,11 @@ class ScenarioDefinitionNonTerminal(NonTerminal):
 
         => https://cucumber.io/docs/gherkin/reference/
         """
-        new_index = super()._validate_sequence(sequence, index)
-
         # first get all descriptions that follow GIVEN, WHEN, THEN, AND or BUT since they hold the text
         descriptions = []
-        for i, token_wrapper in enumerate(sequence[index:new_index]):
+        for i, token_wrapper in enumerate(sequence[start_index:end_index]):
             if isinstance(token_wrapper.token, (GivenToken, WhenToken, ThenToken, AndToken, ButToken)):
-                descriptions.append(sequence[index + i + 1])
+                descriptions.append(sequence[start_index + i + 1])
 
         # extract all the texts
         texts = [d.token.text_without_pattern for d in descriptions]
@@ -400,8 +394,6 @@ class ScenarioDefinitionNonTerminal(NonTerminal):
                     suggested_tokens=[],
                 )
 
-        return new_index
-
     def get_convert_kwargs(self, rule_output):
         name, description = rule_output[self.description_index]
 
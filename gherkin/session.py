@@ -0,0 +1,223 @@
+from gherkin.ast import Comment as ASTComment, Background, Rule, Scenario, ScenarioOutline
+from gherkin.compiler_base.exception import NonTerminalInvalid, NonTerminalNotUsed, RuleNotFulfilled, \
+    SequenceNotFinished
+from gherkin.non_terminal import BackgroundNonTerminal, RuleNonTerminal, ScenarioNonTerminal, \
+    ScenarioOutlineNonTerminal, FeatureNonTerminal
+from gherkin.token import BackgroundToken, RuleToken, ScenarioToken, ScenarioOutlineToken, TagToken, CommentToken, \
+    EmptyToken
+
+
+class DocumentBlock(object):
+    """
+    A part of a parsed document that can be parsed on its own: a Background, a Scenario, a Scenario Outline or a
+    Rule. It starts with its tags and ends before the next block that is not inside of it.
+    """
+    NON_TERMINALS = {
+        Background: BackgroundNonTerminal,
+        Scenario: ScenarioNonTerminal,
+        ScenarioOutline: ScenarioOutlineNonTerminal,
+        Rule: RuleNonTerminal,
+    }
+
+    def __init__(self, ast_object, start_line_index, header_line_index, rule=None):
+        self.ast_object = ast_object
+        self.start_line_index = start_line_index
+        self.header_line_index = header_line_index
+        self.end_line_index = None
+        self.rule = rule
+
+    def get_non_terminal_classes(self):
+        """Returns the classes of the non terminals that lead to the non terminal of this block in the grammar."""
+        if self.rule is not None:
+            return [FeatureNonTerminal, RuleNonTerminal, self.NON_TERMINALS[self.ast_object.__class__]]
+
+        return [FeatureNonTerminal, self.NON_TERMINALS[self.ast_object.__class__]]
+
+    def contains_lines(self, first_line_index, last_line_index):
+        """Checks if all the lines between the indexes are in this block after its keyword (like `Scenario:`)."""
+        return self.header_line_index < first_line_index and last_line_index <= self.end_line_index
+
+    def replace_ast_object(self, feature, ast_object):
+        """Replaces the object of this block in the AST of the feature with the given one."""
+        old_object = self.ast_object
+        parent = self.rule or feature
+        ast_object.parent = old_object.parent
+
+        if isinstance(old_object, Background):
+            parent.background = ast_object
+        elif isinstance(parent, Rule):
+            parent.scenario_definitions[parent.scenario_definitions.index(old_object)] = ast_object
+        else:
+            parent.children[parent.children.index(old_object)] = ast_object
+
+        self.ast_object = ast_object
+
+
+class EditorSession(object):
+    """
+    Compiles a Gherkin document while it is edited. When the text changes, only the changed lines are tokenized
+    again. When the document is parsed, only the Scenario, Background or Rule that encloses the changed lines is
+    parsed again (if the change stays inside of it). In every other case, the whole document is parsed.
+    """
+    HEADER_TOKENS = (BackgroundToken, RuleToken, ScenarioToken, ScenarioOutlineToken)
+
+    def __init__(self, compiler):
+        self.compiler = compiler
+        # the lexer remembers the tokens of each line, so it must not be used by anything else
+        self.lexer = compiler.lexer_class(compiler)
+        self.parser = compiler.parser_class(compiler)
+
+        self.text_lines = None
+        self.tokens = []
+        self.ast = None
+        self._blocks = []
+
+        # the lines that changed since the last parse: [first, last) in the current text and the number of
+        # lines that were added since then
+        self._changed_lines = None
+
+    def update(self, text):
+        """Updates the text of the document and returns its tokens. The changed lines are searched by comparing."""
+        text_lines = text.splitlines()
+
+        if self.text_lines is None:
+            return self.update_lines(text, 0, len(text_lines))
+
+        first_line_index = 0
+        max_unchanged_lines = min(len(text_lines), len(self.text_lines))
+        while first_line_index < max_unchanged_lines \
+                and text_lines[first_line_index] == self.text_lines[first_line_index]:
+            first_line_index += 1
+
+        unchanged_lines_at_end = 0
+        while unchanged_lines_at_end < max_unchanged_lines - first_line_index \
+                and text_lines[-unchanged_lines_at_end - 1] == self.text_lines[-unchanged_lines_at_end - 1]:
+            unchanged_lines_at_end += 1
+
+        return self.update_lines(text, first_line_index, len(text_lines) - unchanged_lines_at_end)
+
+    def update_lines(self, text, first_line_index, last_line_index):
+        """
+        Updates the text of the document where only the lines from `first_line_index` up to (excluding)
+        `last_line_index` of the new text changed. Returns the tokens of the document.
+        """
+        text_lines = text.splitlines()
+
+        if self.text_lines is None:
+            self.tokens = self.lexer.tokenize(text)
+            self.text_lines = text_lines
+            return self.tokens
+
+        line_shift = len(text_lines) - len(self.text_lines)
+        self.tokens = self.lexer.retokenize(text, first_line_index, last_line_index)
+        self.text_lines = text_lines
+
+        # merge the lines with the ones that changed before
+        if self._changed_lines is not None:
+            changed_first, changed_last, changed_shift = self._changed_lines
+            first_line_index = min(first_line_index, changed_first)
+            last_line_index = max(last_line_index, changed_last + line_shift)
+            line_shift += changed_shift
+        self._changed_lines = (first_line_index, last_line_index, line_shift)
+
+        return self.tokens
+
+    def parse(self):
+        """Parses the document and returns its AST. May raise a GherkinInvalid like the compiler."""
+        if self.ast is None or self._changed_lines is None or not self._parse_changed_block():
+            self.ast = None
+            self._blocks = []
+            self._changed_lines = None
+
+            self.ast = self.compiler.use_parser(self.tokens)
+
+        self._changed_lines = None
+        self._blocks = self.get_blocks()
+        return self.ast
+
+    def _parse_changed_block(self):
+        """Parses the block with the changed lines again. Returns False if the whole document must be parsed."""
+        first_line_index, last_line_index, line_shift = self._changed_lines
+        if first_line_index == last_line_index and line_shift == 0:
+            return True
+
+        for block in reversed(self._blocks):
+            if not block.contains_lines(first_line_index, last_line_index - line_shift):
+                continue
+
+            tokens = [
+                token
+                for tokens_in_line in self.lexer.tokens_by_line[
+                    block.start_line_index:block.end_line_index + line_shift
+                ]
+                for token in tokens_in_line
+            ]
+            non_terminal = self.parser.get_grammar().get_non_terminal(block.get_non_terminal_classes())
+
+            try:
+                ast_object = self.parser.parse_area(tokens, non_terminal)
+            except (RuleNotFulfilled, NonTerminalNotUsed, NonTerminalInvalid, SequenceNotFinished):
+                return False
+
+            block.replace_ast_object(self.ast.feature, ast_object)
+
+            self.ast.comments = []
+            for token in self.tokens:
+                if isinstance(token, CommentToken):
+                    self.ast.add_comment(ASTComment(token.lexeme))
+
+            return True
+
+        return False
+
+    def get_blocks(self):
+        """Returns the blocks of the parsed document in the order of the document."""
+        feature = self.ast.feature if self.ast is not None else None
+        if feature is None:
+            return []
+
+        # the objects of the blocks in the order of the document
+        ast_objects = [(feature.background, None)] if feature.background else []
+        for child in feature.children:
+            ast_objects.append((child, None))
+
+            if isinstance(child, Rule):
+                if child.background:
+                    ast_objects.append((child.background, child))
+                ast_objects += [(scenario_definition, child) for scenario_definition in child.scenario_definitions]
+
+        blocks = []
+        tokens_by_line = self.lexer.tokens_by_line
+        start_line_index = None
+
+        for index, tokens_in_line in enumerate(tokens_by_line):
+            first_token = tokens_in_line[0]
+
+            # the tags belong to the next block, comments and empty lines between them too
+            if isinstance(first_token, TagToken) and start_line_index is None:
+                start_line_index = index
+            elif not isinstance(first_token, (TagToken, CommentToken, EmptyToken)):
+                if isinstance(first_token, self.HEADER_TOKENS):
+                    # the document was valid, so there must be an object for each block
+                    if len(blocks) == len(ast_objects):
+                        return []
+
+                    ast_object, rule = ast_objects[len(blocks)]
+                    start_line_index = start_line_index if start_line_index is not None else index
+                    blocks.append(DocumentBlock(ast_object, start_line_index, index, rule=rule))
+
+                start_line_index = None
+
+        if len(blocks) != len(ast_objects):
+            return []
+
+        # a block ends where the next block that is not inside of it starts
+        for index, block in enumerate(blocks):
+            block.end_line_index = len(tokens_by_line)
+
+            for next_block in blocks[index + 1:]:
+                if not isinstance(block.ast_object, Rule) or next_block.rule is None:
+                    block.end_line_index = next_block.start_line_index
+                    break
+
+        return blocks
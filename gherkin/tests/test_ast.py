@@ -154,6 +154,7 @@ def test_data_table():
     assert dt.get_row_at(0) == tr2
     assert dt.get_row_at(1) == tr3
     assert dt.get_values() == {'header1': ['val3', 'val5'], 'header2': ['val4', 'val6']}
+    assert dt.get_column_values(1) == ['val4', 'val6']
 
 
 def test_examples():
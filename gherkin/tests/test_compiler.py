@@ -1,9 +1,11 @@
-from core.constants import Languages
-from gherkin.compiler import GherkinLexer, GherkinParser
+from core.constants import Languages, GenerationType
+from gherkin.compiler import GherkinLexer, GherkinParser, GherkinToPyTestCodeGenerator
 from gherkin.compiler_base.line import Line
+from gherkin.compiler_base.state import ParserState
 from gherkin.exception import GherkinInvalid
 from gherkin.token import LanguageToken, EOFToken, EndOfLineToken, EmptyToken, CommentToken, RuleToken
 from gherkin.ast import Comment
+from nlp.generate.context import GenerationContext
 from settings import Settings
 from test_utils import assert_callable_raises
 
@@ -29,6 +31,27 @@ def test_gherkin_lexer_end_of_tokens():
     assert isinstance(tokens[5], EndOfLineToken)
 
 
+def test_gherkin_lexer_retokenize():
+    """Check that only the changed lines are tokenized again and that the other tokens are moved."""
+    lexer = GherkinLexer(None)
+    tokens = lexer.tokenize('# language: de\nFunktionalität: a\n  Szenario: b\n  # c')
+    scenario_token = tokens[5]
+
+    new_tokens = lexer.retokenize('# language: de\nFunktionalität: a\n\n  Gegeben sei x\n  Szenario: b\n  # c', 2, 4)
+    assert [t.__class__ for t in new_tokens] == [t.__class__ for t in GherkinLexer(None).tokenize(
+        '# language: de\nFunktionalität: a\n\n  Gegeben sei x\n  Szenario: b\n  # c'
+    )]
+    assert new_tokens[10] is scenario_token
+    assert scenario_token.line.line_index == 4
+    assert len(lexer.tokens_by_line) == 6
+    assert Settings.language == Languages.DE
+
+    # the language is in the first line, so the whole text is tokenized again
+    new_tokens = lexer.retokenize('Feature: a\n\n  Given x\n  Scenario: b\n  # c', 0, 1)
+    assert scenario_token not in new_tokens
+    assert Settings.language == Languages.EN
+
+
 def test_parser_prepare_tokens():
     """Check that comments and empty lines are removed in preparation in parser."""
     parser = GherkinParser(None)
@@ -49,6 +72,32 @@ def test_parser_prepare_tokens():
     assert isinstance(trimmed_tokens[3], EOFToken)
 
 
+def test_parser_state_accepts_tokens(mocker):
+    """Check that the parser knows which tokens can follow a state and saves the results while the tokens stay."""
+    parser = GherkinParser(None)
+    tokens = parser.prepare_tokens(GherkinLexer(None).tokenize(
+        'Feature: Orders\n  Scenario: First\n    Given an order\n    Then it exists\n'
+    ))
+    state = parser.get_state(tokens[:3])
+    advance_spy = mocker.spy(ParserState, 'advance')
+
+    assert parser.state_accepts_tokens(state, tokens[3:])
+    assert advance_spy.call_count == len(tokens) - 3
+    assert parser.state_accepts_tokens(state, tokens[3:])
+    assert advance_spy.call_count == len(tokens) - 3
+
+    # another document ends in the same way, so the tokens at its end are not validated again
+    other_tokens = parser.prepare_tokens(GherkinLexer(None).tokenize(
+        'Feature: Orders\n  Scenario: Second\n    Given an order\n    And a user\n    Then it exists\n'
+    ))
+    advance_spy.reset_mock()
+    assert parser.state_accepts_tokens(parser.get_state(other_tokens[:3]), other_tokens[3:])
+    assert advance_spy.call_count < len(other_tokens)
+
+    assert not parser.state_accepts_tokens(state, tokens[4:])
+    assert not parser.state_accepts_tokens(state, tokens[3:-1])
+
+
 def test_parser_create_ast():
     """Check that all comments are added to the ast at the end of the creation."""
     class MockAst:
@@ -70,3 +119,19 @@ def test_parser_create_ast():
     ast = parser.prepare_ast(MockAst())
     assert len(ast.comments) == 1
     assert isinstance(ast.comments[0], Comment)
+
+
+def test_code_generator_scenarios_in_order(mocker):
+    """Check that scenarios that are generated by multiple threads are returned in their original order."""
+    mocker.patch.object(Settings, 'SCENARIO_THREADS', 4)
+    generator = GherkinToPyTestCodeGenerator(None)
+    generate_mock = mocker.patch.object(
+        generator,
+        'generate_scenario',
+        side_effect=lambda scenario, index, context: (scenario, index, context),
+    )
+    context = GenerationContext(Languages.EN, None, GenerationType.PY_TEST)
+
+    results = generator.generate_scenarios(['a', 'b', 'c', 'd', 'e'], context)
+    assert results == [(s, i, context) for i, s in enumerate(['a', 'b', 'c', 'd', 'e'])]
+    assert generate_mock.call_count == 5
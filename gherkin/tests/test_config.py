@@ -0,0 +1,52 @@
+import json
+import os
+
+from gherkin.config import GherkinConfig
+
+
+def write_languages(path, languages):
+    with open(path, 'w') as file:
+        json.dump(languages, file)
+
+
+def test_gherkin_config_loads_used_languages(tmp_path):
+    """Check that the cache is created on first use and that only the used languages are loaded."""
+    path = tmp_path / 'languages.json'
+    cache_path = tmp_path / 'languages.marshal'
+    write_languages(path, {'en': {'given': ['Given ']}, 'de': {'given': ['Angenommen ']}})
+
+    config = GherkinConfig(str(path), str(cache_path))
+    assert 'de' in config
+    assert 'fr' not in config
+    assert cache_path.exists()
+    assert config['de'] == {'given': ['Angenommen ']}
+    assert list(config._languages) == ['de']
+
+    # another config can use the cache without the json file
+    other_config = GherkinConfig(str(path), str(cache_path))
+    assert sorted(other_config) == ['de', 'en']
+    assert other_config['en'] == {'given': ['Given ']}
+
+
+def test_gherkin_config_json_changed(tmp_path):
+    """Check that the cache is created again if the json file changes."""
+    path = tmp_path / 'languages.json'
+    cache_path = tmp_path / 'languages.marshal'
+    write_languages(path, {'en': {'given': ['Given ']}})
+    GherkinConfig(str(path), str(cache_path))['en']
+
+    write_languages(path, {'en': {'given': ['Given ', 'Assuming ']}, 'fr': {'given': ['Soit ']}})
+    os.utime(path, ns=(0, 0))
+    config = GherkinConfig(str(path), str(cache_path))
+    assert config['en'] == {'given': ['Given ', 'Assuming ']}
+    assert config['fr'] == {'given': ['Soit ']}
+
+
+def test_gherkin_config_without_cache(tmp_path):
+    """Check that the json file is used if the cache cannot be written."""
+    path = tmp_path / 'languages.json'
+    write_languages(path, {'en': {'given': ['Given ']}})
+
+    config = GherkinConfig(str(path), str(tmp_path / 'missing' / 'languages.marshal'))
+    assert len(config) == 1
+    assert config['en'] == {'given': ['Given ']}
@@ -0,0 +1,82 @@
+from gherkin.ast import Rule
+from gherkin.compiler import GherkinToPyTestCompiler
+from gherkin.compiler_base.compiler import Parser
+from gherkin.exception import GherkinInvalid
+from gherkin.session import EditorSession
+from test_utils import assert_callable_raises
+
+FEATURE_TEXT = """Feature: Orders
+  Background:
+    Given a user
+
+  @tag
+  Rule: First rule
+    Scenario: First
+      Given an order
+      Then it exists
+
+  Rule: Second rule
+    Scenario: Second
+      When I do it
+      Then it works
+"""
+
+
+def get_session():
+    session = EditorSession(GherkinToPyTestCompiler())
+    session.update(FEATURE_TEXT)
+    session.parse()
+    return session
+
+
+def test_editor_session_blocks():
+    """Check that the session finds the lines of each scenario definition and rule."""
+    blocks = get_session().get_blocks()
+    assert [(b.start_line_index, b.header_line_index, b.end_line_index) for b in blocks] == [
+        (1, 1, 4), (4, 5, 10), (6, 6, 10), (10, 10, 14), (11, 11, 14),
+    ]
+    assert isinstance(blocks[4].rule, Rule)
+    assert blocks[4].ast_object.name == ' Second'
+
+
+def test_editor_session_parse_changed_block(mocker):
+    """Check that only the scenario with the changed lines is parsed again."""
+    session = get_session()
+    feature = session.ast.feature
+    first_rule, second_rule = feature.children
+    parse_area_spy = mocker.spy(Parser, 'parse_area')
+    use_parser_spy = mocker.spy(GherkinToPyTestCompiler, 'use_parser')
+
+    text = FEATURE_TEXT.replace('      Then it exists', '      And it is new\n      Then it exists')
+    session.update(text)
+    ast = session.parse()
+    assert parse_area_spy.call_count == 1
+    assert use_parser_spy.call_count == 0
+    assert ast.feature is feature
+    scenario = first_rule.scenario_definitions[0]
+    assert [step.text for step in scenario.steps[0].sub_steps] == ['it is new']
+    assert scenario.parent is first_rule
+    assert scenario.tags[0].name == 'tag'
+
+    # the lines after the change were moved, so the scenario in the other rule is found too
+    session.update(text.replace('Then it works', 'Then it still works'))
+    session.parse()
+    assert parse_area_spy.call_count == 2
+    assert second_rule.scenario_definitions[0].steps[1].text == 'it still works'
+    assert second_rule.scenario_definitions[0].parent is second_rule
+
+
+def test_editor_session_parse_document(mocker):
+    """Check that the whole document is parsed if the structure changes or the block became invalid."""
+    session = get_session()
+    use_parser_spy = mocker.spy(GherkinToPyTestCompiler, 'use_parser')
+
+    text = FEATURE_TEXT.replace('Rule: First rule', 'Rule: Other rule')
+    session.update(text)
+    assert session.parse().feature.children[0].name == ' Other rule'
+    assert use_parser_spy.call_count == 1
+
+    text = text.replace('      Then it exists', '      Rule: x')
+    session.update(text)
+    assert_callable_raises(session.parse, GherkinInvalid)
+    assert use_parser_spy.call_count == 2
@@ -0,0 +1,107 @@
+import os
+
+import pytest
+
+from gherkin.compiler import GherkinLexer, GherkinParser
+from gherkin.compiler_base.exception import NonTerminalInvalid, NonTerminalNotUsed
+from gherkin.compiler_base.line import Line
+from gherkin.non_terminal import ExamplesNonTerminal, GivenNonTerminal, WhenNonTerminal, ThenNonTerminal, \
+    ScenarioOutlineNonTerminal, ScenarioNonTerminal, BackgroundNonTerminal, RuleNonTerminal, FeatureNonTerminal
+from gherkin.token import GivenToken, WhenToken, ThenToken, ScenarioToken, ScenarioOutlineToken, FeatureToken, \
+    ExamplesToken, RuleToken, BackgroundToken, EOFToken
+from gherkin import utils
+from gherkin.utils import get_token_suggestion_after_line, get_indent_level_for_next_line
+
+VALID_FEATURE_FILES_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'valid_feature_files')
+FEATURE_PATHS_VALID = [
+    os.path.join(VALID_FEATURE_FILES_PATH, name) for name in sorted(os.listdir(VALID_FEATURE_FILES_PATH))
+]
+
+FEATURE_TEXT = """Feature: Orders
+  Scenario: First
+    Given an order
+
+    Then it exists
+
+"""
+
+
+def get_token_suggestion_by_parsing(sequence, line_index):
+    """Returns the suggestions for a line by parsing the document with each of them."""
+    suggested_non_terminals = [
+        [GivenNonTerminal],
+        [WhenNonTerminal],
+        [ThenNonTerminal],
+        [ScenarioNonTerminal],
+        [ExamplesNonTerminal],
+        [ScenarioOutlineNonTerminal],
+        [BackgroundNonTerminal, ScenarioNonTerminal],
+        [GivenNonTerminal, ScenarioNonTerminal],
+        [RuleNonTerminal],
+        [FeatureNonTerminal],
+    ]
+    tokens_before_line = [t.copy() for t in sequence if t.line.line_index < line_index]
+    tokens_after_line = [
+        t.copy() for t in sequence if t.line.line_index > line_index or isinstance(t, EOFToken)
+    ]
+    suggestions = []
+
+    for non_terminals in suggested_non_terminals:
+        token_sequence = [
+            token_cls('', Line('', line_index))
+            for non_terminal in non_terminals
+            for token_cls in non_terminal.get_minimal_sequence()
+        ]
+
+        try:
+            GherkinParser(None).parse(tokens_before_line + token_sequence + tokens_after_line)
+        except (NonTerminalInvalid, NonTerminalNotUsed):
+            continue
+
+        suggestions.append(non_terminals[0].criterion_terminal_symbol.token_cls)
+
+    return suggestions
+
+
+def test_token_suggestion_after_line(mocker):
+    """Check the suggestions for some lines without parsing the whole document for any of them."""
+    parse_spy = mocker.spy(GherkinParser, 'parse')
+    tokens = GherkinLexer(None).tokenize(FEATURE_TEXT)
+
+    assert get_token_suggestion_after_line(tokens, 0) == [FeatureToken]
+    assert get_token_suggestion_after_line(tokens, 1) == [ScenarioToken, BackgroundToken, RuleToken]
+    # the line after the new line must still be valid
+    assert get_token_suggestion_after_line(tokens, 3) == [GivenToken, WhenToken, ThenToken, ScenarioToken, GivenToken]
+    assert get_token_suggestion_after_line(tokens, 5) == [ThenToken, ScenarioToken, ScenarioOutlineToken]
+    assert ExamplesToken not in get_token_suggestion_after_line(tokens, 4)
+    assert parse_spy.call_count == 0
+
+
+@pytest.mark.parametrize('feature_path', FEATURE_PATHS_VALID)
+def test_token_suggestion_after_line_same_as_parsing(feature_path):
+    """Check that the suggestions are the same as if the document was parsed with each of them."""
+    with open(feature_path) as file:
+        tokens = GherkinLexer(None).tokenize(file.read())
+
+    for line_index in range(tokens[-1].line.line_index + 1):
+        assert get_token_suggestion_after_line(tokens, line_index) == get_token_suggestion_by_parsing(
+            tokens, line_index)
+
+
+def test_indent_level_for_next_line():
+    """Check that the indent of new lines is determined by the suggestions."""
+    tokens = GherkinLexer(None).tokenize(FEATURE_TEXT)
+
+    assert get_indent_level_for_next_line(tokens, 0, FeatureToken('', None)) == 0
+    assert get_indent_level_for_next_line(tokens, 1, ScenarioToken('', None)) == 1
+    assert get_indent_level_for_next_line(tokens, 3, GivenToken('', None)) == 2
+    assert get_indent_level_for_next_line(tokens, 5, ScenarioToken('', None)) == 1
+
+
+def test_indent_level_for_next_line_checks_needed_suggestions(mocker):
+    """Check that the indent only checks the suggestions until one that starts like the filter token is valid."""
+    suggestion_spy = mocker.spy(utils, '_suggestion_is_valid')
+    tokens = GherkinLexer(None).tokenize(FEATURE_TEXT)
+
+    assert get_indent_level_for_next_line(tokens, 3, ThenToken('', None)) == 2
+    assert suggestion_spy.call_count == 1
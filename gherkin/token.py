@@ -7,21 +7,30 @@ from gherkin.compiler_base.line import Line
 from settings import Settings
 
 
+# the patterns of the token classes for each language, see `GherkinToken.get_patterns`
+_patterns_by_language = {}
+
+
 class GherkinToken(Token):
     color = None
     _json_id = None
 
     @classmethod
     def get_patterns(cls):
-        try:
-            keywords = GHERKIN_CONFIG[Settings.language][cls._json_id]
+        key = (cls, Settings.language)
+
+        if key not in _patterns_by_language:
+            try:
+                keywords = GHERKIN_CONFIG[Settings.language][cls._json_id]
 
-            if cls.pattern_with_colon:
-                return ['{}:'.format(k) for k in keywords]
+                if cls.pattern_with_colon:
+                    keywords = ['{}:'.format(k) for k in keywords]
+            except KeyError:
+                keywords = []
 
-            return keywords
-        except KeyError:
-            return []
+            _patterns_by_language[key] = keywords
+
+        return _patterns_by_language[key]
 
     def get_meta_data_for_sequence(self, sequence):
         return {'color': self.color}
@@ -125,6 +134,7 @@ class ButToken(GherkinToken):
 class TagToken(TokenContainsWholeLineMixin, GherkinToken):
     color = '#c0392b'
     REG_EX = '@[a-zA-Z0-9_.-]+'
+    _compiled_reg_ex = re.compile('^{tag_pattern}$'.format(tag_pattern=REG_EX))
 
     @classmethod
     def get_patterns(cls):
@@ -132,10 +142,12 @@ class TagToken(TokenContainsWholeLineMixin, GherkinToken):
 
     @classmethod
     def string_matches_pattern(cls, string, pattern):
-        return bool(re.match('^{tag_pattern}$'.format(tag_pattern=cls.REG_EX), string))
+        return bool(cls._compiled_reg_ex.match(string))
 
 
 class TagsToken(TokenContainsWholeLineMixin, GherkinToken):
+    _compiled_reg_ex = re.compile('^{tag_pattern}( {tag_pattern})*$'.format(tag_pattern=TagToken.REG_EX))
+
     def __new__(cls, text, line):
         output = []
 
@@ -151,7 +163,7 @@ class TagsToken(TokenContainsWholeLineMixin, GherkinToken):
 
     @classmethod
     def string_matches_pattern(cls, string: str, pattern):
-        return bool(re.match('^{tag_pattern}( {tag_pattern})*$'.format(tag_pattern=TagToken.REG_EX), string))
+        return bool(cls._compiled_reg_ex.match(string))
 
     @classmethod
     def get_patterns(cls):
@@ -1,9 +1,11 @@
 from gherkin.compiler import GherkinParser
-from gherkin.compiler_base.exception import NonTerminalInvalid, NonTerminalNotUsed
+from gherkin.compiler_base.exception import NonTerminalInvalid, NonTerminalNotUsed, RuleNotFulfilled, \
+    SequenceNotFinished
 from gherkin.compiler_base.line import Line
 from gherkin.non_terminal import ExamplesNonTerminal, GivenNonTerminal, WhenNonTerminal, ThenNonTerminal, \
     ScenarioOutlineNonTerminal, ScenarioNonTerminal, BackgroundNonTerminal, RuleNonTerminal, FeatureNonTerminal
-from gherkin.token import EndOfLineToken, EOFToken
+from gherkin.token import EndOfLineToken, EOFToken, BackgroundToken, RuleToken, ScenarioToken, \
+    ScenarioOutlineToken, TagToken
 
 
 def get_sequence_as_lines(sequence):
@@ -27,71 +29,171 @@ def get_sequence_as_lines(sequence):
     return sequence_by_line
 
 
-def get_token_suggestion_after_line(sequence, line_index, return_full_sequence=False):
+def _suggestion_is_valid(parser, state, token_sequence, tokens_after_line):
     """
-    Returns a list of tokens that can come after a given line.
+    Checks if the parser can continue with the tokens of a suggestion at the given state and with the tokens after
+    the line.
+    """
+    for token in token_sequence:
+        token_wrapper = parser.token_wrapper_cls(token=token)
 
-    :argument: sequence [Token] - a list of tokens that are already present in the document
-    :argument: line_index int - the line after that index will be checked
-    :argument: return_full_sequence bool - returns the whole sequence that makes something valid; if false only the
-                                           first token of that sequence is returned
+        # the new tokens get the same information as if they were parsed
+        terminal_symbol = state.get_terminal_symbol(token_wrapper)
+        if terminal_symbol is None:
+            return False
+
+        terminal_symbol.on_token_wrapper_valid(token_wrapper)
+        state = state.advance(token_wrapper)
+
+    return parser.state_accepts_tokens(state, tokens_after_line)
+
+
+# the non terminals of the blocks that validate more than their rules (like the texts of their steps)
+_BLOCK_NON_TERMINALS = {
+    BackgroundToken: BackgroundNonTerminal,
+    ScenarioToken: ScenarioNonTerminal,
+    ScenarioOutlineToken: ScenarioOutlineNonTerminal,
+}
+_BLOCK_HEADER_TOKENS = (BackgroundToken, RuleToken, ScenarioToken, ScenarioOutlineToken)
+
+
+def _get_block_start(tokens, header_index):
+    """Returns the index where the block of the header at the given index starts - the tags belong to the block."""
+    start_index = header_index
+
+    while start_index > 1 and isinstance(tokens[start_index - 1], EndOfLineToken) \
+            and isinstance(tokens[start_index - 2], TagToken):
+        start_index -= 2
+        while start_index > 0 and isinstance(tokens[start_index - 1], TagToken):
+            start_index -= 1
+
+    return start_index
+
+
+def _blocks_are_valid(parser, tokens_before_line, token_sequence, tokens_after_line):
     """
-    sequence = [token.copy() for token in sequence]
+    Checks if the blocks (a Background, a Scenario or a Scenario Outline) that contain the tokens of a suggestion
+    are valid. The state of the parser only knows the rules of the grammar, but non terminals like the one of
+    a Scenario validate more (see `NonTerminal.validate_sequence_area`). So those blocks are parsed on their own.
+    """
+    start_index = 0
+    for index in range(len(tokens_before_line) - 1, -1, -1):
+        if isinstance(tokens_before_line[index], _BLOCK_HEADER_TOKENS):
+            start_index = _get_block_start(tokens_before_line, index)
+            break
+
+    end_index = len(tokens_after_line)
+    for index, token in enumerate(tokens_after_line):
+        if isinstance(token, _BLOCK_HEADER_TOKENS):
+            end_index = _get_block_start(tokens_after_line, index)
+            break
+        if isinstance(token, EOFToken):
+            end_index = index
+            break
 
+    area = tokens_before_line[start_index:] + token_sequence + tokens_after_line[:end_index]
+    in_rule = any(isinstance(tokens_before_line[index], RuleToken) for index in range(start_index))
+    grammar = parser.get_grammar()
+
+    header_indexes = [index for index, token in enumerate(area) if isinstance(token, _BLOCK_HEADER_TOKENS)]
+    block_starts = [_get_block_start(area, index) for index in header_indexes] + [len(area)]
+
+    for header_index, block_start, block_end in zip(header_indexes, block_starts, block_starts[1:]):
+        header = area[header_index]
+        in_rule = in_rule or isinstance(header, RuleToken)
+
+        non_terminal_cls = _BLOCK_NON_TERMINALS.get(header.__class__)
+        if non_terminal_cls is None:
+            continue
+
+        if in_rule:
+            non_terminal = grammar.get_non_terminal([FeatureNonTerminal, RuleNonTerminal, non_terminal_cls])
+        else:
+            non_terminal = grammar.get_non_terminal([FeatureNonTerminal, non_terminal_cls])
+
+        try:
+            parser.parse_area(area[block_start:block_end], non_terminal)
+        except (NonTerminalInvalid, NonTerminalNotUsed, RuleNotFulfilled, SequenceNotFinished):
+            return False
+
+    return True
+
+
+def _get_valid_suggestions(sequence, line_index, first_token_cls=None):
+    """
+    Yields the non terminals that can come after a given line with the tokens of their minimal sequence. The
+    suggestions are only checked as far as they are used (see `get_token_suggestion_after_line`).
+
+    :argument: first_token_cls - if given, the suggestions that start with a token of this class come first
+    """
     suggested_non_terminals = [
-        GivenNonTerminal,
-        WhenNonTerminal,
-        ThenNonTerminal,
-        ScenarioNonTerminal,
-        ExamplesNonTerminal,
-        ScenarioOutlineNonTerminal,
+        [GivenNonTerminal],
+        [WhenNonTerminal],
+        [ThenNonTerminal],
+        [ScenarioNonTerminal],
+        [ExamplesNonTerminal],
+        [ScenarioOutlineNonTerminal],
         # next two cases are needed to enable autocomplete of Background since it always needs scenarios
         [BackgroundNonTerminal, ScenarioNonTerminal],
         [GivenNonTerminal, ScenarioNonTerminal],
-        RuleNonTerminal,
-        FeatureNonTerminal,
+        [RuleNonTerminal],
+        [FeatureNonTerminal],
     ]
-    valid_suggestions = []
 
+    parser = GherkinParser(None)
     tokens_before_line = []
-    tokens_after_and_in_line = []
+    tokens_after_line = []
 
-    for token in sequence:
+    for token in parser.prepare_tokens(sequence):
         token_line_index = token.line.line_index
 
-        # remove any token that already exists in that line
-        if token_line_index == line_index and not isinstance(token, EOFToken):
-            continue
-
         if token_line_index < line_index:
             tokens_before_line.append(token)
-
-        if token_line_index >= line_index:
-            tokens_after_and_in_line.append(token)
+        elif token_line_index > line_index or isinstance(token, EOFToken):
+            tokens_after_line.append(token)
 
     new_line = Line('', line_index)
+    state = parser.get_state(tokens_before_line)
 
-    for suggested_non_terminal in suggested_non_terminals:
-        if not isinstance(suggested_non_terminal, list):
-            token_sequence = [token_cls('', new_line) for token_cls in suggested_non_terminal.get_minimal_sequence()]
-        else:
-            token_sequence = []
-            for non_terminal in suggested_non_terminal:
-                token_sequence += [token_cls('', new_line) for token_cls in non_terminal.get_minimal_sequence()]
-            suggested_non_terminal = suggested_non_terminal[0]
-        new_sequence = tokens_before_line + token_sequence + tokens_after_and_in_line
+    if first_token_cls is not None:
+        suggested_non_terminals.sort(key=lambda n: n[0].get_minimal_sequence()[0] != first_token_cls)
 
-        try:
-            GherkinParser(None).parse(new_sequence)
-        except (NonTerminalInvalid, NonTerminalNotUsed):
+    for non_terminals in suggested_non_terminals:
+        token_sequence = [
+            token_cls('', new_line)
+            for non_terminal in non_terminals
+            for token_cls in non_terminal.get_minimal_sequence()
+        ]
+
+        if not _suggestion_is_valid(parser, state, token_sequence, tokens_after_line):
+            continue
+
+        if not _blocks_are_valid(parser, tokens_before_line, token_sequence, tokens_after_line):
             continue
-        else:
-            criterion_token_cls = suggested_non_terminal.criterion_terminal_symbol.token_cls
 
-            if not return_full_sequence:
-                valid_suggestions.append(criterion_token_cls)
-            else:
-                valid_suggestions.append(token_sequence)
+        yield non_terminals[0], token_sequence
+
+
+def get_token_suggestion_after_line(sequence, line_index, return_full_sequence=False):
+    """
+    Returns a list of tokens that can come after a given line.
+
+    The suggestions are checked with the state of the parser at the start of the line (see `Parser.get_state`)
+    and the tokens after the line (see `Parser.state_accepts_tokens`), so the document is not parsed for them. Only
+    the blocks that contain a suggestion are parsed, because their non terminals validate more than the grammar.
+
+    :argument: sequence [Token] - a list of tokens that are already present in the document
+    :argument: line_index int - the line after that index will be checked
+    :argument: return_full_sequence bool - returns the whole sequence that makes something valid; if false only the
+                                           first token of that sequence is returned
+    """
+    valid_suggestions = []
+
+    for suggested_non_terminal, token_sequence in _get_valid_suggestions(sequence, line_index):
+        if not return_full_sequence:
+            valid_suggestions.append(suggested_non_terminal.criterion_terminal_symbol.token_cls)
+        else:
+            valid_suggestions.append(token_sequence)
 
     return valid_suggestions
 
@@ -101,29 +203,13 @@ def get_indent_level_for_next_line(tokens, line_index, filter_token):
     Returns the indent level for the next line in Gherkin. This can be used to determine how indented the cursor
     should be after hitting Enter in a gherkin document.
 
+    The suggestions that start like the filter token are checked first and only until a valid one is found.
+
     :argument: tokens [Token] - list of tokens that are already in the document
     :argument: line_index - the index of a line in the document, this will return the indent for the line after that
     :argument: filter_token Token - a token which this function will filter for as valid next tokens
     """
-    token_sequence_suggestions = get_token_suggestion_after_line(
-        sequence=tokens,
-        line_index=line_index,
-        return_full_sequence=True,
-    )
-
-    fitting_token = None
-    for token_sequence in token_sequence_suggestions:
-        first_token = token_sequence[0]
-
-        if first_token.__class__ == filter_token.__class__:
-            fitting_token = first_token
-            break
-
-        if first_token.line.line_index == line_index and fitting_token is None:
-            fitting_token = first_token
-
-    if fitting_token is not None:
-        return fitting_token.non_terminal_meta.get('suggested_indent_level')
+    for _, token_sequence in _get_valid_suggestions(tokens, line_index, first_token_cls=filter_token.__class__):
+        return token_sequence[0].non_terminal_meta.get('suggested_indent_level')
 
     return 0
-
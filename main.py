@@ -1,7 +1,62 @@
+import os
+import time
+
+from core.watch import FileWatcher
 from django_meta.setup import setup_django
 from settings import Settings
 
 
+def get_feature_files(compiler):
+    """Returns the paths to all feature files that are compiled."""
+    if Settings.TEST_IMPORT_DIRECTORY:
+        return compiler.find_files(Settings.TEST_IMPORT_DIRECTORY, Settings.TEST_IMPORT_PATTERN)
+
+    if Settings.TEST_IMPORT_FILE:
+        return [Settings.TEST_IMPORT_FILE]
+
+    return []
+
+
+def watch(compiler):
+    """
+    Compiles the feature files and compiles them again whenever they change. If the Django project changes, all
+    files are compiled again. Only scenarios that changed are run through the tilers since the test case cache
+    is used. The watched paths are collected again on every poll, so new feature files and new modules of the apps
+    are found as well.
+    """
+    from django_meta.project import DjangoProject
+
+    # the loop should be fast, so load everything upfront and reuse the code of unchanged scenarios
+    Settings.CACHE_TEST_CASES = True
+    compiler.warm_up()
+    project = DjangoProject.get_instance(Settings.DJANGO_SETTINGS_PATH)
+
+    compiler.print_summary(compiler.compile_files(get_feature_files(compiler), Settings.TEST_EXPORT_DIRECTORY))
+
+    watcher = FileWatcher(lambda: get_feature_files(compiler) + project.get_source_paths())
+    print('Watching for changes...')
+
+    while True:
+        changed_paths = watcher.wait_for_changes()
+        feature_files = get_feature_files(compiler)
+        project_paths = set(project.get_source_paths())
+
+        # the generated code of every file may change if the project changes
+        if changed_paths & project_paths:
+            paths = feature_files
+        else:
+            paths = [path for path in feature_files if path in changed_paths]
+
+        if not paths:
+            continue
+
+        # the latency is measured from the last save to the point where all files are written
+        last_save = max([os.stat(path).st_mtime for path in changed_paths if os.path.exists(path)] or [time.time()])
+        compiled_files = compiler.compile_files(paths, Settings.TEST_EXPORT_DIRECTORY)
+        compiler.print_summary(compiled_files)
+        print('Regenerated {} files {}s after the last change'.format(len(paths), round(time.time() - last_save, 2)))
+
+
 def main():
     # this need to be executed before importing the compiler!
     setup_django(Settings.DJANGO_SETTINGS_PATH, print_warning=True)
@@ -9,6 +64,24 @@ def main():
     from gherkin.compiler import GherkinToPyTestCompiler
 
     compiler = GherkinToPyTestCompiler()
+
+    # keep the process and all caches alive and compile files whenever they change
+    if Settings.WATCH:
+        watch(compiler)
+        return
+
+    # compile all feature files of a directory in one process to share all caches
+    if Settings.TEST_IMPORT_DIRECTORY:
+        compiled_files = compiler.compile_directory(
+            Settings.TEST_IMPORT_DIRECTORY,
+            Settings.TEST_EXPORT_DIRECTORY,
+            Settings.TEST_IMPORT_PATTERN,
+            Settings.PROCESSES,
+            Settings.FILE_THREADS,
+        )
+        compiler.print_summary(compiled_files)
+        return
+
     compiler.compile_file(Settings.TEST_IMPORT_FILE)
     compiler.export_as_file(Settings.TEST_EXPORT_DIRECTORY)
 
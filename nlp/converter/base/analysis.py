@@ -0,0 +1,95 @@
+from nlp.lookout.exception import LookoutFoundNothing
+from nlp.lookout.project import ModelLookout
+from nlp.lookout.token import NounLookout, RestActionLookout
+from nlp.utils import get_noun_chunks, get_non_stop_tokens, NoToken
+
+
+class StepAnalysis(object):
+    """
+    Holds everything that is determined from the document of a step without depending on a specific converter:
+    noun chunks, tokens, the results of lookouts and the tokens of referenced variables.
+
+    The tiler creates one analysis per step and passes it to every converter that it evaluates. That way the
+    converters (and their properties) do not repeat the same work on the same document.
+    """
+    def __init__(self, document, django_project):
+        self.document = document
+        self.django_project = django_project
+        self.language = document.lang_
+
+        self._noun_chunks = None
+        self._non_stop_tokens = None
+        self._last_document_word = None
+        self._method_lookout = None
+        self._noun_lookouts = {}
+        self._model_lookouts = {}
+        self._variable_tokens = {}
+
+    @property
+    def noun_chunks(self):
+        """All the noun chunks of the document."""
+        if self._noun_chunks is None:
+            self._noun_chunks = get_noun_chunks(self.document)
+        return self._noun_chunks
+
+    @property
+    def non_stop_tokens(self):
+        """All tokens of the document that are not stop words."""
+        if self._non_stop_tokens is None:
+            self._non_stop_tokens = get_non_stop_tokens(self.document)
+        return self._non_stop_tokens
+
+    @property
+    def last_document_word(self):
+        """The last token of the document that is not a punctuation."""
+        if self._last_document_word is None:
+            last_word = NoToken()
+            for i in range(len(self.document)):
+                end_token = self.document[-(i + 1)]
+
+                if not end_token.is_punct:
+                    last_word = end_token
+                    break
+            self._last_document_word = last_word
+        return self._last_document_word
+
+    @property
+    def method_lookout(self):
+        """The lookout that searches for the REST method in the document."""
+        if self._method_lookout is None:
+            self._method_lookout = RestActionLookout(self.document)
+            self._method_lookout.locate()
+        return self._method_lookout
+
+    def get_noun_lookout(self, word):
+        """Returns a located NounLookout that searches for the given word in the document."""
+        if word not in self._noun_lookouts:
+            lookout = NounLookout(self.document, word)
+            lookout.locate()
+            self._noun_lookouts[word] = lookout
+        return self._noun_lookouts[word]
+
+    def locate_model(self, text, raise_exception=False):
+        """
+        Searches the model that fits the text in the Django project. The result is the same as
+        `ModelLookout.locate`, including the fallback and the exception if `raise_exception` is true.
+        """
+        if text not in self._model_lookouts:
+            lookout = ModelLookout(text=text, src_language=self.language)
+            lookout.locate(project_wrapper=self.django_project)
+            self._model_lookouts[text] = lookout
+
+        lookout = self._model_lookouts[text]
+        if raise_exception and lookout.results_in_fallback:
+            raise LookoutFoundNothing()
+
+        return lookout.fittest_output_object
+
+    def get_variable_token(self, key, get_token):
+        """
+        Returns the token of a variable that is referenced in the document. The key must contain everything that
+        the token depends on. If the token was not determined for the key yet, `get_token` is called.
+        """
+        if key not in self._variable_tokens:
+            self._variable_tokens[key] = get_token()
+        return self._variable_tokens[key]
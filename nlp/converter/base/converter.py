@@ -1,9 +1,9 @@
 from core.performance import AveragePerformanceMeasurement, measure, StepLevelPerformanceMeasurement, MeasureKeys
+from nlp.converter.base.analysis import StepAnalysis
 from nlp.converter.wrapper import ReferenceTokenWrapper
 from nlp.generate.suite import TestCaseBase
 from nlp.lookout.nested import NestedLookout
-from nlp.utils import get_noun_chunks, get_non_stop_tokens, get_noun_chunk_of_token, token_is_verb, NoToken, \
-    tokens_are_equal
+from nlp.utils import get_noun_chunk_of_token, token_is_verb, tokens_are_equal
 
 
 class Converter(object):
@@ -16,15 +16,19 @@ class Converter(object):
         1) Find elements/ django classes etc. that match the document
         2) Extract the data to use that class/ element from the text
         3) Create the statements that will become templates sooner or later
+
+    The analysis holds everything that is determined from the document only. It can be shared between converters
+    of the same step. If none is passed, the converter creates its own.
     """
     can_use_datatables = False
 
-    def __init__(self, document, related_object, django_project, test_case):
+    def __init__(self, document, related_object, django_project, test_case, analysis=None):
         self.document = document
         self.django_project = django_project
         self.related_object = related_object
         self.language = document.lang_
         self.test_case: TestCaseBase = test_case
+        self.analysis = analysis if analysis is not None else StepAnalysis(document, django_project)
         self._extractors = None
         self._prepared = False
 
@@ -44,7 +48,7 @@ class Converter(object):
 
     def get_noun_chunks(self):
         """Returns all the noun chunks from the document."""
-        return get_noun_chunks(self.document)
+        return self.analysis.noun_chunks
 
     def convert_to_statements(self):
         """Converts the document into statements."""
@@ -74,13 +78,25 @@ class Converter(object):
         """
         return 1
 
+    @classmethod
+    def get_compatibility_upper_bound(cls, document, test_case):
+        """
+        Returns the highest compatibility that an instance of this converter can have for the document. It must
+        only use cheap features (POS tags, keywords or the statements of the test case) because it is called
+        before the converter is created. The tiler uses it to skip converters that cannot beat the best one.
+
+        Returns:
+            value from 0-1
+        """
+        return 1
+
     def add_extractor_warnings_to_test_case(self, extractor):
         """Adds any warnings that the given extractor generated to the test case."""
         if extractor.generates_warning:
             warnings = extractor.get_generated_warnings()
 
             for warning in warnings:
-                self.test_case.test_suite.warning_collection.add_warning(warning.code)
+                self.test_case.test_suite.add_warning(warning.code)
 
     def extract_and_handle_output(self, extractor):
         """
@@ -145,11 +161,10 @@ class ClassConverter(Converter):
     """
     field_lookout_classes = []
 
-    def __init__(self, document, related_object, django_project, test_case):
-        super().__init__(document, related_object, django_project, test_case)
+    def __init__(self, document, related_object, django_project, test_case, analysis=None):
+        super().__init__(document, related_object, django_project, test_case, analysis)
         self._fields = None
         self._blocked_reference_tokens = []
-        self._last_document_word = None
 
     def block_token_as_reference(self, token):
         """Use this function to block a specific token from being taken as an argument."""
@@ -159,16 +174,7 @@ class ClassConverter(Converter):
     @property
     def last_document_word(self):
         """Returns the last word of the document as a cached property."""
-        if self._last_document_word is None:
-            last_word = NoToken()
-            for i in range(len(self.document)):
-                end_token = self.document[-(i + 1)]
-
-                if not end_token.is_punct:
-                    last_word = end_token
-                    break
-            self._last_document_word = last_word
-        return self._last_document_word
+        return self.analysis.last_document_word
 
     def token_can_be_reference_name(self, token):
         """Checks if a given token can represent an argument of the __init__ from the class"""
@@ -241,7 +247,7 @@ class ClassConverter(Converter):
 
     def get_possible_reference_name_tokens(self):
         """Returns all tokens that can possibly be an argument."""
-        return get_non_stop_tokens(self.document)
+        return self.analysis.non_stop_tokens
 
     def chunk_is_allowed_as_reference(self, chunk):
         """Check if a chunk should be used to search for a reference."""
@@ -321,41 +327,72 @@ class ClassConverter(Converter):
 
         return [self.get_extractor_instance(argument_wrapper=wrapper) for wrapper in wrappers]
 
+    def get_datatable_column_slots(self, column_names):
+        """
+        Resolves the references of the columns of a data table. Returns a list with a tuple of (reference, slot)
+        for each column. The slot is the index of the extractor in the list of extractors that the values of that
+        column replace. If the column is not valid, the tuple is (None, None).
+        """
+        column_slots = []
+        slots_by_reference = []
+        next_slot = len(self.extractors)
+
+        for column_name in column_names:
+            reference = self.search_for_reference(span=None, token=column_name)
+
+            # filter any invalid search results
+            if not self.is_valid_search_result(reference):
+                column_slots.append((None, None))
+                continue
+
+            slot = None
+            for extractor_index, extractor in enumerate(self.extractors):
+                if extractor.reference == reference:
+                    slot = extractor_index
+                    break
+
+            # multiple columns may reference the same, the later ones replace the extractor of the first one
+            if slot is None:
+                for other_reference, other_slot in slots_by_reference:
+                    if other_reference == reference:
+                        slot = other_slot
+                        break
+
+            if slot is None:
+                slot = next_slot
+                next_slot += 1
+                slots_by_reference.append((reference, slot))
+
+            column_slots.append((reference, slot))
+
+        return column_slots
+
     def get_statements_from_datatable(self):
         """
         Handles if the passed Step has a data table. It will get the normal extractors and append any values that
         are passed by the data table. The extractors are added to the existing list. For each row of the
         data table the statements are created again.
+
+        The references of the columns are only searched once per table since they are the same for every row.
         """
         statements = []
         datatable = self.related_object.argument
-        column_names = datatable.get_column_names()
+        column_slots = self.get_datatable_column_slots(datatable.get_column_names())
+        slot_count = max([len(self.extractors)] + [slot + 1 for _, slot in column_slots if slot is not None])
 
         for row in datatable.rows:
-            extractors_copy = self.extractors.copy()
-
-            for index, cell in enumerate(row.cells):
-                reference = self.search_for_reference(span=None, token=column_names[index])
+            extractors_copy = self.extractors + [None] * (slot_count - len(self.extractors))
 
-                # filter any invalid search results
-                if not self.is_valid_search_result(reference):
+            for cell, (reference, slot) in zip(row.cells, column_slots):
+                if slot is None:
                     continue
 
                 wrapper = ReferenceTokenWrapper(token=cell.value, reference=reference)
-                extractor_instance = self.get_extractor_instance(argument_wrapper=wrapper)
-
-                existing_extract_index = -1
-                for extractor_index, extractor in enumerate(extractors_copy):
-                    if extractor.reference == reference:
-                        existing_extract_index = extractor_index
-                        break
-
-                if existing_extract_index >= 0:
-                    extractors_copy[existing_extract_index] = extractor_instance
-                else:
-                    extractors_copy.append(extractor_instance)
+                extractors_copy[slot] = self.get_extractor_instance(argument_wrapper=wrapper)
 
-            statements += self.get_statements_from_extractors(extractors_copy)
+            statements += self.get_statements_from_extractors(
+                [extractor for extractor in extractors_copy if extractor is not None]
+            )
 
         return statements
 
@@ -27,8 +27,8 @@ class FileConverter(ClassConverter):
         def get_all(cls):
             return [cls.CONTENT, cls.NAME]
 
-    def __init__(self, document, related_object, django_project, test_case):
-        super().__init__(document, related_object, django_project, test_case)
+    def __init__(self, document, related_object, django_project, test_case, analysis=None):
+        super().__init__(document, related_object, django_project, test_case, analysis)
         # get the extension of the file
         self.file_extension_lookout = FileExtensionLookout(self.document)
 
@@ -18,8 +18,8 @@ class ModelConverter(ClassConverter):
     """
     field_lookout_classes = [ModelFieldLookout]
 
-    def __init__(self, document, related_object, django_project, test_case):
-        super().__init__(document, related_object, django_project, test_case)
+    def __init__(self, document, related_object, django_project, test_case, analysis=None):
+        super().__init__(document, related_object, django_project, test_case, analysis)
         self.model = NewModelProperty(self)
         self.variable = NewModelVariableProperty(self)
 
@@ -104,8 +104,8 @@ class ModelVariableReferenceConverter(ModelConverter):
         - Given a user Alice ...
         - And Alice has a password "Haus1234"
     """
-    def __init__(self, document, related_object, django_project, test_case):
-        super().__init__(document, related_object, django_project, test_case)
+    def __init__(self, document, related_object, django_project, test_case, analysis=None):
+        super().__init__(document, related_object, django_project, test_case, analysis)
         self.model_in_text = NewModelProperty(self)
         self.variable_ref = ReferenceModelVariableProperty(self)
         self.model = ReferenceModelProperty(self, self.variable_ref)
@@ -128,6 +128,14 @@ class ModelVariableReferenceConverter(ModelConverter):
         variable_instance = self.variable_ref.value
         return variable_instance.value.model_wrapper
 
+    @classmethod
+    def get_compatibility_upper_bound(cls, document, test_case):
+        """The referenced variable must hold a model instance that was created previously."""
+        if len(test_case.get_all_statements_with_expression(ModelFactoryExpression)) == 0:
+            return 0
+
+        return 1
+
     def get_document_compatibility(self):
         """Only if a previous variable exists, this converter makes sense."""
         variable_model_wrapper = self.get_variable_model_wrapper()
@@ -160,14 +168,22 @@ class AssertPreviousModelConverter(ModelConverter):
     """
     This converter can be used to check fields from the variable of a model that was previously created.
     """
-    def __init__(self, document, related_object, django_project, test_case):
-        super().__init__(document, related_object, django_project, test_case)
+    def __init__(self, document, related_object, django_project, test_case, analysis=None):
+        super().__init__(document, related_object, django_project, test_case, analysis)
         self.variable_ref = ReferenceModelVariableProperty(self)
         self.model = ReferenceModelProperty(self, self.variable_ref)
 
         # the value of the variable is important for the model
         self.variable_ref.calculate_value()
 
+    @classmethod
+    def get_compatibility_upper_bound(cls, document, test_case):
+        """Without a model instance that was created previously, there is no variable that can be referenced."""
+        if len(test_case.get_all_statements_with_expression(ModelFactoryExpression)) == 0:
+            return 0.2
+
+        return 1
+
     def get_document_compatibility(self):
         compatibility = super().get_document_compatibility()
 
@@ -194,7 +210,7 @@ class AssertPreviousModelConverter(ModelConverter):
         except self.ExtractorReturnedNone:
             # M2MModelFieldExtractor normally adds more statements, but in this case, simple check for a list
             if isinstance(extractor, M2MModelFieldExtractor):
-                return extractor._extract_value()
+                return extractor._get_extracted_value()
             raise self.ExtractorReturnedNone()
 
     def handle_extractor(self, extractor, statements):
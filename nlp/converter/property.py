@@ -7,8 +7,7 @@ from nlp.converter.base.property import ConverterProperty
 from nlp.generate.expression import ModelFactoryExpression
 from nlp.generate.variable import Variable
 from nlp.lookout.exception import LookoutFoundNothing
-from nlp.lookout.project import ModelLookout
-from nlp.lookout.token import FileLookout, RestActionLookout
+from nlp.lookout.token import FileLookout
 from nlp.utils import token_to_function_name, NoToken, is_quoted, \
     token_is_noun, token_is_like_num, get_next_token, get_all_children, token_can_represent_variable, \
     tokens_are_equal, token_in_list
@@ -38,8 +37,7 @@ class NewModelProperty(ConverterProperty):
         if not self.token:
             return None
 
-        lookout = ModelLookout(text=str(self.token.lemma_), src_language=self.converter.language)
-        return lookout.locate(project_wrapper=self.converter.django_project)
+        return self.converter.analysis.locate_model(str(self.token.lemma_))
 
 
 class ModelCountProperty(NewModelProperty):
@@ -200,15 +198,24 @@ class ReferenceModelVariableProperty(NewModelVariableProperty):
         return model_wrapper
 
     def get_token(self):
-        """The token of the variable must reference a variable that was previously defined."""
-        if not self.chunk:
+        """
+        The token of the variable must reference a variable that was previously defined. The token is shared with
+        other converters of the same step that search with the same possibilities and the same model.
+        """
+        if not self.chunk or not self.converter.test_case.get_all_statements_with_expression(ModelFactoryExpression):
             return NoToken()
 
-        for token in self.get_token_possibilities():
-            for statement in self.converter.test_case.statements:
-                if not isinstance(statement.expression, ModelFactoryExpression):
-                    continue
+        possibilities = self.get_token_possibilities()
+        key = self.get_token_key(possibilities)
+        return self.converter.analysis.get_variable_token(key, lambda: self._get_token(possibilities))
 
+    def get_token_key(self, possibilities):
+        """Returns everything that the token depends on. Converters with the same key will find the same token."""
+        return self.__class__, tuple(token.i for token in possibilities), self.get_related_object_property().value
+
+    def _get_token(self, possibilities):
+        for token in possibilities:
+            for statement in self.converter.test_case.get_all_statements_with_expression(ModelFactoryExpression):
                 model_wrapper = self.get_model_wrapper(statement, token)
                 if not model_wrapper or not model_wrapper.models_are_equal(statement.expression.model_wrapper):
                     continue
@@ -232,10 +239,7 @@ class ReferenceModelVariableProperty(NewModelVariableProperty):
         if not self.token:
             return None
 
-        for statement in self.converter.test_case.statements:
-            if not isinstance(statement.expression, ModelFactoryExpression):
-                continue
-
+        for statement in self.converter.test_case.get_all_statements_with_expression(ModelFactoryExpression):
             model = self.get_model_wrapper(statement, self.token)
             future_name = token_to_function_name(self.token)
 
@@ -277,21 +281,15 @@ class ReferenceModelProperty(NewModelProperty):
         Try to find a model from the token. If none is found return None instead of a placeholder. Also
         try to find the model in a previous statement.
         """
-        model_lookout = ModelLookout(text=str(self.token.lemma_), src_language=self.converter.language)
-
         # try to search for a model
         try:
-            found_model_wrapper = model_lookout.locate(
-                project_wrapper=self.converter.django_project,
-                raise_exception=True
-            )
+            found_model_wrapper = self.converter.analysis.locate_model(str(self.token.lemma_), raise_exception=True)
         except LookoutFoundNothing:
             return None
 
         # try to find a statement where the found model is saved in the expression
-        for statement in self.converter.test_case.statements:
-            exp = statement.expression
-            if isinstance(exp, ModelFactoryExpression) and found_model_wrapper.models_are_equal(exp.model_wrapper):
+        for statement in self.converter.test_case.get_all_statements_with_expression(ModelFactoryExpression):
+            if found_model_wrapper.models_are_equal(statement.expression.model_wrapper):
                 return found_model_wrapper
 
         return None
@@ -315,6 +313,10 @@ class UserReferenceVariableProperty(ReferenceModelVariableProperty):
         """In this case, the user is the model, so search for the token in the own chunk only."""
         return [t for t in self.chunk] + get_all_children(self.chunk.root)
 
+    def get_token_key(self, possibilities):
+        """The model is always the user, so the token only depends on the possibilities."""
+        return self.__class__, tuple(token.i for token in possibilities)
+
 
 class MethodProperty(ConverterProperty):
     """
@@ -322,8 +324,7 @@ class MethodProperty(ConverterProperty):
     """
     def __init__(self, converter):
         super().__init__(converter)
-        self.lookout = RestActionLookout(self.document)
-        self.lookout.locate()
+        self.lookout = self.converter.analysis.method_lookout
 
     def get_value(self):
         return self.lookout.method
@@ -18,13 +18,21 @@ class QuerysetConverter(ModelConverter):
     """
     This converter can be used to translate text into a queryset statement.
     """
-    def __init__(self, document, related_object, django_project, test_case):
-        super().__init__(document, related_object, django_project, test_case)
+    def __init__(self, document, related_object, django_project, test_case, analysis=None):
+        super().__init__(document, related_object, django_project, test_case, analysis)
         self.assignment_variable = Variable(
             self.get_variable_name(),
             self.model.value.name if self.model.value else '',
         )
 
+    @classmethod
+    def get_compatibility_upper_bound(cls, document, test_case):
+        """The model token is the root of a noun chunk, so it can only be a noun if the document has any."""
+        if not any([token_is_noun(token) for token in document]):
+            return 0.01
+
+        return 1
+
     def get_document_compatibility(self):
         """
         If the model token is not a noun, it is unlikely that this converter matches.
@@ -167,8 +175,8 @@ class CountQuerysetConverter(QuerysetConverter):
     """
     This converter can be used to create an assert statement for the count of a queryset.
     """
-    def __init__(self, document, related_object, django_project, test_case):
-        super().__init__(document, related_object, django_project, test_case)
+    def __init__(self, document, related_object, django_project, test_case, analysis=None):
+        super().__init__(document, related_object, django_project, test_case, analysis)
         self.count = ModelCountProperty(self)
 
     def get_extractor_kwargs(self, argument_wrapper, extractor_cls):
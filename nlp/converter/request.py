@@ -20,8 +20,8 @@ class RequestConverter(ClassConverter):
     """
     field_lookout_classes = [SerializerFieldLookout, ModelFieldLookout]
 
-    def __init__(self, document, related_object, django_project, test_case):
-        super().__init__(document, related_object, django_project, test_case)
+    def __init__(self, document, related_object, django_project, test_case, analysis=None):
+        super().__init__(document, related_object, django_project, test_case, analysis)
         self._url_pattern_wrapper = None
 
         self.user = UserReferenceVariableProperty(self)
@@ -156,9 +156,8 @@ class RequestConverter(ClassConverter):
 
         # check if there is already a statement with a client that was created
         variable_client = None
-        for statement in self.test_case.statements:
-            if isinstance(statement.expression, APIClientExpression):
-                variable_client = statement.variable
+        for statement in self.test_case.get_all_statements_with_expression(APIClientExpression):
+            variable_client = statement.variable
 
         # if there is no client yet, create one
         if variable_client is None:
@@ -16,7 +16,7 @@ from nlp.generate.index import Index
 from nlp.generate.statement import AssertStatement, AssignmentStatement
 from nlp.generate.variable import Variable, VariableReference
 from nlp.lookout.project import SerializerFieldLookout, ModelFieldLookout
-from nlp.lookout.token import NounLookout, ComparisonLookout, VerbLookout
+from nlp.lookout.token import ComparisonLookout, VerbLookout
 from nlp.utils import get_noun_chunk_of_token, NoToken, token_is_definite, get_previous_token
 
 
@@ -26,18 +26,13 @@ class ResponseConverterBase(ClassConverter):
     """
     field_lookout_classes = [SerializerFieldLookout, ModelFieldLookout]
 
-    def __init__(self, document, related_object, django_project, test_case):
-        super().__init__(document, related_object, django_project, test_case)
+    def __init__(self, document, related_object, django_project, test_case, analysis=None):
+        super().__init__(document, related_object, django_project, test_case, analysis)
 
-        # create some lookouts that look for certain keywords:
-        self.status_lookout = NounLookout(self.document, 'status')  # <- status of response
-        self.status_lookout.locate()
-
-        self.response_lookout = NounLookout(self.document, 'response')  # <- response itself
-        self.response_lookout.locate()
-
-        self.error_lookout = NounLookout(self.document, 'error')  # <- error
-        self.error_lookout.locate()
+        # get some lookouts that look for certain keywords:
+        self.status_lookout = self.analysis.get_noun_lookout('status')  # <- status of response
+        self.response_lookout = self.analysis.get_noun_lookout('response')  # <- response itself
+        self.error_lookout = self.analysis.get_noun_lookout('error')  # <- error
 
         self.model_in_text = NewModelProperty(self, blocked_tokens=self._blocked_reference_tokens)
         self.model_in_text_var = ReferenceModelVariableProperty(self, self.model_in_text)
@@ -132,11 +127,19 @@ class ResponseConverterBase(ClassConverter):
         if self.model_in_text_fits_request:
             self.block_token_as_reference(self.model_in_text.token)
 
+    @classmethod
+    def get_compatibility_upper_bound(cls, document, test_case):
+        """Without a previous request, the compatibility is reduced in `get_document_compatibility`."""
+        if not test_case.get_all_statements_with_expression(RequestExpression):
+            return 0.1
+
+        return 1
+
     def get_document_compatibility(self):
         compatibility = 1
 
         # if there was no request previously, it is unlikely that this converter is compatible
-        if not any([isinstance(s.expression, RequestExpression) for s in self.test_case.statements]):
+        if not self.test_case.get_all_statements_with_expression(RequestExpression):
             compatibility *= 0.1
 
         # if there is a model variable in the text, it is more likely that it is meant instead
@@ -152,8 +155,8 @@ class ResponseConverterBase(ClassConverter):
         valid_variables = []
 
         # first get all variables that hold an expression for a request
-        for statement in self.test_case.statements:
-            if hasattr(statement, 'variable') and isinstance(statement.expression, RequestExpression):
+        for statement in self.test_case.get_all_statements_with_expression(RequestExpression):
+            if hasattr(statement, 'variable'):
                 valid_variables.append(statement.variable)
 
         if len(valid_variables) == 0:
@@ -261,8 +264,8 @@ class ResponseConverter(ResponseConverterBase):
     """
     This converter is responsible for text that checks an object that is returned in the response.
     """
-    def __init__(self, document, related_object, django_project, test_case):
-        super().__init__(document, related_object, django_project, test_case)
+    def __init__(self, document, related_object, django_project, test_case, analysis=None):
+        super().__init__(document, related_object, django_project, test_case, analysis)
 
         self._response_data_variable = None
 
@@ -349,18 +352,13 @@ class ManyResponseConverter(ResponseConverterBase):
     """
     This converter is a base class for response that return a list instead of a simple object.
     """
-    def __init__(self, document, related_object, django_project, test_case):
-        super().__init__(document, related_object, django_project, test_case)
+    def __init__(self, document, related_object, django_project, test_case, analysis=None):
+        super().__init__(document, related_object, django_project, test_case, analysis)
 
         # keywords to identify a list:
-        self.response_list_lookout = NounLookout(self.document, 'list')
-        self.response_list_lookout.locate()
-
-        self.response_length_lookout = NounLookout(self.document, 'length')
-        self.response_length_lookout.locate()
-
-        self.response_entry_lookout = NounLookout(self.document, 'entry')
-        self.response_entry_lookout.locate()
+        self.response_list_lookout = self.analysis.get_noun_lookout('list')
+        self.response_length_lookout = self.analysis.get_noun_lookout('length')
+        self.response_entry_lookout = self.analysis.get_noun_lookout('entry')
 
         # since we are trying to access the blocked tokens before even creating the statements, we need to prepare
         # the converter immediately
@@ -412,8 +410,8 @@ class ManyCheckEntryResponseConverter(ManyResponseConverter):
     """
     This converter can be used to check specific entries in a given list from the response.
     """
-    def __init__(self, document, related_object, django_project, test_case):
-        super().__init__(document, related_object, django_project, test_case)
+    def __init__(self, document, related_object, django_project, test_case, analysis=None):
+        super().__init__(document, related_object, django_project, test_case, analysis)
 
         if self.model_wrapper_from_request and self.get_entry_extractor() is not None:
             extractor = self.get_entry_extractor()
@@ -0,0 +1,50 @@
+import pytest
+
+from core.constants import Languages
+from django_meta.project import DjangoProject
+from gherkin.ast import Then
+from nlp.converter.base.analysis import StepAnalysis
+from nlp.converter.response import ResponseStatusCodeConverter, ResponseErrorConverter
+from nlp.generate.pytest.suite import PyTestTestSuite
+from nlp.lookout.exception import LookoutFoundNothing
+from nlp.setup import Nlp
+from nlp.tests.utils import MockTranslator
+
+nlp = Nlp.for_language(Languages.DE)
+django_project = DjangoProject('django_sample_project.apps.config.settings')
+
+
+def test_step_analysis_shared_by_converters(mocker):
+    """Check that converters of the same step use the same lookouts from the analysis."""
+    mocker.patch('deep_translator.DeepL.translate', MockTranslator())
+    suite = PyTestTestSuite('foo')
+    test_case = suite.create_and_add_test_case('bar')
+    doc = nlp('Dann sollte die Antwort den Status 200 haben.')
+    then = Then(keyword='Dann', text=' sollte die Antwort den Status 200 haben.')
+    analysis = StepAnalysis(doc, django_project)
+
+    status_converter = ResponseStatusCodeConverter(doc, then, django_project, test_case, analysis=analysis)
+    error_converter = ResponseErrorConverter(doc, then, django_project, test_case, analysis=analysis)
+    assert status_converter.status_lookout is error_converter.status_lookout
+    assert status_converter.get_noun_chunks() is error_converter.get_noun_chunks()
+    assert status_converter.status_lookout.fittest_token == doc[5]
+
+    # converters without an analysis create their own
+    other_converter = ResponseStatusCodeConverter(doc, then, django_project, test_case)
+    assert other_converter.analysis is not analysis
+    assert other_converter.status_lookout.fittest_token == doc[5]
+
+
+def test_step_analysis_locate_model(mocker):
+    """Check that the analysis locates models like the ModelLookout and raises for fallbacks if wanted."""
+    mocker.patch('deep_translator.DeepL.translate', MockTranslator())
+    analysis = StepAnalysis(nlp('Gegeben sei ein Auftrag'), django_project)
+
+    model_wrapper = analysis.locate_model('Auftrag')
+    assert model_wrapper.name == 'Order'
+    assert analysis.locate_model('Auftrag', raise_exception=True) is model_wrapper
+
+    fallback = analysis.locate_model('Dach')
+    assert fallback.exists_in_code is False
+    with pytest.raises(LookoutFoundNothing):
+        analysis.locate_model('Dach', raise_exception=True)
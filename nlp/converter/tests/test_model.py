@@ -153,6 +153,29 @@ def test_model_factory_converter_datatable(mocker):
             assert kwarg.value.value == rows[statement_index].cells[kwarg_index].value
 
 
+def test_model_factory_converter_datatable_columns_searched_once(mocker):
+    """Check that the references of the columns of a datatable are only searched once and not for each row."""
+    mocker.patch('deep_translator.DeepL.translate', MockTranslator())
+    header = TableRow([TableCell('number'), TableCell('name'), TableCell('number')])
+    rows = [TableRow([TableCell(i), TableCell('name_{}'.format(i)), TableCell(i + 1)]) for i in range(5)]
+    given = Given(keyword='Gegeben sei', text='ein Auftrag', argument=DataTable(header=header, rows=rows))
+    suite = PyTestTestSuite('foo')
+    test_case = suite.create_and_add_test_case('bar')
+    converter = ModelFactoryConverter(nlp('Gegeben sei ein Auftrag'), given, django_project, test_case)
+
+    # load the extractors of the text before spying
+    assert converter.extractors is not None
+    search_spy = mocker.spy(converter, 'search_for_reference')
+    statements = converter.convert_to_statements()
+    assert search_spy.call_count == 3
+    assert len(statements) == 5
+
+    # the second column with the same reference replaces the value of the first one
+    for index, statement in enumerate(statements):
+        assert [kwarg.name for kwarg in statement.expression.function_kwargs] == ['number', 'name']
+        assert statement.expression.function_kwargs[0].value.value == index + 1
+
+
 @pytest.mark.parametrize(
     'doc, min_compatibility, max_compatibility', [
         (nlp('Dann sollte Alice den Nachnamen "Alice" und den Vornamen "Alice" haben.'), 0.7, 1),
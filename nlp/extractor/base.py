@@ -9,6 +9,9 @@ from nlp.utils import get_all_children, is_quoted, get_next_token, token_can_rep
 class Extractor(object):
     """
     Extractors turn Tokens and strings into Python values that can be used in the generate part.
+
+    The output instance and the extracted value are memoized per extractor, so the extraction is only done once. If
+    anything changes that the extraction depends on, call `invalidate`.
     """
     output_class = ExtractorOutput
 
@@ -17,11 +20,29 @@ class Extractor(object):
         self.source = source
         self.document = document
         self.reference = reference
-        self.source_represents_output = source_represents_output
+        self._output = None
+        self._extracted_value = None
+        self._value_extracted = False
+        self._source_represents_output = source_represents_output
 
     def __str__(self):
         return '{} | {} -> {}'.format(self.__class__.__name__, str(self.source), self._extract_value())
 
+    @property
+    def source_represents_output(self):
+        return self._source_represents_output
+
+    @source_represents_output.setter
+    def source_represents_output(self, value):
+        self._source_represents_output = value
+        self.invalidate()
+
+    def invalidate(self):
+        """Resets the memoized output instance and the extracted value."""
+        self._output = None
+        self._extracted_value = None
+        self._value_extracted = False
+
     @property
     def generates_warning(self):
         return len(self.get_generated_warnings()) > 0
@@ -50,10 +71,9 @@ class Extractor(object):
         """
         return False
 
-    @property
-    def output(self) -> ExtractorOutput:
+    def create_output(self) -> ExtractorOutput:
         """
-        Returns the output instance that is used to extract the value and convert it to python.
+        Creates a new output instance that is used to extract the value and convert it to python.
         """
         output_class = self.get_output_class()
         instance = output_class(**self.get_output_kwargs())
@@ -62,6 +82,16 @@ class Extractor(object):
 
         return instance
 
+    @property
+    def output(self) -> ExtractorOutput:
+        """
+        Returns the output instance of this extractor. It is created once, so the output (and the output token) is
+        only determined once too.
+        """
+        if self._output is None:
+            self._output = self.create_output()
+        return self._output
+
     def _get_output_value(self, output_instance):
         """
         Is responsible for getting the value from the output instance. This method can also be overwritten if
@@ -83,12 +113,23 @@ class Extractor(object):
             return GenerationWarning(e.code)
 
     @measure(by=AveragePerformanceMeasurement, key=MeasureKeys.EXTRACTOR)
+    def _measured_extract_value(self):
+        return self._extract_value()
+
+    def _get_extracted_value(self):
+        """Returns the extracted value. It is only extracted on the first call until the extractor is invalidated."""
+        if not self._value_extracted:
+            self._extracted_value = self._measured_extract_value()
+            self._value_extracted = True
+
+        return self._extracted_value
+
     def extract_value(self):
         """
         The public method to extract the value. Every ExtractionError is caught here. If there is one, a
-        GenerationWarning is returned instead.
+        GenerationWarning is returned instead. The value is only extracted on the first call.
         """
-        return self._extract_value()
+        return self._get_extracted_value()
 
     def on_handled_by_converter(self, statements):
         """
@@ -120,10 +161,14 @@ class ManyExtractorMixin(object):
         return self.get_child_extractor_class().output_class
 
     def get_generated_warnings(self):
-        extracted_value = self._extract_many(token=self.source)
+        # some extractors do not return their values in `extract_value`, so use the memoized value directly
+        extracted_value = self._get_extracted_value()
         if extracted_value is None:
             return []
 
+        if not isinstance(extracted_value, list):
+            return [extracted_value] if isinstance(extracted_value, GenerationWarning) else []
+
         return [entry for entry in extracted_value if isinstance(entry, GenerationWarning)]
 
     def get_child_extractor_kwargs(self):
@@ -184,8 +229,8 @@ class ManyExtractorMixin(object):
             if extractor_class is None:
                 continue
 
-            # get the output class - which is the output from the child extractor
-            output_instance = self.output
+            # get a new output instance - which is the output from the child extractor
+            output_instance = self.create_output()
 
             # set the child as a source and tell the output that that token is the output
             output_instance.source_represents_output = True
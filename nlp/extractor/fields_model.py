@@ -83,7 +83,7 @@ class M2MModelFieldExtractor(ManyExtractorMixin, ForeignKeyModelFieldExtractor):
 
     def on_handled_by_converter(self, statements):
         factory_statement = statements[0]
-        values = self._extract_value()      # <- will return a list of values since self.many is True
+        values = self._get_extracted_value()      # <- will return a list of values since self.many is True
 
         if not factory_statement.variable:
             factory_statement.generate_variable(self.test_case)
@@ -141,7 +141,7 @@ class PermissionsM2MModelFieldExtractor(M2MModelFieldExtractor):
             )
         except LookoutFoundNothing:
             permission_query = GenerationWarning(PERMISSION_NOT_FOUND)
-            self.test_case.test_suite.warning_collection.add_warning(permission_query.code)
+            self.test_case.test_suite.add_warning(permission_query.code)
 
         m2m_expression = ModelM2MAddExpression(
             model_instance_variable_ref=factory_statement.variable.get_reference(),
@@ -1,5 +1,5 @@
 import ast
-from decimal import Decimal
+from decimal import Decimal, InvalidOperation
 from typing import Union, Tuple, Any
 
 from spacy.tokens.token import Token
@@ -365,6 +365,22 @@ class IntegerOutput(NumberAsStringOutput):
     """
     This output will return an integer.
     """
+    @classmethod
+    def column_to_output(cls, values):
+        """
+        Converts all values of a column (e.g. from a data table) to integers. Values that would change when written
+        as an integer (like `007`) are not allowed. Raises a ValueError if any value cannot be converted.
+        """
+        output = []
+
+        for value in values:
+            integer = int(str(value))
+            if str(integer) != str(value):
+                raise ValueError()
+            output.append(integer)
+
+        return output
+
     def prepare_output(self, output_value):
         output_value = super().prepare_output(output_value)
 
@@ -389,6 +405,26 @@ class DecimalOutput(NumberAsStringOutput):
     """
     This output will return a decimal.
     """
+    @classmethod
+    def column_to_output(cls, values):
+        """
+        Converts all values of a column (e.g. from a data table) to decimals. Raises a ValueError if any value
+        cannot be converted.
+        """
+        output = []
+
+        for value in values:
+            try:
+                decimal = Decimal(str(value))
+            except InvalidOperation:
+                raise ValueError()
+
+            if not decimal.is_finite() or str(decimal) != str(value):
+                raise ValueError()
+            output.append(decimal)
+
+        return output
+
     def prepare_output(self, output_value):
         return Decimal(super().prepare_output(output_value))
 
@@ -397,6 +433,24 @@ class BooleanOutput(ExtractorOutput):
     """
     This output will return a boolean.
     """
+    @classmethod
+    def column_to_output(cls, values):
+        """
+        Converts all values of a column (e.g. from a data table) to booleans. Only `true` and `false` are used since
+        words like `yes` or `1` might be meant as a string or a number. Raises a ValueError if any value does not fit.
+        """
+        output = []
+
+        for value in values:
+            if str(value) in ('True', 'true'):
+                output.append(True)
+            elif str(value) in ('False', 'false'):
+                output.append(False)
+            else:
+                raise ValueError()
+
+        return output
+
     def token_to_native_value(self, token):
         # while is does not really make sense to represent values as variables when using a boolean (is normally
         # determined via the verb and its negation), still we catch the case here
@@ -505,3 +559,17 @@ class ModelVariableOutput(VariableOutput):
         statement_variable_matches = statement.string_matches_variable(output, reference_string=self.model.__name__)
 
         return expression_model == self.model and statement_variable_matches
+
+
+def get_column_output(values):
+    """
+    Converts the values of a column (e.g. from a data table) to integers, decimals or booleans. The whole column is
+    converted at once and only if every value fits the type. Otherwise the values are returned unchanged.
+    """
+    for output_cls in [IntegerOutput, DecimalOutput, BooleanOutput]:
+        try:
+            return output_cls.column_to_output(values)
+        except ValueError:
+            pass
+
+    return list(values)
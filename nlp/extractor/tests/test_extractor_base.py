@@ -42,6 +42,25 @@ def test_output_instance():
     assert output_instance.source == '1'
 
 
+def test_extractor_extracts_once(mocker):
+    """Check that the output and the value are only determined once until the extractor is invalidated."""
+    extractor = Extractor(default_test_case, '', document[2], document)
+    output_spy = mocker.spy(extractor, 'create_output')
+    extract_spy = mocker.spy(extractor, '_extract_value')
+
+    assert extractor.generates_warning is False
+    assert extractor.extract_value() == 3
+    assert extractor.output.output_token == document[2]
+    assert extractor.output is extractor.output
+    assert output_spy.call_count == 1
+    assert extract_spy.call_count == 1
+
+    extractor.source_represents_output = True
+    assert extractor.extract_value() == 3
+    assert output_spy.call_count == 2
+    assert extract_spy.call_count == 2
+
+
 @pytest.mark.parametrize(
     'doc, token_index, expected_output', [
         (nlp('Wenn sie einen Auftrag mit den Sammlungen 1, 2 und 3 erstellt'), 6, [1, 2, 3]),
@@ -53,3 +72,15 @@ def test_many_extractor_mixin(doc, token_index, expected_output):
     """Check that many values are correctly handled."""
     extractor = ManyExtractor(default_test_case, '', doc[token_index], doc)
     assert extractor.extract_value() == expected_output
+
+
+def test_many_extractor_extracts_once(mocker):
+    """Check that many values are only extracted once, even if the warnings are checked before."""
+    doc = nlp('Wenn sie einen Auftrag mit den Sammlungen 1, 2 und 3 erstellt')
+    extractor = ManyExtractor(default_test_case, '', doc[6], doc)
+    extract_spy = mocker.spy(extractor, '_extract_many')
+
+    assert extractor.generates_warning is False
+    assert extractor.get_generated_warnings() == []
+    assert extractor.extract_value() == [1, 2, 3]
+    assert extract_spy.call_count == 1
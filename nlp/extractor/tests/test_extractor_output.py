@@ -1,3 +1,5 @@
+from decimal import Decimal
+
 import pytest
 from django.contrib.auth.models import User
 
@@ -6,7 +8,7 @@ from django_meta.model import ExistingModelWrapper
 from django_sample_project.apps.order.models import Order
 from nlp.extractor.exception import ExtractionError
 from nlp.extractor.output import ExtractorOutput, NoneOutput, StringOutput, DictOutput, NumberAsStringOutput, \
-    IntegerOutput, FloatOutput, BooleanOutput, VariableOutput, ModelVariableOutput
+    IntegerOutput, FloatOutput, BooleanOutput, VariableOutput, ModelVariableOutput, get_column_output
 from nlp.generate.argument import Kwarg
 from nlp.generate.expression import Expression
 from nlp.generate.parameter import Parameter
@@ -477,3 +479,22 @@ def test_model_variable_extractor_output(doc, token_index, raises, model_input,
         assert extractor_output.output_token == doc[source_output_index]
     else:
         assert_callable_raises(extractor_output.get_output, ExtractionError)
+
+
+@pytest.mark.parametrize(
+    'values, expected_output', [
+        (['12', '20'], [12, 20]),
+        (['12', '1.50'], [Decimal('12'), Decimal('1.50')]),
+        (['true', 'False'], [True, False]),
+        (['12', 'abc'], ['12', 'abc']),
+        (['007', '12'], ['007', '12']),
+        (['NaN', '1.5'], ['NaN', '1.5']),
+        (['ja', 'nein'], ['ja', 'nein']),
+        ([], []),
+    ]
+)
+def test_get_column_output(values, expected_output):
+    """Check that whole columns are converted to a type only if every value fits."""
+    output = get_column_output(values)
+    assert output == expected_output
+    assert [type(value) for value in output] == [type(value) for value in expected_output]
@@ -1,5 +1,8 @@
+from decimal import Decimal
+
 from nlp.generate.mixin import TemplateMixin, OnAddToTestCaseListenerMixin
 from nlp.generate.replaceable import Replaceable
+from nlp.generate.suite import Import
 from nlp.generate.variable import Variable
 from core.settings import PYTHON_INDENT_SPACES
 
@@ -40,12 +43,36 @@ class Argument(OnAddToTestCaseListenerMixin, Replaceable, TemplateMixin):
     def get_children(self):
         return [self.value]
 
+    @classmethod
+    def contains_decimal(cls, value):
+        """Checks if the value is a decimal or if it is a list, tuple or set that contains a decimal."""
+        if isinstance(value, (list, tuple, set)):
+            return any(cls.contains_decimal(v) for v in value)
+
+        return isinstance(value, Decimal)
+
+    def on_add_to_test_case(self, test_case):
+        super().on_add_to_test_case(test_case)
+
+        # decimals are written as `Decimal('1.50')` to keep their exact value
+        if self.contains_decimal(self.value):
+            test_case.test_suite.add_import(Import('decimal', 'Decimal'))
+
     @classmethod
     def get_string_for_template(cls, string):
+        if isinstance(string, Decimal):
+            return 'Decimal(\'{}\')'.format(string)
+
         return '\'{}\''.format(string) if isinstance(string, str) else str(string)
 
     def get_template_context(self, line_indent, at_start_of_line):
-        value = self.value.to_template(line_indent, False) if isinstance(self.value, TemplateMixin) else self.value
+        if isinstance(self.value, TemplateMixin):
+            value = self.value.to_template(line_indent, False)
+        elif isinstance(self.value, Decimal):
+            value = self.get_string_for_template(self.value)
+        else:
+            value = self.value
+
         return {'value': value}
 
 
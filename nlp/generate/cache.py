@@ -0,0 +1,51 @@
+import hashlib
+import json
+import os
+from json import JSONDecodeError
+from pathlib import Path
+
+from core.constants import GHENGO_VERSION
+from nlp.generate.suite import CachedTestCase
+
+
+class TestCaseCache(object):
+    """
+    Saves the generated code of test cases in files. Every entry is addressed by a hash of everything that has an
+    influence on the generated code. So if a scenario did not change, the code can be used again without
+    running it through the tilers.
+    """
+    def __init__(self, directory_path=None):
+        if directory_path is None:
+            directory_path = '{}/test_case_cache'.format(Path(__file__).parent.parent.absolute())
+
+        self.directory_path = directory_path
+
+    @classmethod
+    def get_key(cls, scenario_text, language, project_hash, test_type):
+        """Returns the key for a scenario. The version of Ghengo is part of it to ignore entries of old versions."""
+        key_content = json.dumps([GHENGO_VERSION, test_type, language, project_hash, scenario_text])
+        return hashlib.sha256(key_content.encode()).hexdigest()
+
+    def get_path(self, key):
+        return '{}/{}.json'.format(self.directory_path, key)
+
+    def get(self, key):
+        """Returns the cached test case for a key. If there is none, None is returned."""
+        try:
+            with open(self.get_path(key)) as file:
+                return CachedTestCase.from_dict(json.load(file))
+        except (FileNotFoundError, JSONDecodeError, KeyError):
+            return None
+
+    def set(self, key, cached_test_case):
+        """
+        Saves a cached test case for a key. The file is replaced at once so that other processes never read a
+        file that is only written partially.
+        """
+        path = self.get_path(key)
+        temp_path = '{}.{}.tmp'.format(path, os.getpid())
+
+        with open(temp_path, 'w') as file:
+            file.write(json.dumps(cached_test_case.to_dict()))
+
+        os.replace(temp_path, path)
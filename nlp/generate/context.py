@@ -0,0 +1,36 @@
+import threading
+
+
+class GenerationContext(object):
+    """
+    Holds everything that is needed to generate the test cases of one feature: the language of the document, the
+    Django project, the type of test that is generated and the caches. The context is passed explicitly to every
+    scenario, so that the scenarios of a feature can be generated at the same time.
+    """
+    def __init__(self, language, django_project, test_type, test_case_cache=None, project_hash=None):
+        self.language = language
+        self.django_project = django_project
+        self.test_type = test_type
+        self.test_case_cache = test_case_cache
+        self.project_hash = project_hash
+
+        self._background_snapshots = {}
+        self._background_locks = {}
+        self._lock = threading.Lock()
+
+    def get_background_lock(self, key):
+        """
+        Returns the lock for the background with the given key. It is held while the snapshot of the background is
+        created, so that the steps of a background are only run through the tilers once.
+        """
+        with self._lock:
+            if key not in self._background_locks:
+                self._background_locks[key] = threading.Lock()
+            return self._background_locks[key]
+
+    def get_background_snapshot(self, key):
+        """Returns the snapshot of the background with the given key or None if there is none yet."""
+        return self._background_snapshots.get(key)
+
+    def set_background_snapshot(self, key, snapshot):
+        self._background_snapshots[key] = snapshot
@@ -0,0 +1,82 @@
+from nlp.generate.mixin import TemplateMixin, OnAddToTestCaseListenerMixin
+
+
+def copy_generated(value, memo):
+    """
+    Copies a value that holds generated code like statements, expressions, arguments and variables. Only the
+    generated code is copied, everything else (model wrappers, Django objects, strings...) is shared with the original.
+    The memo maps the ids of already copied objects to their copies (like in `copy.deepcopy`). It can be prefilled
+    to replace objects instead of copying them.
+    """
+    if id(value) in memo:
+        return memo[id(value)]
+
+    if isinstance(value, list):
+        copied = []
+        memo[id(value)] = copied
+        copied.extend(copy_generated(entry, memo) for entry in value)
+        return copied
+
+    if isinstance(value, tuple):
+        return tuple(copy_generated(entry, memo) for entry in value)
+
+    if isinstance(value, dict):
+        copied = {}
+        memo[id(value)] = copied
+        for key, entry in value.items():
+            copied[key] = copy_generated(entry, memo)
+        return copied
+
+    if not isinstance(value, (TemplateMixin, OnAddToTestCaseListenerMixin)):
+        return value
+
+    # create the instance without `__init__` and `Replaceable.__new__`, the class of the original is already correct
+    copied = object.__new__(value.__class__)
+    memo[id(value)] = copied
+    for key, entry in vars(value).items():
+        setattr(copied, key, copy_generated(entry, memo))
+
+    return copied
+
+
+class StatementSnapshot(object):
+    """
+    Holds a copy of the statements of a test case together with the warnings that were created while the statements
+    were generated. The statements can be added to other test cases as fresh copies. The parameters of the test case
+    that were present before the statements were added are replaced by the ones with the same name in the other
+    test case.
+    """
+    def __init__(self, test_case, parameter_names, warnings):
+        self._test_case_placeholder = object()
+        self._parameter_placeholders = {name: (object(), object()) for name in parameter_names}
+        self.warnings = warnings
+
+        memo = {}
+        for source, placeholder in self._get_replacements(test_case):
+            memo[id(source)] = placeholder
+
+        # use the private list, `statements` would return a pass statement for empty test cases
+        self.statements = copy_generated(test_case._statements, memo)
+
+    def _get_replacements(self, test_case):
+        """Returns tuples of objects of the test case and their placeholders in the snapshot."""
+        replacements = [(test_case, self._test_case_placeholder)]
+
+        for name, (parameter_placeholder, variable_placeholder) in self._parameter_placeholders.items():
+            parameter = test_case.get_parameter_by_name(name)
+            replacements.append((parameter, parameter_placeholder))
+            replacements.append((parameter.variable, variable_placeholder))
+
+        return replacements
+
+    def add_to_test_case(self, test_case):
+        """Adds fresh copies of the statements to the test case and adds the warnings to its suite."""
+        memo = {}
+        for target, placeholder in self._get_replacements(test_case):
+            memo[id(placeholder)] = target
+
+        for statement in copy_generated(self.statements, memo):
+            test_case.add_statement(statement)
+
+        for code in self.warnings:
+            test_case.test_suite.add_warning(code)
@@ -80,6 +80,7 @@ class AssignmentStatement(Statement):
                     similar_statements.append(statement)
 
             self.variable.name_predetermined = str(len(similar_statements) + 1)
+            test_case.reindex_variable_of_statement(self)
 
     def get_template(self):
         if self.variable:
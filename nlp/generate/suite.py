@@ -5,6 +5,7 @@ from nlp.generate.replaceable import Replaceable
 from core.settings import PYTHON_INDENT_SPACES
 from nlp.generate.statement import PassStatement, Statement
 from nlp.generate.utils import to_function_name
+from nlp.generate.variable import Variable
 from nlp.generate.warning import GenerationWarningCollection
 
 
@@ -37,6 +38,16 @@ class Import(Replaceable, TemplateMixin):
             'variables': ', '.join(self.variables),
         }
 
+    def to_dict(self):
+        """Returns a dict that can be used to create the same import again via `from_dict`."""
+        return {'path': self.path, 'variables': self.variables.copy(), 'placeholder': False}
+
+    @classmethod
+    def from_dict(cls, data):
+        if data['placeholder']:
+            return ImportPlaceholder(data['variables'].copy())
+        return Import(data['path'], data['variables'].copy())
+
 
 class ImportPlaceholder(Import):
     """
@@ -59,6 +70,11 @@ class ImportPlaceholder(Import):
 
         return {'variables': variables, 'todo_message': todo_message}
 
+    def to_dict(self):
+        data = super().to_dict()
+        data['placeholder'] = True
+        return data
+
 
 class TestCaseBase(Replaceable, TemplateMixin):
     class ParameterAlreadyPresent(Exception):
@@ -75,6 +91,11 @@ class TestCaseBase(Replaceable, TemplateMixin):
         self._statements = []
         self.test_suite = test_suite
 
+        # indexes to look up statements without going over all of them, they are updated in `add_statement`
+        self._statements_by_expression = {}
+        self._statements_by_variable_name = {}
+        self._indexed_variable_names = {}
+
     @property
     def name(self):
         """
@@ -92,9 +113,15 @@ class TestCaseBase(Replaceable, TemplateMixin):
 
     def get_all_statements_with_expression(self, expression_cls):
         """
-        Returns all statements that have a certain expression class.
+        Returns all statements that have a certain expression class. The statements of each class are collected
+        once and kept up to date when statements are added.
         """
-        return [s for s in self.statements if isinstance(s.expression, expression_cls)]
+        if expression_cls not in self._statements_by_expression:
+            self._statements_by_expression[expression_cls] = [
+                s for s in self.statements if isinstance(s.expression, expression_cls)
+            ]
+
+        return list(self._statements_by_expression[expression_cls])
 
     @property
     def statements(self):
@@ -117,9 +144,54 @@ class TestCaseBase(Replaceable, TemplateMixin):
                 line_indent + PYTHON_INDENT_SPACES, at_start_of_line=True) for statement in self.statements),
         }
 
+    @classmethod
+    def _get_variable_name_for_string(cls, string, reference_string):
+        """
+        Returns the name that a variable for the string would have. If the name depends on the reference string
+        of the variable that is compared, None is returned.
+        """
+        if not to_function_name(string) and not reference_string:
+            return None
+
+        return Variable(string, reference_string or '').name or None
+
+    def _index_variable_of_statement(self, statement):
+        """Adds the statement to the index of variable names with the current name of its variable."""
+        variable = getattr(statement, 'variable', None)
+        if variable is None:
+            return
+
+        name = variable.name
+        self._statements_by_variable_name.setdefault(name, []).append(statement)
+        self._indexed_variable_names[id(statement)] = name
+
+    def reindex_variable_of_statement(self, statement):
+        """Must be called when the variable of a statement in this test case changes its name."""
+        if id(statement) not in self._indexed_variable_names:
+            return
+
+        old_name = self._indexed_variable_names.pop(id(statement))
+        self._statements_by_variable_name[old_name] = [
+            s for s in self._statements_by_variable_name[old_name] if s is not statement
+        ]
+        self._index_variable_of_statement(statement)
+
+        # keep the order of the statements in the test case
+        positions = {id(s): index for index, s in enumerate(self._statements)}
+        same_name_statements = self._statements_by_variable_name[self._indexed_variable_names[id(statement)]]
+        same_name_statements.sort(key=lambda s: positions[id(s)])
+
     def get_variable_by_string(self, string, reference_string):
-        """Returns a variable with a given string."""
-        for statement in self.statements:
+        """
+        Returns a variable with a given string. Only the statements whose variable has the same name are checked.
+        """
+        name = self._get_variable_name_for_string(string, reference_string)
+        if name is None:
+            statements = self.statements
+        else:
+            statements = self._statements_by_variable_name.get(name, [])
+
+        for statement in statements:
             variable = getattr(statement, 'variable', None)
 
             if statement.string_matches_variable(string, reference_string):
@@ -166,6 +238,12 @@ class TestCaseBase(Replaceable, TemplateMixin):
         self._statements.append(statement)
         statement.on_add_to_test_case(self)
 
+        for expression_cls, statements in self._statements_by_expression.items():
+            if isinstance(statement.expression, expression_cls):
+                statements.append(statement)
+
+        self._index_variable_of_statement(statement)
+
     def add_parameter(self, parameter):
         if not isinstance(parameter, Parameter):
             raise ValueError('You can only add Parameter instances.')
@@ -184,6 +262,40 @@ class TestCaseBase(Replaceable, TemplateMixin):
             statement.clean_up(self)
 
 
+class CachedTestCase(TemplateMixin):
+    """
+    A test case whose code was generated in a previous run. It holds the final code and everything that the test
+    case added to the suite, so that it can replace a test case that would generate the same code.
+    """
+    def __init__(self, code, imports, warnings):
+        super().__init__()
+        self.code = code
+        self.imports = imports
+        self.warnings = warnings
+
+    @classmethod
+    def from_test_case(cls, test_case, recording):
+        """Creates an instance from a test case that is cleaned up and the recording of its changes to the suite."""
+        return cls(test_case.to_template(), recording['imports'], recording['warnings'])
+
+    def to_dict(self):
+        return {'code': self.code, 'imports': self.imports, 'warnings': self.warnings}
+
+    @classmethod
+    def from_dict(cls, data):
+        return cls(data['code'], data['imports'], data['warnings'])
+
+    def get_template(self):
+        return '{code}'
+
+    def get_template_context(self, line_indent, at_start_of_line):
+        return {'code': self.code}
+
+    def clean_up(self):
+        """The code is final already, so there is nothing to clean up."""
+        pass
+
+
 class TestSuiteBase(Replaceable, TemplateMixin):
     test_case_class = None
 
@@ -193,6 +305,52 @@ class TestSuiteBase(Replaceable, TemplateMixin):
         self.warning_collection = GenerationWarningCollection()
         self.imports = []
         self.test_cases = []
+        self._recordings = []
+
+    def start_recording(self):
+        """
+        Start to record all imports and warnings that are added to the suite. The returned recording is filled until
+        it is passed to `stop_recording`. Multiple recordings can be active at the same time.
+        """
+        recording = {'imports': [], 'warnings': []}
+        self._recordings.append(recording)
+        return recording
+
+    def stop_recording(self, recording):
+        """Stops the given recording and returns it."""
+        self._recordings = [r for r in self._recordings if r is not recording]
+        return recording
+
+    def _replay(self, imports, warnings):
+        """Adds recorded imports and warnings to this suite in the order in which they were recorded."""
+        for import_data in imports:
+            self.add_import(Import.from_dict(import_data))
+
+        for code in warnings:
+            self.add_warning(code)
+
+    def add_cached_test_case(self, cached_test_case):
+        """Adds a cached test case and replays everything that the original test case added to the suite."""
+        self._replay(cached_test_case.imports, cached_test_case.warnings)
+        self.test_cases.append(cached_test_case)
+        return cached_test_case
+
+    def add_recorded_test_case(self, test_case, recording):
+        """
+        Adds a test case that was generated in another suite. Everything that the test case added to the other suite
+        while the recording was active is replayed in this suite.
+        """
+        self._replay(recording['imports'], recording['warnings'])
+        test_case.test_suite = self
+        self.test_cases.append(test_case)
+        return test_case
+
+    def add_warning(self, code):
+        """Add a warning to the test suite/ the test file."""
+        for recording in self._recordings:
+            recording['warnings'].append(code)
+
+        self.warning_collection.add_warning(code)
 
     def clean_up(self):
         """
@@ -217,6 +375,9 @@ class TestSuiteBase(Replaceable, TemplateMixin):
 
     def add_import(self, import_instance):
         """Add an import to the test suite/ the test file."""
+        for recording in self._recordings:
+            recording['imports'].append(import_instance.to_dict())
+
         if import_instance not in self.imports:
             self.imports.append(import_instance)
         else:
@@ -1,4 +1,8 @@
+from decimal import Decimal
+
 from nlp.generate.argument import Argument, Kwarg
+from nlp.generate.decorator import Decorator
+from nlp.generate.suite import Import, TestCaseBase, TestSuiteBase
 
 
 def test_argument_string():
@@ -29,3 +33,18 @@ def test_kwarg_template():
     assert Kwarg('foo', [123]).to_template() == 'foo=[123]'
     assert Kwarg('foo', 123).to_template() == 'foo=123'
     assert Kwarg('foo', '123').to_template() == 'foo=\'123\''
+
+
+class TestingTestSuiteBase(TestSuiteBase):
+    test_case_class = TestCaseBase
+
+
+def test_argument_decimal():
+    """Check that decimals are written with their exact value and that Decimal is imported."""
+    assert Argument(Decimal('1.50')).to_template() == 'Decimal(\'1.50\')'
+    assert Argument([(Decimal('2.0'), 1)]).to_template() == '[(Decimal(\'2.0\'), 1)]'
+
+    suite = TestingTestSuiteBase('foo')
+    test_case = suite.create_and_add_test_case('bar')
+    test_case.add_decorator(Decorator('foo', [Argument([(Decimal('2.0'), 1)])]))
+    assert suite.imports == [Import('decimal', 'Decimal')]
@@ -0,0 +1,61 @@
+from nlp.generate.argument import Argument, Kwarg
+from nlp.generate.attribute import Attribute
+from nlp.generate.expression import FunctionCallExpression
+from nlp.generate.parameter import Parameter
+from nlp.generate.snapshot import StatementSnapshot, copy_generated
+from nlp.generate.statement import AssignmentStatement
+from nlp.generate.suite import TestCaseBase, TestSuiteBase
+from nlp.generate.variable import Variable
+
+
+class TestingTestSuiteBase(TestSuiteBase):
+    test_case_class = TestCaseBase
+
+
+def test_copy_generated():
+    """Check that only generated code is copied and that references between the copies are kept."""
+    model = object()
+    variable = Variable('1', 'order')
+    statement = AssignmentStatement(
+        variable=variable,
+        expression=FunctionCallExpression('foo', [Kwarg('bar', model), Argument(variable.get_reference())]),
+    )
+
+    copied = copy_generated(statement, {})
+    assert copied is not statement
+    assert copied.variable is not variable
+    assert copied.expression.function_kwargs[0].value.value is model
+    assert copied.expression.function_kwargs[1].value.variable is copied.variable
+    assert copied.to_template() == statement.to_template()
+
+
+def test_statement_snapshot():
+    """Check that a snapshot adds fresh copies of the statements to other test cases."""
+    suite = TestingTestSuiteBase('foo')
+    test_case = suite.create_and_add_test_case('foo')
+    test_case.add_parameter(Parameter('name'))
+    variable = Variable('1', 'order')
+    test_case.add_statement(AssignmentStatement(
+        variable=variable,
+        expression=FunctionCallExpression('foo', [Kwarg('name', test_case.parameters[0].variable.get_reference())]),
+    ))
+    test_case.add_statement(AssignmentStatement(
+        variable=Variable('2', 'order'),
+        expression=Attribute(variable.get_reference(), 'name'),
+    ))
+    suite.add_warning('001')
+
+    snapshot = StatementSnapshot(test_case, ['name'], ['001'])
+
+    other_suite = TestingTestSuiteBase('foo')
+    other_test_case = other_suite.create_and_add_test_case('bar')
+    other_test_case.add_parameter(Parameter('name'))
+    snapshot.add_to_test_case(other_test_case)
+
+    assert other_test_case.to_template().replace('bar', 'foo') == test_case.to_template()
+    assert [w.code for w in other_suite.warning_collection.warnings] == ['001']
+    assert other_test_case.statements[0] is not test_case.statements[0]
+    assert other_test_case.statements[0].test_case is other_test_case
+    kwarg_variable = other_test_case.statements[0].expression.function_kwargs[0].value.value.variable
+    assert kwarg_variable is other_test_case.parameters[0].variable
+    assert other_test_case.statements[1].expression.variable_ref.variable is other_test_case.statements[0].variable
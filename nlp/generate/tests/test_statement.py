@@ -78,6 +78,9 @@ def test_assignment_statement_generate_variable_with_effect():
             AssignmentStatement(exp, Variable('other_name', 'some_other_reference')),
         ]
 
+        def reindex_variable_of_statement(self, statement):
+            pass
+
     statement = AssignmentStatement(exp, Variable('', 'my_reference'))
     assert not bool(statement.variable)
     statement.generate_variable(MyTest())
@@ -3,7 +3,7 @@ from nlp.generate.decorator import Decorator
 from nlp.generate.expression import FunctionCallExpression
 from nlp.generate.parameter import Parameter
 from nlp.generate.statement import PassStatement, AssertStatement, AssignmentStatement
-from nlp.generate.suite import Import, TestCaseBase, TestSuiteBase
+from nlp.generate.suite import Import, TestCaseBase, TestSuiteBase, ImportPlaceholder, CachedTestCase
 from nlp.generate.variable import Variable
 
 
@@ -56,6 +56,37 @@ def test_test_case_get_variable_by_string():
     assert test_case.get_variable_by_string('other_name', 'my_reference') == var
 
 
+def test_test_case_variable_index():
+    """Check that variables are found via the index, including digits and variables that get their name later."""
+    test_case = TestingTestSuiteBase('bar').create_and_add_test_case('foo')
+    expression = FunctionCallExpression('foo', [Kwarg('bar', 123)])
+    order = Variable('1', 'order')
+    user = Variable('', 'user')
+    test_case.add_statement(AssignmentStatement(expression, order))
+    statement = AssignmentStatement(expression, user)
+    test_case.add_statement(statement)
+    assert test_case.get_variable_by_string('1', 'order') == order
+    assert test_case.get_variable_by_string('1', 'user') is None
+
+    # the variable gets a name after it was added
+    statement.generate_variable(test_case)
+    assert test_case.get_variable_by_string('2', 'user') is user
+    assert test_case.get_variable_by_string('user_2', None) is user
+    assert test_case.get_variable_by_string('order_1', None) is order
+
+
+def test_test_case_get_all_statements_with_expression():
+    """Check that statements by expression are kept up to date when statements are added."""
+    test_case = TestingTestSuiteBase('bar').create_and_add_test_case('foo')
+    assert test_case.get_all_statements_with_expression(FunctionCallExpression) == []
+    statement_1 = AssertStatement(FunctionCallExpression('foo', [Kwarg('bar', 123)]))
+    test_case.add_statement(statement_1)
+    test_case.add_statement(PassStatement())
+    statement_2 = AssertStatement(FunctionCallExpression('foo', []))
+    test_case.add_statement(statement_2)
+    assert test_case.get_all_statements_with_expression(FunctionCallExpression) == [statement_1, statement_2]
+
+
 def test_test_case_variable_defined():
     """Check that you can check if a variable is defined in either the parameters or in any statement."""
     test_case = TestingTestSuiteBase('bar').create_and_add_test_case('foo')
@@ -164,3 +195,51 @@ def test_test_suite_template_context():
     assert context['separator'] == '\n\n\n'
     assert context['imports'] == 'from nlp.generate.statement import PassStatement, AssertStatement\nimport pytest'
     assert context['test_cases'] == ''
+
+
+def test_test_suite_add_cached_test_case():
+    """Check that a cached test case replays its imports and warnings and creates the same output."""
+    def fill_suite(suite):
+        test_case = suite.create_and_add_test_case('bar')
+        test_case.add_statement(AssertStatement(FunctionCallExpression('foo', [Kwarg('bar', 123)])))
+        suite.add_import(Import('nlp.generate.statement', ['PassStatement']))
+        suite.add_import(ImportPlaceholder(['Order']))
+        suite.add_warning('001')
+        return test_case
+
+    suite = TestingTestSuiteBase('foo')
+    suite.add_import(Import('nlp.generate.statement', ['AssertStatement']))
+    recording = suite.start_recording()
+    test_case = fill_suite(suite)
+    suite.stop_recording(recording)
+    suite.clean_up()
+    assert recording['warnings'] == ['001']
+    assert len(recording['imports']) == 2
+
+    cached_test_case = CachedTestCase.from_dict(CachedTestCase.from_test_case(test_case, recording).to_dict())
+    cached_suite = TestingTestSuiteBase('foo')
+    cached_suite.add_import(Import('nlp.generate.statement', ['AssertStatement']))
+    cached_suite.add_cached_test_case(cached_test_case)
+    cached_suite.clean_up()
+
+    assert cached_suite.get_template_context(0, True) == suite.get_template_context(0, True)
+    assert cached_suite.imports[0].variables == ['AssertStatement', 'PassStatement']
+    assert isinstance(cached_suite.imports[1], ImportPlaceholder)
+
+
+def test_test_suite_add_recorded_test_case():
+    """Check that a test case from another suite is moved to the suite and its recording is replayed."""
+    other_suite = TestingTestSuiteBase('foo')
+    recording = other_suite.start_recording()
+    test_case = other_suite.create_and_add_test_case('bar')
+    other_suite.add_import(Import('nlp.generate.statement', ['PassStatement']))
+    other_suite.add_warning('001')
+    other_suite.stop_recording(recording)
+
+    suite = TestingTestSuiteBase('foo')
+    suite.add_import(Import('nlp.generate.statement', ['AssertStatement']))
+    assert suite.add_recorded_test_case(test_case, recording) is test_case
+    assert test_case.test_suite is suite
+    assert suite.test_cases == [test_case]
+    assert suite.imports[0].variables == ['AssertStatement', 'PassStatement']
+    assert [w.code for w in suite.warning_collection.warnings] == ['001']
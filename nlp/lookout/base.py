@@ -15,6 +15,11 @@ class Lookout(object):
     """
     # the minimum similarity value to find a value
     similarity_benchmark = 0.5
+    # the highest value that `get_similarity` can return
+    max_similarity = 1
+    # if true, the output objects are evaluated in the order of `get_output_object_priority` and output objects that
+    # cannot be better than the fittest one are skipped; the result is the same as without it
+    prioritize_output_objects = False
 
     def __init__(self, text, src_language, locate_on_init=False, *args, **kwargs):
         self.text = text
@@ -28,6 +33,8 @@ class Lookout(object):
         self._highest_similarity = 0
         self._fittest_output_object = None
         self._fittest_keyword = None
+        self._fittest_index = None
+        self._output_object_index = None
         self._results_in_fallback = False
 
         # normally the locate() is not done on init because of the performance reasons, you can call it on init
@@ -131,6 +138,45 @@ class Lookout(object):
         """
         raise NotImplementedError()
 
+    def get_output_object_priority(self, output_object):
+        """
+        Returns a cheap estimate of how well an output object fits the text. Output objects with a lower priority
+        are evaluated first if `prioritize_output_objects` is true.
+        """
+        return 0
+
+    def get_output_object_upper_bound(self, output_object):
+        """Returns the highest similarity that an output object can reach without evaluating it."""
+        return self.max_similarity
+
+    def get_indexed_output_objects(self, output_objects):
+        """
+        Returns tuples of the index of each output object and the object itself in the order in which they are
+        evaluated by `locate`.
+        """
+        indexed_output_objects = list(enumerate(output_objects))
+
+        if self.prioritize_output_objects:
+            indexed_output_objects.sort(key=lambda entry: (self.get_output_object_priority(entry[1]), entry[0]))
+
+        return indexed_output_objects
+
+    def can_skip_output_object(self, index, output_object):
+        """
+        If `prioritize_output_objects` is true, this is checked before an output object is evaluated. The output
+        object is skipped if it cannot become the fittest one: its upper bound is lower than the highest similarity
+        or equal to it while the fittest output object comes first in the original order (which wins a tie in an
+        exhaustive search).
+        """
+        if not self.prioritize_output_objects or self.fittest_output_object is None:
+            return False
+
+        upper_bound = self.get_output_object_upper_bound(output_object)
+        if upper_bound == self.highest_similarity:
+            return index > self._fittest_index
+
+        return upper_bound < self.highest_similarity
+
     def output_object_is_relevant(self, output_object):
         """
         Check if a output_object is relevant given certain circumstances.
@@ -142,7 +188,8 @@ class Lookout(object):
         If this returns true, locate will stop looking at future output objects and simply return what is found.
         This will be checked after each object output.
         """
-        return self.highest_similarity >= 1
+        # prioritized output objects are not in their original order, `can_skip_output_object` handles them instead
+        return not self.prioritize_output_objects and self.highest_similarity >= 1
 
     def go_to_next_output(self, similarity):
         """
@@ -162,6 +209,12 @@ class Lookout(object):
         """
         If this returns true, the output_object will be taken as the new self.fittest_output_object.
         """
+        # the output objects are not evaluated in their original order, so a tie goes to the one that comes first
+        # originally - just like in an exhaustive search
+        if self.prioritize_output_objects and self.fittest_output_object is not None:
+            if similarity == self.highest_similarity:
+                return self._output_object_index < self._fittest_index
+
         return similarity > self.highest_similarity
 
     def get_fallback(self):
@@ -184,6 +237,7 @@ class Lookout(object):
         self._highest_similarity = similarity
         self._fittest_output_object = output_object
         self._fittest_keyword = keyword
+        self._fittest_index = self._output_object_index
 
     def has_invalid_fittest_output(self):
         """
@@ -206,15 +260,17 @@ class Lookout(object):
 
         self._results_in_fallback = False
 
-        for output_object in self.get_output_objects(*args, **kwargs):
+        for index, output_object in self.get_indexed_output_objects(self.get_output_objects(*args, **kwargs)):
             # if we should stop, end the loop
             if self.should_stop_looking_for_output():
                 break
 
-            # if the object is not relevant, go to the next
-            if not self.output_object_is_relevant(output_object):
+            # if the object cannot be better than the current one or it is not relevant, go to the next
+            if self.can_skip_output_object(index, output_object) or not self.output_object_is_relevant(output_object):
                 continue
 
+            self._output_object_index = index
+
             # get and prepare the keywords
             keywords = self.get_keywords(output_object)
             prepared_keywords = self.prepare_keywords(keywords)
@@ -20,6 +20,10 @@ class DjangoProjectLookout(Lookout, ABC):
     """
     similarity_benchmark = 0.59
 
+    def __init__(self, *args, **kwargs):
+        self._priority_texts = None
+        super().__init__(*args, **kwargs)
+
     def prepare_keywords(self, keywords):
         return set([k.replace('_', ' ') if k else None for k in keywords])
 
@@ -27,6 +31,41 @@ class DjangoProjectLookout(Lookout, ABC):
         """Always look through all outputs"""
         return False
 
+    @property
+    def priority_texts(self):
+        """The texts that a keyword of an output object is compared to in `get_output_object_priority`."""
+        if self._priority_texts is None:
+            texts = {self.text.lower(), str(self.doc_en).lower()}
+
+            if len(self.doc_src_language) == 1:
+                texts.add(self.doc_src_language[0].lemma_.lower())
+
+            self._priority_texts = texts
+        return self._priority_texts
+
+    def get_output_object_priority(self, output_object):
+        """Output objects with a keyword that equals the text, its lemma or its translation are evaluated first."""
+        if not self.text:
+            return 1
+
+        for keyword in self.prepare_keywords(self.get_keywords(output_object)):
+            if keyword and keyword.lower() in self.priority_texts:
+                return 0
+
+        return 1
+
+    def get_output_object_upper_bound(self, output_object):
+        """
+        The similarity of `get_similarity` is never higher than the max similarity (the cosine similarity is capped
+        and the weighted sum of the similarities is below 1). The cosine similarity of the same vectors is exactly
+        1, so an exact match reaches the bound and the other output objects can be skipped. Output objects without
+        keywords have no variations and can never be found.
+        """
+        if not self.text or not any(self.prepare_keywords(self.get_keywords(output_object))):
+            return 0
+
+        return self.max_similarity
+
     def get_compare_variations(self, output_object, keyword):
         variations = []
 
@@ -109,6 +148,8 @@ class ClassArgumentLookout(DjangoProjectLookout):
 
 
 class ModelFieldLookout(DjangoProjectLookout):
+    prioritize_output_objects = True
+
     def get_fallback(self):
         return ModelFieldWrapper(name=self.translator_to_en.translate(self.text))
 
@@ -120,6 +161,8 @@ class ModelFieldLookout(DjangoProjectLookout):
 
 
 class SerializerFieldLookout(DjangoProjectLookout):
+    prioritize_output_objects = True
+
     def get_fallback(self):
         return ApiFieldWrapper(name=self.translator_to_en.translate(self.text))
 
@@ -134,6 +177,8 @@ class SerializerFieldLookout(DjangoProjectLookout):
 
 
 class ModelLookout(DjangoProjectLookout):
+    prioritize_output_objects = True
+
     def get_fallback(self):
         return ModelWrapper(name=self.translator_to_en.translate(self.text))
 
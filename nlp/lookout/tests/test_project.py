@@ -1,5 +1,12 @@
+import pytest
+
 from core.constants import Languages
+from django_meta.project import DjangoProject
 from nlp.lookout.base import Lookout
+from nlp.lookout.project import ModelFieldLookout
+from nlp.tests.utils import MockTranslator
+
+django_project = DjangoProject('django_sample_project.apps.config.settings')
 
 
 def test_searcher_search_with_results():
@@ -23,3 +30,68 @@ def test_searcher_search_with_results():
 
     searcher = Custom6Searcher('Auftrag', Languages.DE)
     assert searcher.locate(None) == 6
+
+
+@pytest.mark.parametrize(
+    'output_objects, priorities, expected_output, expected_evaluations', [
+        (['x', 'a', 'b', 'A'], {'a': 0}, 'a', 2),
+        (['A', 'b', 'a'], {'a': 0}, 'A', 2),
+        (['x', 'y', 'z'], {}, 'y', 3),
+    ]
+)
+def test_lookout_prioritized_output_objects(output_objects, priorities, expected_output, expected_evaluations):
+    """Check that prioritized output objects result in the same output as an exhaustive search with less work."""
+    similarities = {'x': 0.3, 'y': 0.7, 'z': 0.7, 'a': 1, 'A': 1, 'b': 0.5}
+
+    class LetterLookout(Lookout):
+        def __init__(self, *args, **kwargs):
+            super().__init__(*args, **kwargs)
+            self.evaluated = []
+
+        def get_output_objects(self, *args, **kwargs):
+            return output_objects
+
+        def get_output_object_priority(self, letter):
+            return priorities.get(letter, 1)
+
+        def get_compare_variations(self, letter, keyword):
+            return [(letter, None)]
+
+        def get_keywords(self, letter):
+            return [letter]
+
+        def get_similarity(self, letter, target_doc):
+            self.evaluated.append(letter)
+            return similarities[letter]
+
+        def get_fallback(self):
+            return None
+
+    class PrioritizedLetterLookout(LetterLookout):
+        prioritize_output_objects = True
+
+    exhaustive_lookout = LetterLookout('a', Languages.DE)
+    prioritized_lookout = PrioritizedLetterLookout('a', Languages.DE)
+    assert exhaustive_lookout.locate() == prioritized_lookout.locate() == expected_output
+    assert exhaustive_lookout.highest_similarity == prioritized_lookout.highest_similarity
+    assert len(prioritized_lookout.evaluated) == expected_evaluations
+
+
+def test_model_field_lookout_prioritized_output_objects(mocker):
+    """Check that a model field lookout finds the same field as an exhaustive search with fewer similarities."""
+    mocker.patch('deep_translator.DeepL.translate', MockTranslator())
+    similarity_spy = mocker.spy(ModelFieldLookout, 'get_similarity')
+    order_wrapper = [m for m in django_project.get_models(as_wrapper=True) if m.name == 'Order'][0]
+
+    exhaustive_lookout = ModelFieldLookout('Nummer', Languages.DE)
+    exhaustive_lookout.prioritize_output_objects = False
+    exhaustive_field = exhaustive_lookout.locate(order_wrapper)
+    exhaustive_calls = similarity_spy.call_count
+
+    similarity_spy.reset_mock()
+    prioritized_lookout = ModelFieldLookout('Nummer', Languages.DE)
+    assert prioritized_lookout.locate(order_wrapper) == exhaustive_field
+    assert exhaustive_field.name == 'number'
+    # the similarity of the field is exactly 1, so the fields after it are skipped
+    assert prioritized_lookout.highest_similarity == exhaustive_lookout.highest_similarity == 1
+    assert similarity_spy.call_count < exhaustive_calls
@@ -11,12 +11,23 @@ class Similarity(object):
 
 
 class CosineSimilarity(Similarity):
+    # how far a similarity may be away from 1 due to rounding
+    rounding_tolerance = 1e-6
+
     def get_similarity(self):
-        """It is assumed that the input is from spacy. Spacy implements the Cosine distance for similarity."""
+        """
+        It is assumed that the input is from spacy. Spacy implements the Cosine distance for similarity. Due to
+        rounding, spacy may return values slightly above or below 1 for the same vectors (like 0.99999994), so those
+        values are returned as 1.
+        """
         if not self.input_1.vector_norm or not self.input_2.vector_norm:
             return 0
 
-        return self.input_1.similarity(self.input_2)
+        similarity = self.input_1.similarity(self.input_2)
+        if similarity >= 1 - self.rounding_tolerance:
+            return 1
+
+        return similarity
 
 
 class ContainsSimilarity(Similarity):
@@ -25,6 +25,10 @@ class MockConverter:
     def __init__(self, *args, **kwargs):
         pass
 
+    @classmethod
+    def get_compatibility_upper_bound(cls, document, test_case):
+        return 1
+
 
 class GoodConverter(MockConverter):
     def get_document_compatibility(self):
@@ -56,6 +60,46 @@ def test_tiler_best_converter():
     assert isinstance(tiler.best_converter, GoodConverter)
 
 
+def test_tiler_skips_converters_by_upper_bound():
+    """Check that converters whose upper bound cannot beat the best converter are never created."""
+    created = []
+
+    class TrackedConverter(MockConverter):
+        def __init__(self, *args, **kwargs):
+            super().__init__(*args, **kwargs)
+            created.append(self.__class__)
+
+    class LowBoundConverter(TrackedConverter):
+        @classmethod
+        def get_compatibility_upper_bound(cls, document, test_case):
+            return .3
+
+        def get_document_compatibility(self):
+            return .3
+
+    class AverageTrackedConverter(TrackedConverter, AverageConverter):
+        pass
+
+    class BadTrackedConverter(TrackedConverter, BadConverter):
+        pass
+
+    class CustomTiler(Tiler):
+        converter_classes = [LowBoundConverter, BadTrackedConverter, AverageTrackedConverter]
+
+    tiler = CustomTiler('Mein Text', Languages.DE, 'django_proj', 'test_case')
+    assert isinstance(tiler.best_converter, AverageTrackedConverter)
+    assert created == [BadTrackedConverter, AverageTrackedConverter]
+
+    # if the compatibility is equal, the converter that comes first wins
+    class EqualTiler(Tiler):
+        converter_classes = [BadTrackedConverter, LowBoundConverter, BadTrackedConverter]
+
+    created.clear()
+    tiler = EqualTiler('Mein Text', Languages.DE, 'django_proj', 'test_case')
+    assert isinstance(tiler.best_converter, LowBoundConverter)
+    assert created == [BadTrackedConverter, BadTrackedConverter, LowBoundConverter]
+
+
 @pytest.mark.parametrize(
     'keyword, text, expected_converter_cls', [
         ('Dann', 'sollten Aufträge mit dem Namen "Alice" existieren.', ExistsQuerysetConverter),
@@ -1,4 +1,5 @@
 from core.performance import StepLevelPerformanceMeasurement, measure, MeasureKeys
+from nlp.converter.base.analysis import StepAnalysis
 from nlp.converter.base.converter import Converter
 from nlp.converter.file import FileConverter
 from nlp.converter.model import ModelVariableReferenceConverter, ModelFactoryConverter, AssertPreviousModelConverter
@@ -21,6 +22,7 @@ class Tiler(object):
         self.ast_object = ast_object
         self.language = language
         self._document = None
+        self._analysis = None
         self.django_project = django_project
         self.test_case = test_case
         self._best_converter = None
@@ -35,22 +37,53 @@ class Tiler(object):
             self._document = Nlp.for_language(self.language)(self.ast_as_text)
         return self._document
 
+    @property
+    def analysis(self):
+        """The analysis of the document that is shared by all converters of this tiler."""
+        if self._analysis is None:
+            self._analysis = StepAnalysis(self.document, self.django_project)
+        return self._analysis
+
+    def get_converter_candidates(self):
+        """
+        Returns tuples of (upper bound, index, converter class) for all converter classes. The upper bounds are
+        calculated from cheap features of the document. The candidates are sorted by the highest bound first, so that
+        converters that are likely to fit are created before the others.
+        """
+        candidates = []
+
+        for index, converter_cls in enumerate(self.converter_classes):
+            upper_bound = min(converter_cls.get_compatibility_upper_bound(self.document, self.test_case), 1)
+            candidates.append((upper_bound, index, converter_cls))
+
+        return sorted(candidates, key=lambda candidate: (-candidate[0], candidate[1]))
+
     @measure(by=StepLevelPerformanceMeasurement, key=MeasureKeys.TILER_BEST_CONVERTER)
     def _get_best_converter(self):
+        """
+        Returns the converter with the highest compatibility. If multiple converters have the same compatibility,
+        the one that comes first in `converter_classes` is used. A compatibility of 1 or higher is the maximum.
+
+        Only converters whose upper bound can beat the current best one are created and evaluated.
+        """
         highest_compatibility = 0
+        best_index = -1
         best_converter = None
 
-        for converter_cls in self.converter_classes:
-            converter = converter_cls(self.document, self.ast_object, self.django_project, self.test_case)
-            compatibility = converter.get_document_compatibility()
+        for upper_bound, index, converter_cls in self.get_converter_candidates():
+            # since the candidates are sorted, none of the following converters can beat the best one either
+            if upper_bound < highest_compatibility or (upper_bound == highest_compatibility and index > best_index):
+                break
 
-            if compatibility > highest_compatibility:
+            converter = converter_cls(
+                self.document, self.ast_object, self.django_project, self.test_case, analysis=self.analysis)
+            compatibility = min(converter.get_document_compatibility(), 1)
+
+            if compatibility > highest_compatibility or (compatibility == highest_compatibility and index < best_index):
                 highest_compatibility = compatibility
+                best_index = index
                 best_converter = converter
 
-                if compatibility >= 1:
-                    break
-
         return best_converter
 
     @property
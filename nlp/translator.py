@@ -1,6 +1,8 @@
 import inspect
 import json
 import os
+import threading
+from contextlib import contextmanager
 from json import JSONDecodeError
 from pathlib import Path
 
@@ -8,6 +10,12 @@ from deep_translator import DeepL
 
 from settings import Settings
 
+# file locks are not available on every platform, in that case the cache is not locked
+try:
+    import fcntl
+except ImportError:
+    fcntl = None
+
 
 class CacheTranslator(object):
     """
@@ -39,6 +47,36 @@ class CacheTranslator(object):
         directory_path = Path(__file__).parent.absolute()
         return '{}/translation_cache/{}_to_{}.json'.format(directory_path, self.src_language, self.target_language)
 
+    @contextmanager
+    def lock_cache(self):
+        """
+        Locks the cache while it is changed. Multiple processes may translate at the same time, so the cache has to
+        be read and written by one process at a time. Otherwise they would overwrite the translations of each other.
+        """
+        if fcntl is None:
+            yield
+            return
+
+        with open('{}.lock'.format(self.cache_path), 'w') as lock_file:
+            fcntl.flock(lock_file, fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                fcntl.flock(lock_file, fcntl.LOCK_UN)
+
+    def save_cache(self, content):
+        """
+        Saves the content as the cache. The file is replaced at once so that other processes (or threads) never
+        read a file that is only written partially.
+        """
+        temp_path = '{}.{}.{}.tmp'.format(self.cache_path, os.getpid(), threading.get_ident())
+
+        with open(temp_path, 'w') as file:
+            file.write(json.dumps(content, indent=2, sort_keys=True))
+            file.close()
+
+        os.replace(temp_path, self.cache_path)
+
     def create_cache(self):
         """
         Creates the file for the cache.
@@ -46,9 +84,7 @@ class CacheTranslator(object):
         if self.translator is None:
             return
 
-        with open(self.cache_path, 'w') as file:
-            file.write('{}')
-            file.close()
+        self.save_cache({})
 
     def write_to_cache(self, text, translation):
         """
@@ -57,28 +93,29 @@ class CacheTranslator(object):
         if self.translator is None:
             return
 
-        file_content = self.get_cache()
-
-        with open(self.cache_path, 'w') as file:
+        with self.lock_cache():
+            # read the cache while it is locked to keep the entries that other processes added in the meantime
+            file_content = self.get_cache()
             file_content[self.get_cache_name_for_text(text)] = translation
-            file.write(json.dumps(file_content, indent=2, sort_keys=True))
-            file.close()
+            self.save_cache(file_content)
 
     def remove_from_cache(self, text):
         """Removes an entry from the cache."""
         if self.translator is None:
             return
 
-        file_content = self.get_cache()
-
-        with open(self.cache_path, 'w') as file:
+        with self.lock_cache():
+            file_content = self.get_cache()
             del file_content[self.get_cache_name_for_text(text)]
-            file.write(json.dumps(file_content, indent=2, sort_keys=True))
-            file.close()
+            self.save_cache(file_content)
 
     def delete_cache(self):
         """Deletes the whole cache for this translator."""
-        self.create_cache()
+        if self.translator is None:
+            return
+
+        with self.lock_cache():
+            self.create_cache()
 
     def read_from_cache(self, text):
         """
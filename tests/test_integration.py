@@ -6,6 +6,7 @@ import pytest
 
 from gherkin.compiler import GherkinToPyTestCompiler
 from nlp.tests.utils import MockTranslator
+from settings import Settings
 
 
 @pytest.mark.parametrize(
@@ -49,3 +50,22 @@ def test_input_output_files(input_file_name, output_file_name, mocker):
 
     for i, line in enumerate(output.splitlines()):
         assert line == output_lines[i]
+
+
+@pytest.mark.parametrize('input_file_name', ['0004', '0007', '0009', '0013'])
+def test_scenario_threads_same_output(input_file_name, mocker):
+    """Check that generating the scenarios in multiple threads results in the same suite and warnings."""
+    mocker.patch('deep_translator.DeepL.translate', MockTranslator())
+
+    this_file_path = os.path.abspath(__file__).split('/')
+    folder_path_as_str = '/'.join(this_file_path[:len(this_file_path) - 1])
+    file_name_input = '{}/input/{}.feature'.format(folder_path_as_str, input_file_name)
+
+    outputs = []
+    for threads in [1, 4]:
+        mocker.patch.object(Settings, 'SCENARIO_THREADS', threads)
+        compiler = GherkinToPyTestCompiler()
+        compiler.compile_file(file_name_input)
+        outputs.append((compiler.export_as_text(), compiler.code_generator.get_warnings()))
+
+    assert outputs[0] == outputs[1]
@@ -1,5 +1,7 @@
 from gherkin.compiler import GherkinToPyTestCompiler
-from gherkin.utils import get_sequence_as_lines, get_indent_level_for_next_line
+from gherkin.session import EditorSession
+from gherkin.token import DescriptionToken, DocStringToken
+from gherkin.utils import get_indent_level_for_next_line
 from core.settings import GHERKIN_INDENT_SPACES
 from ui.window import WindowValues
 
@@ -16,11 +18,15 @@ RenderHistory = _RenderHistory()
 
 
 class GherkinEditorRenderer(object):
-    def __init__(self, window, editor):
+    COLOR_TAG_PREFIX = 'token_color_'
+
+    def __init__(self, window, editor, session=None):
         self.window = window
         self.editor = editor
         self.editor_widget = editor.Widget
         self.compiler = GherkinToPyTestCompiler()
+        # the session of the editor tokenizes only the lines that changed
+        self.session = session or EditorSession(self.compiler)
 
         self.editor_widget.bind('<Tab>', self.on_forward_tab)
         self.editor_widget.bind('<Shift-Tab>', self.on_backwards_tab)
@@ -28,8 +34,6 @@ class GherkinEditorRenderer(object):
         self._cursor_x = 0
         self._cursor_y = 0
 
-        self._last_token_classes = []
-
     def get_editor_value(self):
         return WindowValues.get_values()[self.editor.Key]
 
@@ -83,51 +87,143 @@ class GherkinEditorRenderer(object):
     def get_cursor_position(self):
         return self.editor_widget.index('insert').split('.')
 
-    def update_text(self, text):
-        tokens = self.compiler.use_lexer(text)
-        last_tokens = RenderHistory.last_render_meta.get('last_token_classes', [])
-
-        # no need to re-render if all tokens stayed the same
-        if len(tokens) == len(last_tokens) and all([isinstance(t, last_tokens[i]) for i, t in enumerate(tokens)]):
+    @classmethod
+    def get_colors_by_line(cls, tokens, tokens_by_line):
+        """
+        Returns the colors of the tokens of each line. It is the same as `get_meta_data_for_sequence` of the tokens,
+        but the colors of descriptions in doc strings are determined for all tokens at once.
+        """
+        doc_strings = len([token for token in tokens if isinstance(token, DocStringToken)])
+        doc_strings_before = 0
+        colors_by_line = []
+
+        for tokens_in_line in tokens_by_line:
+            colors = []
+
+            for token in tokens_in_line:
+                if isinstance(token, DescriptionToken):
+                    # descriptions are only in a doc string if it is closed
+                    in_doc_string = doc_strings_before % 2 == 1 and doc_strings_before < doc_strings
+                    colors.append(DocStringToken.color if in_doc_string else None)
+                else:
+                    colors.append(token.get_meta_data_for_sequence(tokens).get('color'))
+
+                if isinstance(token, DocStringToken):
+                    doc_strings_before += 1
+
+            colors_by_line.append(colors)
+
+        return colors_by_line
+
+    def update_text(self, text, indent_cursor_line=True):
+        """
+        Highlights the text in the editor. Each line has a fingerprint of its text and the classes and colors of its
+        tokens. Only the lines whose fingerprint changed since the last render are rendered again.
+        """
+        tokens = self.session.update(text)
+        tokens_by_line = self.session.lexer.tokens_by_line
+        text_lines = self.session.text_lines
+        colors_by_line = self.get_colors_by_line(tokens, tokens_by_line)
+
+        fingerprints = [
+            (text_lines[i], tuple(zip([token.__class__ for token in tokens_in_line], colors_by_line[i])))
+            for i, tokens_in_line in enumerate(tokens_by_line)
+        ]
+        last_fingerprints = RenderHistory.last_render_meta.get('line_fingerprints', [])
+
+        # the lines between the ones that stayed the same at the start and at the end changed
+        first_line_index = 0
+        max_unchanged_lines = min(len(fingerprints), len(last_fingerprints))
+        while first_line_index < max_unchanged_lines \
+                and fingerprints[first_line_index] == last_fingerprints[first_line_index]:
+            first_line_index += 1
+
+        unchanged_lines_at_end = 0
+        while unchanged_lines_at_end < max_unchanged_lines - first_line_index \
+                and fingerprints[-unchanged_lines_at_end - 1] == last_fingerprints[-unchanged_lines_at_end - 1]:
+            unchanged_lines_at_end += 1
+
+        last_line_index = len(fingerprints) - unchanged_lines_at_end
+        if first_line_index == last_line_index:
             return
 
         cursor_y, cursor_x = self.get_cursor_position()
-        self.editor.update('')
+        cursor_line_index = int(cursor_y) - 1
 
-        lines = get_sequence_as_lines(tokens)
-        for i, token in enumerate(tokens):
-            # skip the EOF and the last EndOfLine token
-            if i >= len(tokens) - 2:
-                continue
+        # indent the line of the cursor if its first token changed
+        if indent_cursor_line and first_line_index <= cursor_line_index < last_line_index:
+            first_token = tokens_by_line[cursor_line_index][0]
 
-            # # intend
-            token_line_index = token.line.line_index
             try:
-                last_time_class = last_tokens[i]
+                last_first_token_class = last_fingerprints[cursor_line_index][1][0][0]
             except IndexError:
-                last_time_class = None
+                last_first_token_class = None
 
-            token_has_changed = last_time_class != token.__class__
-            first_token_in_line = token == lines[token_line_index][0]
-            token_at_cursor_line = int(cursor_y) - 1 == token.line.line_index
-
-            with_indent = first_token_in_line
-            if token_at_cursor_line and first_token_in_line and token_has_changed:
+            if last_first_token_class != first_token.__class__:
                 indent_lvl = get_indent_level_for_next_line(
                     tokens=tokens,
-                    line_index=token_line_index,
-                    filter_token=token,
+                    line_index=cursor_line_index,
+                    filter_token=first_token,
                 )
-                indent = GHERKIN_INDENT_SPACES * indent_lvl
-                indent_str = ' ' * indent
-
-                if indent_lvl >= 0:
-                    token.line.text = indent_str + token.line.text.lstrip()
-                    token.line.indent = indent
-                    cursor_x = len(token.line.text)
-
-            color = token.get_meta_data_for_sequence(tokens).get('color')
-            self.editor.update(token.to_string(with_indent), text_color_for_value=color, append=True)
-
-        RenderHistory.add_render_information('last_token_classes', [token.__class__ for token in tokens])
+                line_text = text_lines[cursor_line_index]
+                indented_line_text = ' ' * (GHERKIN_INDENT_SPACES * indent_lvl) + line_text.lstrip()
+
+                if indent_lvl >= 0 and indented_line_text != line_text:
+                    lines = text.split('\n')
+                    lines[cursor_line_index] = indented_line_text
+                    self.update_text('\n'.join(lines), indent_cursor_line=False)
+                    self.set_cursor_position(y=cursor_y, x=len(indented_line_text))
+                    return
+
+        self.render_lines(text_lines, tokens_by_line, colors_by_line, first_line_index, last_line_index)
+        RenderHistory.add_render_information('line_fingerprints', fingerprints)
         self.set_cursor_position(y=cursor_y, x=cursor_x)
+
+    def render_lines(self, text_lines, tokens_by_line, colors_by_line, first_line_index, last_line_index):
+        """
+        Renders the lines from `first_line_index` up to (excluding) `last_line_index`. The text of a line is only
+        replaced if it is different in the editor. The tags of the colors are added for all lines at once.
+        """
+        widget = self.editor_widget
+        start = '{}.0'.format(first_line_index + 1)
+        end = '{}.end'.format(last_line_index)
+
+        for tag in widget.tag_names():
+            if tag.startswith(self.COLOR_TAG_PREFIX):
+                widget.tag_remove(tag, start, end)
+
+        editor_lines = widget.get(start, end).split('\n')
+        for line_index in range(first_line_index, last_line_index):
+            try:
+                editor_line = editor_lines[line_index - first_line_index]
+            except IndexError:
+                editor_line = None
+
+            if editor_line != text_lines[line_index]:
+                widget.delete('{}.0'.format(line_index + 1), '{}.end'.format(line_index + 1))
+                widget.insert('{}.0'.format(line_index + 1), text_lines[line_index])
+
+        # Tk can add a tag to many ranges at once
+        ranges_by_tag = {}
+        for line_index in range(first_line_index, last_line_index):
+            line_text = text_lines[line_index]
+            column = len(line_text) - len(line_text.lstrip())
+
+            for token, color in zip(tokens_by_line[line_index], colors_by_line[line_index]):
+                lexeme = str(token)
+                token_column = line_text.find(lexeme, column) if lexeme else -1
+                if token_column < 0:
+                    continue
+
+                column = token_column + len(lexeme)
+                if color is None:
+                    continue
+
+                ranges_by_tag.setdefault(self.COLOR_TAG_PREFIX + color, []).extend([
+                    '{}.{}'.format(line_index + 1, token_column),
+                    '{}.{}'.format(line_index + 1, column),
+                ])
+
+        for tag, ranges in ranges_by_tag.items():
+            widget.tag_configure(tag, foreground=tag[len(self.COLOR_TAG_PREFIX):])
+            widget.tag_add(tag, *ranges)
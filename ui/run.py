@@ -6,13 +6,16 @@ from gherkin.token import CommentToken
 from nlp.setup import Nlp
 from settings import Settings
 from ui.window import WindowValues
+from ui.worker import CompilationWorker
 
 
 def run_ui():
     setup_django(Settings.DJANGO_SETTINGS_PATH, print_warning=True)
     # all imports must follow the setup!!
     from gherkin.compiler import GherkinToPyTestCompiler
+    from gherkin.session import EditorSession
     from ui.autocomplete import AutoCompleteMultiLine
+    from ui.renderer import GherkinEditorRenderer
     from gherkin.utils import get_token_suggestion_after_line, get_sequence_as_lines
 
     Nlp.setup_languages(['de', 'en'])
@@ -50,9 +53,21 @@ def run_ui():
     window = sg.Window('Ghengo - Django-Gherkin Test Generator', layout)
 
     c = GherkinToPyTestCompiler()
+    # only the changed lines are tokenized and parsed again while the text is edited
+    session = EditorSession(c)
     last_gherkin_text = ''
 
+    def generate_tests(text):
+        # the worker uses its own compiler, since the session is only used by the window; the runtime values of the
+        # settings (like the language) are local to the generation, the window changes them while it is running
+        with Settings.runtime_context():
+            compiler = GherkinToPyTestCompiler()
+            return compiler.export_as_text(compiler.compile_text(text))
+
     window.finalize()
+    worker = CompilationWorker(window, generate_tests)
+    # the renderer binds the keys of the editor, so it is only created once
+    editor_renderer = GherkinEditorRenderer(window=window, editor=window['GHERKIN_EDITOR'], session=session)
 
     def on_generate_tests(bound_event=None, input_text=None):
         assert bound_event or input_text
@@ -63,15 +78,29 @@ def run_ui():
 
         if input_text == '\n':
             return
-        window['OUTPUT_FIELD'].update('Loading...')
 
+        # syntax errors are found quickly, so only valid documents are generated in the background
         try:
-            c.compile_text(input_text)
+            session.update(input_text)
+            session.parse()
         except GherkinInvalid as e:
+            worker.cancel()
             window['ERROR_MESSAGE'].update(str(e))
             return
 
-        window['OUTPUT_FIELD'].update(c.export_as_text())
+        window['OUTPUT_FIELD'].update('Loading...')
+        worker.request(input_text)
+
+    def on_tests_generated(request_id, output, error):
+        # a newer request was made in the meantime
+        if not worker.is_current(request_id):
+            return
+
+        if error is not None:
+            window['OUTPUT_FIELD'].update('')
+            window['ERROR_MESSAGE'].update(error)
+        else:
+            window['OUTPUT_FIELD'].update(output)
 
     window['GHERKIN_EDITOR'].Widget.bind('<Command-g>', on_generate_tests)
     window['GHERKIN_EDITOR'].Widget.bind('<Control-g>', on_generate_tests)
@@ -86,6 +115,10 @@ def run_ui():
         if event == sg.WIN_CLOSED or event == 'Cancel':  # if user closes window or clicks cancel
             break
 
+        if event == CompilationWorker.RESULT_EVENT:
+            on_tests_generated(*values[event])
+            continue
+
         text = values['GHERKIN_EDITOR']
 
         gherkin_text = text.replace(' ', '')
@@ -95,10 +128,12 @@ def run_ui():
 
         last_gherkin_text = gherkin_text
 
-        tokens = c.use_lexer(text)
+        try:
+            tokens = session.update(text)
+        except GherkinInvalid as e:
+            window['ERROR_MESSAGE'].update(str(e))
+            continue
 
-        from ui.renderer import GherkinEditorRenderer
-        editor_renderer = GherkinEditorRenderer(window=window, editor=window['GHERKIN_EDITOR'])
         editor_renderer.update_text(text)
 
         lines = get_sequence_as_lines(tokens)
@@ -145,4 +180,5 @@ def run_ui():
 
         on_generate_tests(input_text=text)
 
+    worker.stop()
     window.close()
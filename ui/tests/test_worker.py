@@ -0,0 +1,99 @@
+import threading
+import time
+
+from gherkin.exception import GherkinInvalid
+from ui.worker import CompilationWorker
+
+
+class FakeWindow(object):
+    """Records the events that are written to the window."""
+    def __init__(self):
+        self.events = []
+        self.event_written = threading.Event()
+
+    def write_event_value(self, key, value):
+        self.events.append((key, value))
+        self.event_written.set()
+
+    def wait_for_event(self, timeout=2):
+        assert self.event_written.wait(timeout)
+        self.event_written.clear()
+
+
+def test_compilation_worker_debounce():
+    """Check that only the last of many requests in a short time is compiled."""
+    window = FakeWindow()
+    compiled_texts = []
+    worker = CompilationWorker(window, lambda text: compiled_texts.append(text) or text.upper(), delay=0.05)
+
+    for text in ['a', 'b', 'c']:
+        request_id = worker.request(text)
+    window.wait_for_event()
+    worker.stop()
+
+    assert compiled_texts == ['c']
+    assert window.events == [(CompilationWorker.RESULT_EVENT, (request_id, 'C', None))]
+
+
+def test_compilation_worker_stale_result():
+    """Check that the result of a compilation is dropped if a new request was made while it was running."""
+    window = FakeWindow()
+    started = threading.Event()
+    release = threading.Event()
+
+    def compile_text(text):
+        if text == 'a':
+            started.set()
+            release.wait(2)
+        return text.upper()
+
+    worker = CompilationWorker(window, compile_text, delay=0)
+    worker.request('a')
+    assert started.wait(2)
+    request_id = worker.request('b')
+    release.set()
+    window.wait_for_event()
+    worker.stop()
+
+    assert window.events == [(CompilationWorker.RESULT_EVENT, (request_id, 'B', None))]
+
+
+def test_compilation_worker_cancel():
+    """Check that a canceled request is not compiled."""
+    window = FakeWindow()
+    compiled_texts = []
+    worker = CompilationWorker(window, compiled_texts.append, delay=0.05)
+
+    worker.request('a')
+    worker.cancel()
+    time.sleep(0.15)
+    worker.stop()
+
+    assert compiled_texts == []
+    assert window.events == []
+
+
+def test_compilation_worker_error():
+    """Check that errors of the compilation are posted as a message and that the worker keeps running."""
+    window = FakeWindow()
+
+    def compile_text(text):
+        if text == 'invalid':
+            raise GherkinInvalid('Invalid Gherkin', non_terminal=None, suggested_tokens=[])
+        if text == 'error':
+            raise ValueError('broken')
+        return text
+
+    worker = CompilationWorker(window, compile_text, delay=0)
+
+    expected_results = [
+        ('invalid', None, 'Invalid Gherkin'),
+        ('error', None, 'ValueError: broken'),
+        ('valid', 'valid', None),
+    ]
+    for text, output, error in expected_results:
+        request_id = worker.request(text)
+        window.wait_for_event()
+        assert window.events[-1] == (CompilationWorker.RESULT_EVENT, (request_id, output, error))
+
+    worker.stop()
@@ -0,0 +1,96 @@
+import threading
+import time
+
+from gherkin.exception import GherkinInvalid
+
+
+class CompilationWorker(object):
+    """
+    Generates the tests of a Gherkin text in a background thread, so that the window stays responsive while NLP is
+    running. The result is posted back to the window as an event (see `RESULT_EVENT`).
+
+    Requests are debounced: a text is only compiled after no other request came in for `delay` seconds. A request
+    that was not started yet is replaced by a newer one and the results of outdated requests are dropped. A
+    compilation that already runs cannot be interrupted, but the newest request is started right after it.
+    """
+    RESULT_EVENT = '-COMPILATION-RESULT-'
+
+    def __init__(self, window, compile_text, delay=0.3):
+        self.window = window
+        # a callable that gets the text and returns the generated tests as text
+        self.compile_text = compile_text
+        self.delay = delay
+
+        self._condition = threading.Condition()
+        self._request_id = 0
+        self._requested_text = None
+        self._requested_at = 0
+        self._stopped = False
+
+        self._thread = threading.Thread(target=self._run, name='CompilationWorker', daemon=True)
+        self._thread.start()
+
+    def request(self, text):
+        """Requests the compilation of a text. Returns the id of the request."""
+        with self._condition:
+            self._request_id += 1
+            self._requested_text = text
+            self._requested_at = time.monotonic()
+            self._condition.notify()
+
+            return self._request_id
+
+    def cancel(self):
+        """Cancels every request that was made until now. A running compilation will not post its result."""
+        with self._condition:
+            self._request_id += 1
+            self._requested_text = None
+
+    def is_current(self, request_id):
+        """Checks if the request with the given id is the last one that was made."""
+        return request_id == self._request_id
+
+    def stop(self):
+        """Stops the worker after the current compilation."""
+        with self._condition:
+            self._stopped = True
+            self._condition.notify()
+
+    def _wait_for_request(self):
+        """Waits until the last request is old enough to be compiled. Returns None if the worker was stopped."""
+        with self._condition:
+            while not self._stopped:
+                if self._requested_text is None:
+                    self._condition.wait()
+                    continue
+
+                remaining_delay = self._requested_at + self.delay - time.monotonic()
+                if remaining_delay > 0:
+                    self._condition.wait(remaining_delay)
+                    continue
+
+                text = self._requested_text
+                self._requested_text = None
+                return self._request_id, text
+
+            return None
+
+    def _run(self):
+        while True:
+            request = self._wait_for_request()
+            if request is None:
+                return
+
+            request_id, text = request
+            output, error = None, None
+
+            try:
+                output = self.compile_text(text)
+            except GherkinInvalid as e:
+                error = str(e)
+            except Exception as e:
+                # the worker must survive anything that goes wrong in the generation
+                error = '{}: {}'.format(e.__class__.__name__, e)
+
+            if self.is_current(request_id):
+                self.window.write_event_value(self.RESULT_EVENT, (request_id, output, error))